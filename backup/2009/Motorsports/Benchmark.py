@@ -0,0 +1,375 @@
+import argparse
+import importlib.util
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Throughput of the simulation hot paths at several field sizes and schedule lengths.
+# Bigger fields are cloned from the series roster and longer schedules repeat its rounds, so the benchmark
+# runs against any series script in this directory. Everything it writes goes to a temporary directory.
+
+def load_race_module(script_directory, series_name):
+    module_path = os.path.join(script_directory, f"{series_name}.py")
+
+    if not os.path.exists(module_path):
+        raise FileNotFoundError(f"Series script not found: {module_path}")
+
+    spec = importlib.util.spec_from_file_location("race", module_path)
+    race_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(race_module)
+    return race_module
+
+def build_field(series, car_count):
+    # car_count drivers cloned from the roster in entry order, every pass past the first gets numbered copies
+    roster = [(team, driver) for team in series["teams"].values() for driver in team.drivers]
+
+    teams = {}
+    for i in range(car_count):
+        team, driver = roster[i % len(roster)]
+        copy_number = i // len(roster)
+        suffix = f" {copy_number + 1}" if copy_number else ""
+
+        team_name = team.name + suffix
+        if team_name not in teams:
+            teams[team_name] = team.clone([])
+            teams[team_name].name = team_name
+
+        driver = driver.clone()
+        driver.name += suffix
+        driver.team_name = team_name
+        teams[team_name].add_driver(driver)
+
+    return teams
+
+def build_schedule(series, round_count, car_count):
+    # The series schedule repeated to round_count rounds, with a grid big enough for the whole field
+    order_width = max(2, len(str(round_count)))
+    schedule = []
+    for i in range(round_count):
+        race = dict(series["sorted_schedule"][i % len(series["sorted_schedule"])])
+        race["Order"] = f"{i + 1:0{order_width}d}"
+        race["Grid Size"] = str(car_count)
+        schedule.append(race)
+
+    return schedule
+
+def build_round_results(teams, rng):
+    # A shuffled round in the shape simulate_round returns, so build_race_results_data writes a real results file
+    entries = [(team, driver) for team in teams.values() for driver in team.drivers]
+    qualifying = rng.sample(entries, len(entries))
+    race = rng.sample(entries, len(entries))
+    dnf_count = rng.randint(0, max(1, len(race) // 8))
+    finishers, retirements = race[:len(race) - dnf_count], race[len(race) - dnf_count:]
+
+    return {
+        "weather_condition": "Clear",
+        "sorted_qualifying_results": [((team.name, driver.name), (driver, len(qualifying) - i)) for i, (team, driver) in enumerate(qualifying)],
+        "dnq_results": [],
+        "sorted_race_results": [(team.name, driver.name, len(finishers) - i) for i, (team, driver) in enumerate(finishers)],
+        "finished_drivers": [(team.name, driver.name, len(finishers) - i, team.supplier, team.color) for i, (team, driver) in enumerate(finishers)],
+        "dnf_drivers": [(team.name, driver.name, rng.choice(["Crash", "Collision", "Retirement"]), team.supplier, team.color) for team, driver in retirements],
+        "fastest_lap_driver": finishers[0][1].name,
+        "fastest_lap_time": "1:20.00",
+        "most_laps_led_driver": finishers[0][1].name,
+        "most_laps_led_count": 20,
+        "formatted_qualifying_lap_times": [(driver.name, f"1:{20 + i * 0.1:05.2f}") for i, (team, driver) in enumerate(qualifying)],
+        "formatted_race_times": [f"{85 + i}:00.00" for i in range(len(finishers))]
+    }
+
+def prepare_race(race_module, series, race, engine, rng):
+    # The state simulate_round has when its iteration loop starts, for timing single iterations
+    teams = series["teams"]
+    track_flags = race_module.flag_mask(race['Characteristics'].split('|'))
+    total_laps = float(race['Laps'])
+    base_time = float(race['Base Time'])
+
+    registry = race_module.build_driver_registry(teams)
+    for team, driver in registry.values():
+        driver.reset_race_state()
+
+    sorted_qualifying_results, dnq_results, effective_stats = race_module.simulate_grid_qualifying(
+        teams, "Clear", series["discipline"], race['Event'], int(race['Grid Size']), race['Type'], None, race['Speed'],
+        race['Characteristics'].split('|'), series["sorted_schedule"], race, series["practice_sessions"], float(race['Difficulty']), rng)
+    qualifying_results = dict(sorted_qualifying_results + dnq_results)
+
+    race_stats = {}
+    for i, ((team_name, driver_name), (driver, _)) in enumerate(sorted_qualifying_results):
+        race_stats[(team_name, driver_name)] = race_module.calculate_race_stats(driver, effective_stats[(team_name, driver_name)], i + 1, qualifying_results, track_flags, rng)
+
+    iterations = int((total_laps * base_time) / 750)
+
+    field = None
+    if engine == "numpy":
+        import numpy as np
+
+        field = race_module.RaceField([key for key, _ in sorted_qualifying_results], registry, race_stats, len(qualifying_results), "Clear", series["discipline"], race['Type'], track_flags, iterations, np.random.default_rng(rng.getrandbits(64)))
+
+    return {
+        "teams": teams,
+        "registry": registry,
+        "qualifying_results": qualifying_results,
+        "race_stats": race_stats,
+        "track_flags": track_flags,
+        "iterations": iterations,
+        "field": field,
+        "start_order": [(team_name, driver_name, 1) for (team_name, driver_name), _ in sorted_qualifying_results]
+    }
+
+def measure(operation, min_time):
+    # Repeats the operation for at least min_time seconds, then runs it once more under tracemalloc for its peak
+    operation()  # Warm up caches and lazy imports
+
+    count = 0
+    start = time.perf_counter()
+    while True:
+        operation()
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return count / elapsed, peak
+
+def run_benchmarks(script_directory, series_name, car_counts, round_counts, engines, min_time=0.2, seed=1):
+    race_module = load_race_module(script_directory, series_name)
+    championship = race_module.load_championship_module(script_directory, series_name)
+    rng = random.Random(seed)
+    series = race_module.load_series(script_directory, series_name, rng)
+    discipline = series["discipline"]
+
+    work_directory = tempfile.mkdtemp(prefix="benchmark-")
+    os.makedirs(os.path.join(work_directory, "Championships", "Logs"))
+
+    results = []
+
+    def record(name, car_count, round_count, engine, operation):
+        ops_per_second, peak = measure(operation, min_time)
+        results.append({"Benchmark": name, "Cars": car_count, "Rounds": round_count, "Engine": engine, "Ops/sec": ops_per_second, "Peak KiB": peak / 1024})
+        print(f"{name:<18} | {car_count:>4} | {round_count if round_count else '-':>6} | {engine or '-':<6} | {ops_per_second:>12,.1f} | {peak / 1024:>10,.1f}")
+
+    print(f"{'Benchmark':<18} | {'Cars':>4} | {'Rounds':>6} | {'Engine':<6} | {'Ops/sec':>12} | {'Peak KiB':>10}\n")
+
+    try:
+        for car_count in car_counts:
+            teams = build_field(series, car_count)
+            schedule = build_schedule(series, max(round_counts), car_count)
+            field_series = dict(series, teams=teams, sorted_schedule=schedule)
+            race = schedule[0]
+
+            # One qualifying session, every entrant runs simulate_qualifying once
+            record("qualifying", car_count, None, None, lambda: race_module.simulate_grid_qualifying(
+                teams, "Clear", discipline, race['Event'], car_count, race['Type'], None, race['Speed'], race['Characteristics'].split('|'),
+                schedule, race, series["practice_sessions"], float(race['Difficulty']), rng))
+
+            # A single race iteration from the grid, halfway through the race
+            for engine in engines:
+                if engine == "laps":
+                    continue  # Steps once per lap, the pipeline below times it
+
+                state = prepare_race(race_module, field_series, race, engine, rng)
+
+                def race_iteration(state=state):
+                    field = state["field"]
+                    if field is not None:
+                        field.order[:] = range(len(field.order))
+                        field.running[:] = True
+                        field.dnf[:] = 0
+                        field.simulate_iteration(state["iterations"] // 2)
+                        return
+                    for team, driver in state["registry"].values():
+                        driver.dnf = ""
+                    race_module.simulate_race_iteration(state["start_order"], state["teams"], state["registry"], state["qualifying_results"], state["race_stats"],
+                                                        "Clear", discipline, race['Type'], state["track_flags"], state["iterations"] // 2, state["iterations"], rng)
+
+                record("race iteration", car_count, None, engine, race_iteration)
+
+            # The race pipeline of main() with presentation off: standings lookup, the round and its results file
+            for engine in engines:
+                record("race pipeline", car_count, None, engine, lambda engine=engine: race_module.run_race(work_directory, field_series, race, teams, rng, present=False, engine=engine))
+
+            # Championship side, on results files written for the whole schedule
+            for round_count in round_counts:
+                results_dir = os.path.join(work_directory, f"Races {car_count} {round_count}")
+                os.makedirs(results_dir)
+
+                season = []
+                for season_race in schedule[:round_count]:
+                    race_results_data = race_module.build_race_results_data(field_series, season_race, teams, build_round_results(teams, rng))
+                    season.append(race_results_data)
+                    with open(os.path.join(results_dir, f"{series_name} - {season_race['Order']} - {season_race['Circuit']}.json"), 'w') as json_file:
+                        json.dump(race_results_data, json_file)
+
+                def apply_season():
+                    standings = {}
+                    finishes = {}
+                    round_points = []
+                    for i, race_results_data in enumerate(season):
+                        championship.apply_points(series_name, list(race_results_data["Race Results"]), race_results_data["Qualifying Results"], race_results_data["DNF Drivers"],
+                                                  race_results_data["DNQ Drivers"], race_results_data["Fastest Lap"], race_results_data["Most Laps Led"], discipline,
+                                                  standings, finishes, round_points)
+                        championship.reset_for_playoffs(standings, i, series_name)
+                    return standings, finishes
+
+                record("apply_points", car_count, round_count, None, apply_season)
+
+                record("load_results", car_count, round_count, None, lambda results_dir=results_dir: championship.load_results(results_dir, series_name))
+
+                standings, finishes = apply_season()
+                record("standings sort", car_count, round_count, None, lambda standings=standings, finishes=finishes: championship.sort_standings(standings, finishes))
+    finally:
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+    return results
+
+def run_monte_carlo_scaling(script_directory, series_name, seasons, worker_counts, seed=1, engine="scalar"):
+    # Wall time of the series script's --monte-carlo over the same seed range for each worker count, run on a copy of
+    # this directory so the Monte Carlo summary and results store it writes never replace the real ones.
+    # Also projects each count's speedup from the serial part of the run (start-up, plus the parent merging and
+    # storing batches, which the script reports), so a machine with fewer cores than workers still shows the
+    # expected scaling and a bigger one can check it against the measured speedup.
+    work_directory = tempfile.mkdtemp(prefix="benchmark-")
+    results = []
+    try:
+        copy_directory = os.path.join(work_directory, "Motorsports")
+        shutil.copytree(script_directory, copy_directory, ignore=shutil.ignore_patterns("Logs", "Races", "*.bundle.pickle", "__pycache__"))
+        os.makedirs(os.path.join(copy_directory, "Championships", "Logs"))
+        summary_path = os.path.join(copy_directory, "Championships", "Logs", f"{series_name} - Monte Carlo.json")
+
+        def run(season_count, workers):
+            command = [sys.executable, os.path.join(copy_directory, f"{series_name}.py"), "--monte-carlo", str(season_count),
+                       "--workers", str(workers), "--seed", str(seed), "--engine", engine]
+            start = time.perf_counter()
+            output = subprocess.run(command, check=True, stdout=subprocess.PIPE, text=True).stdout
+            elapsed = time.perf_counter() - start
+            parent_time = float(re.search(r"Parent time merging and storing: ([0-9.]+)s", output).group(1))
+            return elapsed, parent_time
+
+        # Start-up is a one season run less that season's share of a full one-worker run
+        single_time, _ = run(1, 1)
+        full_time, full_parent_time = run(seasons, 1)
+        per_season = (full_time - single_time) / max(1, seasons - 1)
+        serial_time = max(0.0, single_time - per_season) + full_parent_time
+
+        print(f"Monte Carlo scaling, {seasons} seasons, seed {seed}, {os.cpu_count()} CPU(s)")
+        print(f"Serial part: {serial_time - full_parent_time:.2f}s start-up + {full_parent_time:.2f}s merging and storing = {serial_time / full_time:.1%} of one worker's {full_time:.2f}s")
+        if os.cpu_count() < max(worker_counts):
+            print(f"Only {os.cpu_count()} CPU(s), measured speedup is capped there, compare Projected on a machine with more cores")
+        print(f"\n{'Workers':>7} | {'Seconds':>8} | {'Speedup':>7} | {'Efficiency':>10} | {'Projected':>9} | {'Same results':<12}\n")
+
+        baseline_results = None
+        for workers in worker_counts:
+            elapsed, parent_time = run(seasons, workers)
+
+            with open(summary_path) as json_file:
+                summary_results = json.load(json_file)["Results"]
+            if baseline_results is None:
+                baseline_results = summary_results
+
+            # Speedup against the one worker run, projected by Amdahl's law from its serial part
+            speedup = full_time / elapsed
+            projected = full_time / (serial_time + (full_time - serial_time) / workers)
+            results.append({"Workers": workers, "Seconds": elapsed, "Speedup": speedup, "Efficiency": speedup / workers, "Projected": projected,
+                            "Parent Seconds": parent_time, "Same Results": summary_results == baseline_results})
+            print(f"{workers:>7} | {elapsed:>8.2f} | {speedup:>6.2f}x | {speedup / workers:>10.0%} | {projected:>8.2f}x | {str(summary_results == baseline_results):<12}")
+    finally:
+        shutil.rmtree(work_directory, ignore_errors=True)
+
+    return results
+
+def run_engine_equivalence(script_directory, series_name, races, engines, seed=1):
+    # The same seeded rounds of the series roster with each engine, to check that the faster engines tell the same
+    # story: DNFs per race by cause (with the standard error of the mean), the most frequent winner and how much
+    # the order moves from the grid. Rounds cycle through the schedule without standings, nothing is written.
+    race_module = load_race_module(script_directory, series_name)
+    series = race_module.load_series(script_directory, series_name, random.Random(seed))
+    schedule = series["sorted_schedule"]
+    results = []
+
+    print(f"Engine equivalence, {races} races, seed {seed}\n")
+    print(f"{'Engine':<6} | {'Races/sec':>9} | {'DNFs':>12} | {'Crash':>5} | {'Retirement':>10} | {'Collision':>12} | {'Winner':<24} | {'Wins':>5} | {'Moved':>5}\n")
+
+    for engine in engines:
+        rng = random.Random(seed)
+        dnf_counts = []
+        cause_counts = {"Crash": [], "Retirement": [], "Collision": []}
+        winners = {}
+        moved = 0
+
+        start = time.perf_counter()
+        for i in range(races):
+            round_results = race_module.simulate_round(series, schedule[i % len(schedule)], series["teams"], None, rng, engine)
+
+            causes = [cause for _, _, cause, _, _ in round_results["dnf_drivers"]]
+            dnf_counts.append(len(causes))
+            for cause, counts in cause_counts.items():
+                counts.append(causes.count(cause))
+
+            winner = round_results["sorted_race_results"][0][1]
+            winners[winner] = winners.get(winner, 0) + 1
+
+            grid = [key for key, _ in round_results["sorted_qualifying_results"]]
+            finish = [(team_name, driver_name) for team_name, driver_name, _ in round_results["sorted_race_results"]]
+            moved += sum(abs(grid.index(key) - position) for position, key in enumerate(finish)) / len(finish)
+        elapsed = time.perf_counter() - start
+
+        def mean_and_error(counts):
+            mean = sum(counts) / len(counts)
+            variance = sum((count - mean) ** 2 for count in counts) / max(1, len(counts) - 1)
+            return mean, (variance / len(counts)) ** 0.5
+
+        dnfs, dnf_error = mean_and_error(dnf_counts)
+        collisions, collision_error = mean_and_error(cause_counts["Collision"])
+        top_winner = max(winners, key=winners.get)
+        row = {"Engine": engine, "Races/sec": races / elapsed, "DNFs": dnfs, "DNFs Error": dnf_error,
+               "Crash": sum(cause_counts["Crash"]) / races, "Retirement": sum(cause_counts["Retirement"]) / races,
+               "Collision": collisions, "Collision Error": collision_error, "Winner": top_winner,
+               "Win Share": winners[top_winner] / races, "Moved": moved / races}
+        results.append(row)
+        print(f"{engine:<6} | {row['Races/sec']:>9.1f} | {dnfs:>5.2f} ± {dnf_error:<4.2f} | {row['Crash']:>5.2f} | {row['Retirement']:>10.2f} | "
+              f"{collisions:>5.2f} ± {collision_error:<4.2f} | {top_winner[:24]:<24} | {row['Win Share']:>5.0%} | {row['Moved']:>5.2f}")
+
+    return results
+
+def main(series_name, car_counts, round_counts, engines, min_time=0.2, seed=1, output=None, monte_carlo=0, workers=(1, 2, 4), equivalence=0):
+    script_directory = os.path.dirname(os.path.abspath(__file__))
+
+    if equivalence:
+        results = run_engine_equivalence(script_directory, series_name, equivalence, engines, seed)
+    elif monte_carlo:
+        results = run_monte_carlo_scaling(script_directory, series_name, monte_carlo, workers, seed, engines[0])
+    else:
+        results = run_benchmarks(script_directory, series_name, car_counts, round_counts, engines, min_time, seed)
+
+    # Saved results can be compared between runs to track performance work
+    if output:
+        with open(output, 'w') as json_file:
+            json.dump(results, json_file, indent=4)
+        print(f"\nBenchmark results saved to {output}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the qualifying, race and championship hot paths at several field sizes and schedule lengths.")
+    parser.add_argument("--series", default="Formula One World Championship", help="series script in this directory to benchmark")
+    parser.add_argument("--cars", type=int, nargs="+", default=[20, 26, 43, 100], help="field sizes (default: 20 26 43 100)")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[17, 36, 100], help="schedule lengths for the championship benchmarks (default: 17 36 100)")
+    parser.add_argument("--engines", nargs="+", default=["scalar", "numpy", "laps"], choices=["scalar", "numpy", "laps"], help="race engines to time (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds each benchmark repeats for (default: 0.2)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the roster colours and the simulated rounds")
+    parser.add_argument("--output", help="also save the results to this JSON file")
+    parser.add_argument("--monte-carlo", type=int, default=0, metavar="SEASONS", help="instead, time --monte-carlo over this many seasons for each --workers count (first --engines entry)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="worker counts for --monte-carlo (default: 1 2 4)")
+    parser.add_argument("--equivalence", type=int, default=0, metavar="RACES", help="instead, compare DNFs, winners and movement over this many seeded races per --engines entry")
+    args = parser.parse_args()
+
+    main(args.series, args.cars, args.rounds, args.engines, args.min_time, args.seed, args.output, args.monte_carlo, args.workers, args.equivalence)
@@ -1,11 +1,79 @@
 import os
 import json
-import matplotlib.pyplot as plt
-import numpy as np
-import seaborn as sns
-import matplotlib.colors as mcolors
 import csv
-import mplcursors
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+# Plotting modules, only imported once a plot is drawn so standings updates start without them
+plt = None
+np = None
+sns = None
+mcolors = None
+mplcursors = None
+
+def load_plotting_modules(headless=False):
+    global plt, np, sns, mcolors, mplcursors
+    if plt is not None:
+        return
+
+    # Agg renders straight to files, without a display
+    if headless:
+        import matplotlib
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot
+    import matplotlib.colors
+    import numpy
+    import seaborn
+    import mplcursors as cursors
+
+    plt = matplotlib.pyplot
+    np = numpy
+    sns = seaborn
+    mcolors = matplotlib.colors
+    mplcursors = cursors
+
+# Set while exporting figures: {"directory": ..., "prefix": ..., "formats": [...]}, plots are saved there instead of shown
+figure_export = None
+
+def finish_figure(figure_name):
+    if figure_export is None:
+        plt.show()  # Display the plot
+        return
+
+    # Save the plot once per format and free it, nothing is shown
+    for file_format in figure_export["formats"]:
+        plt.savefig(os.path.join(figure_export["directory"], f"{figure_export['prefix']} - {figure_name}.{file_format}"))
+    plt.close()
+
+def add_line_cursor(lines, line_colors):
+    # Interactive highlighting using mplcursors, only for plots shown on screen
+    if figure_export is not None:
+        return
+
+    cursor = mplcursors.cursor(highlight=True)
+    plt.gcf().line_cursor = cursor  # Keeps the cursor alive as long as its figure
+
+    # Customize the tooltips to show the driver's name and bolden the line on click
+    @cursor.connect("add")
+    def on_add(sel):
+        for line, label in lines:
+            if sel.artist == line:
+                sel.annotation.set_text(f"Driver: {label}")
+                sel.annotation.get_bbox_patch().set_facecolor("yellow")  # Highlight tooltip background
+                sel.annotation.get_bbox_patch().set_alpha(0.8)
+                line.set_linewidth(4)
+                line.set_color("yellow")
+                line.set_zorder(10)  # Bring to front
+
+    @cursor.connect("remove")
+    def on_remove(sel):
+        for line, label in lines:
+            if sel.artist == line:
+                line.set_linewidth(2)
+                # Restore original color from palette
+                line.set_color(line_colors[label])
+                line.set_zorder(1)
 
 # Define points systems
 points_systems = {
@@ -81,7 +149,13 @@ series_playoff_config = {
 # Initialize standings
 standings = {}
 
-def apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data, discipline):
+# Finishing position counts per driver (index 0 counts wins), kept alongside the standings for tiebreaks
+finishes = {}
+
+# Points scored in each applied round as {driver: [race points, bonus points]}, one entry per apply_points call
+round_points = []
+
+def apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data, discipline, standings=standings, finishes=finishes, round_points=round_points):
     points_system = points_systems.get(series_name, points_systems["Other Series"])
     points = points_system.get("points", [])
     pole_position_points = points_system.get("pole_position", 0)
@@ -122,11 +196,22 @@ def apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq
             else:
                 standings[driver] = {"Points": 0, "Wins": 0, "Podiums": 0, "Poles": 0, "DNFs": 0, "Races": 0}
 
+    # This round's race and bonus points per driver, None skips keeping them
+    scored = {}
+    if round_points is not None:
+        round_points.append(scored)
+
+    def add_points(driver, race_points, bonus_points):
+        standings[driver]["Points"] += race_points + bonus_points
+        driver_scored = scored.setdefault(driver, [0, 0])
+        driver_scored[0] += race_points
+        driver_scored[1] += bonus_points
+
     # Process qualifying results for pole position
     if qualifying_results:
         pole_position_driver = qualifying_results[0].get("Driver")
         if pole_position_driver:
-            standings[pole_position_driver]["Points"] += pole_position_points
+            add_points(pole_position_driver, 0, pole_position_points)
             standings[pole_position_driver]["Poles"] += 1
 
     # Append DNF drivers to race results and assign them positions
@@ -143,7 +228,14 @@ def apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq
         position = i + 1
         result_points = points[position - 1] if position - 1 < len(points) else 0
 
-        standings[driver]["Points"] += result_points
+        add_points(driver, result_points, 0)
+
+        # Count the finish for the countback tiebreak
+        counts = finishes.setdefault(driver, [])
+        if len(counts) < position:
+            counts.extend([0] * (position - len(counts)))
+        counts[position - 1] += 1
+
         if position == 1:
             standings[driver]["Wins"] += 1
         if discipline == "StockCar":
@@ -165,13 +257,29 @@ def apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq
     if fastest_lap_data:
         fastest_lap_driver = fastest_lap_data.get("Driver")
         if fastest_lap_driver:
-            standings[fastest_lap_driver]["Points"] += fastest_lap_points
+            add_points(fastest_lap_driver, 0, fastest_lap_points)
 
     # Award points for most laps led
     if most_laps_led_data:
         most_laps_led_driver = most_laps_led_data.get("Driver")
         if most_laps_led_driver:
-            standings[most_laps_led_driver]["Points"] += most_laps_led_points
+            add_points(most_laps_led_driver, 0, most_laps_led_points)
+
+def build_points_matrix(drivers, round_points):
+    # (driver x round) arrays of race points and bonus points, rows in the order of drivers
+    import numpy as np
+
+    rows = {driver: row for row, driver in enumerate(drivers)}
+    race_points = np.zeros((len(drivers), len(round_points)), dtype=int)
+    bonus_points = np.zeros((len(drivers), len(round_points)), dtype=int)
+
+    for column, scored in enumerate(round_points):
+        for driver, (driver_race_points, driver_bonus_points) in scored.items():
+            if driver in rows:
+                race_points[rows[driver], column] = driver_race_points
+                bonus_points[rows[driver], column] = driver_bonus_points
+
+    return race_points, bonus_points
 
 def calculate_team_points(standings, team_names):
     team_stats = {}
@@ -224,7 +332,16 @@ def reset_for_playoffs(standings, race_index, series_name):
     
     return standings
 
-def load_results(results_dir, series_name):
+def list_race_files(results_dir, series_name):
+    # Race files of the series in round order ("Series Name - Order - Circuit.json"), without the metrics records next to them
+    return [filename for filename in sorted(os.listdir(results_dir)) if filename.endswith(".json") and not filename.endswith(".metrics.json") and filename.split(" - ")[0] == series_name]
+
+def load_results(results_dir, series_name, filenames=None):
+    # Loads every race file of the series unless a list of files is given
+    if filenames is None:
+        filenames = list_race_files(results_dir, series_name)
+
+    orders = []
     race_results_list = []
     qualifying_results_list = []
     dnf_drivers_list = []
@@ -232,32 +349,185 @@ def load_results(results_dir, series_name):
     fastest_lap_data_list = []
     most_laps_led_data_list = []
 
-    # Iterate through each file in the directory
-    for filename in os.listdir(results_dir):
-        if filename.endswith(".json") and filename.split(" - ")[0] == series_name:
-            try:
-                with open(os.path.join(results_dir, filename), 'r') as json_file:
-                    results = json.load(json_file)
-                    order = results.get("Order")
-                    race_results = results.get("Race Results")
-                    qualifying_results = results.get("Qualifying Results")
-                    dnf_drivers = results.get("DNF Drivers")
-                    dnq_drivers = results.get("DNQ Drivers")
-                    fastest_lap_data = results.get("Fastest Lap")
-                    most_laps_led_data = results.get("Most Laps Led")
-
-                    # Append each set of results to respective lists
-                    race_results_list.append(race_results)
-                    qualifying_results_list.append(qualifying_results)
-                    dnf_drivers_list.append(dnf_drivers)
-                    dnq_drivers_list.append(dnq_drivers)
-                    fastest_lap_data_list.append(fastest_lap_data)
-                    most_laps_led_data_list.append(most_laps_led_data)
-
-            except Exception as e:
-                print(f"Error processing file '{os.path.join(results_dir, filename)}': {e}")
-
-    return order, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list
+    # Iterate through each file, in round order
+    for filename in filenames:
+        try:
+            with open(os.path.join(results_dir, filename), 'r') as json_file:
+                results = json.load(json_file)
+                order = results.get("Order")
+                race_results = results.get("Race Results")
+                qualifying_results = results.get("Qualifying Results")
+                dnf_drivers = results.get("DNF Drivers")
+                dnq_drivers = results.get("DNQ Drivers")
+                fastest_lap_data = results.get("Fastest Lap")
+                most_laps_led_data = results.get("Most Laps Led")
+
+                # Append each set of results to respective lists
+                orders.append(order)
+                race_results_list.append(race_results)
+                qualifying_results_list.append(qualifying_results)
+                dnf_drivers_list.append(dnf_drivers)
+                dnq_drivers_list.append(dnq_drivers)
+                fastest_lap_data_list.append(fastest_lap_data)
+                most_laps_led_data_list.append(most_laps_led_data)
+
+        except Exception as e:
+            print(f"Error processing file '{os.path.join(results_dir, filename)}': {e}")
+
+    return orders, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list
+
+# Columnar results store: one fixed-size record per (season, round, driver) appended to a .bin file that
+# np.memmap can open directly, with the name tables and the row count of every round in a small index file
+results_store_dtype = [
+    ("season", "i4"),     # 0 for the saved championship, the season number for Monte Carlo runs
+    ("round", "i2"),
+    ("driver", "i4"),     # Index into the index file's "Driver" names
+    ("team", "i4"),       # Index into "Team"
+    ("supplier", "i4"),   # Index into "Supplier"
+    ("grid", "i2"),       # Qualifying position
+    ("finish", "i2"),     # Classified position, DNFs after the finishers, 0 for a DNQ
+    ("status", "i1"),     # Index into "Status": Finished, DNQ or the DNF reason
+    ("points", "i4"),     # Race and bonus points scored in the round
+    ("time_ms", "i8")     # Race time, -1 when there is none
+]
+results_store_names = ["Driver", "Team", "Supplier", "Status"]
+
+def parse_time_ms(time_text):
+    # "m:ss.xx" (or "h:mm:ss.xx") to milliseconds, -1 for anything else
+    try:
+        total = 0.0
+        for part in time_text.split(":"):
+            total = total * 60 + float(part)
+        return int(round(total * 1000))
+    except (AttributeError, ValueError):
+        return -1
+
+def build_results_rows(series_name, season, round_number, race_results, qualifying_results, dnq_drivers, fastest_lap_data, most_laps_led_data):
+    # Store rows of one round, with names still as strings. race_results must already hold the DNF
+    # drivers, as apply_points leaves it.
+    points_system = points_systems.get(series_name, points_systems["Other Series"])
+    points = points_system.get("points", [])
+
+    grid = {result["Driver"]: result["Position"] for result in qualifying_results or []}
+
+    bonus_points = {}
+    if qualifying_results:
+        pole_position_driver = qualifying_results[0].get("Driver")
+        bonus_points[pole_position_driver] = bonus_points.get(pole_position_driver, 0) + points_system.get("pole_position", 0)
+    if fastest_lap_data and fastest_lap_data.get("Driver"):
+        bonus_points[fastest_lap_data["Driver"]] = bonus_points.get(fastest_lap_data["Driver"], 0) + points_system.get("fastest_lap", 0)
+    if most_laps_led_data and most_laps_led_data.get("Driver"):
+        bonus_points[most_laps_led_data["Driver"]] = bonus_points.get(most_laps_led_data["Driver"], 0) + points_system.get("most_laps_led", 0)
+
+    rows = []
+    for i, result in enumerate(race_results or []):
+        driver = result["Driver"]
+        result_points = points[i] if i < len(points) else 0
+        rows.append((season, int(round_number), driver, result["Team"], result["Supplier"], grid.get(driver, 0), i + 1,
+                     result.get("Reason", "Finished"), result_points + bonus_points.get(driver, 0), parse_time_ms(result.get("Time"))))
+
+    for result in dnq_drivers or []:
+        rows.append((season, int(round_number), result["Driver"], result["Team"], result["Supplier"], result["Position"], 0, "DNQ", 0, -1))
+
+    return rows
+
+def get_results_store_paths(logs_dir, store_name):
+    return os.path.join(logs_dir, f"{store_name} Results.bin"), os.path.join(logs_dir, f"{store_name} Results.json")
+
+def read_results_store_index(logs_dir, store_name):
+    index_path = get_results_store_paths(logs_dir, store_name)[1]
+    if os.path.exists(index_path):
+        with open(index_path, 'r') as json_file:
+            return json.load(json_file)
+
+    # "Rounds" lists [season, round, row count] in the order the rows were appended
+    return {"Names": {name: [] for name in results_store_names}, "Rounds": []}
+
+def encode_results_rows(rows):
+    # Store rows as records, with the names coded against name tables of their own and the row count of every round.
+    # Monte Carlo workers encode their batches, so the parent only remaps the codes when it appends them.
+    import numpy as np
+
+    names = {name: [] for name in results_store_names}
+    codes = {name: {} for name in results_store_names}
+
+    def encode(name, value):
+        if value not in codes[name]:
+            codes[name][value] = len(names[name])
+            names[name].append(value)
+        return codes[name][value]
+
+    records = np.array([
+        (season, round_number, encode("Driver", driver), encode("Team", team), encode("Supplier", supplier), grid, finish, encode("Status", status), points, time_ms)
+        for season, round_number, driver, team, supplier, grid, finish, status, points, time_ms in rows
+    ], dtype=results_store_dtype)
+
+    rounds = []
+    for row in rows:
+        if rounds and rounds[-1][:2] == [row[0], row[1]]:
+            rounds[-1][2] += 1
+        else:
+            rounds.append([row[0], row[1], 1])
+
+    return records, names, rounds
+
+def write_results_store(logs_dir, store_name, rows, keep_rounds=None):
+    # Append the rows, after cutting the store back to its first keep_rounds rounds (0 rewrites it)
+    write_encoded_results_store(logs_dir, store_name, encode_results_rows(rows), keep_rounds)
+
+def write_encoded_results_store(logs_dir, store_name, encoded, keep_rounds=None):
+    # Same as write_results_store for rows already passed through encode_results_rows
+    import numpy as np
+
+    records, names, rounds = encoded
+    data_path, index_path = get_results_store_paths(logs_dir, store_name)
+    index = read_results_store_index(logs_dir, store_name)
+    if not os.path.exists(data_path):
+        keep_rounds = 0
+
+    if keep_rounds is not None:
+        index["Rounds"] = index["Rounds"][:keep_rounds]
+        if keep_rounds == 0:
+            index["Names"] = {name: [] for name in results_store_names}
+
+    # Codes from the rows' own name tables become indexes into the store's, new names are added at the end
+    for name, field in (("Driver", "driver"), ("Team", "team"), ("Supplier", "supplier"), ("Status", "status")):
+        codes = {value: code for code, value in enumerate(index["Names"][name])}
+        recode = []
+        for value in names[name]:
+            if value not in codes:
+                codes[value] = len(index["Names"][name])
+                index["Names"][name].append(value)
+            recode.append(codes[value])
+        if len(records):
+            records[field] = np.array(recode, dtype=records.dtype[field])[records[field]]
+
+    for season, round_number, count in rounds:
+        if index["Rounds"] and index["Rounds"][-1][:2] == [season, round_number]:
+            index["Rounds"][-1][2] += count
+        else:
+            index["Rounds"].append([season, round_number, count])
+
+    os.makedirs(logs_dir, exist_ok=True)
+    with open(data_path, 'r+b' if os.path.exists(data_path) else 'wb') as data_file:
+        data_file.truncate((sum(count for _, _, count in index["Rounds"]) - len(records)) * records.itemsize)
+        data_file.seek(0, os.SEEK_END)
+        data_file.write(records.tobytes())
+
+    with open(index_path, 'w') as json_file:
+        json.dump(index, json_file)
+
+def load_results_store(logs_dir, store_name):
+    # The records as a read-only memory map plus the name tables, or None if nothing was stored yet
+    import numpy as np
+
+    data_path = get_results_store_paths(logs_dir, store_name)[0]
+    index = read_results_store_index(logs_dir, store_name)
+    row_count = sum(count for _, _, count in index["Rounds"])
+    if row_count == 0 or not os.path.exists(data_path):
+        return None
+
+    return np.memmap(data_path, dtype=results_store_dtype, mode='r', shape=(row_count,)), index["Names"]
 
 def get_series_attributes_from_csv(series_name, script_directory):
     csv_file_path = os.path.join(script_directory, 'Rules', 'Championship Rules.csv')
@@ -286,26 +556,48 @@ def get_series_attributes_from_csv(series_name, script_directory):
     # If no match is found, raise an error
     raise ValueError(f"No match found for series_name: {series_name}")
 
+def annotate_heatmap(ax, data, cmap, norm, fontsize=9):
+    # Write every filled cell's value, dark on light cells and white on dark ones as seaborn does,
+    # with the cell colors worked out for the whole matrix at once
+    rgb = cmap(norm(np.ma.masked_invalid(data)))[..., :3]
+    rgb = np.where(rgb <= .03928, rgb / 12.92, ((rgb + .055) / 1.055) ** 2.4)
+    luminance = rgb @ np.array([.2126, .7152, .0722])
+
+    for i, j in np.argwhere(~np.isnan(data)):
+        text = ax.text(j + 0.5, i + 0.5, f"{data[i, j]:.0f}", ha='center', va='center', fontsize=fontsize, color=".15" if luminance[i, j] > .408 else "w")
+        text.set_in_layout(False)  # Keeps tight_layout from measuring every cell
+
 def plot_driver_performance_heatmap(sorted_standings, race_results_list, dnf_drivers_list, discipline, dnq_drivers_list):
+    load_plotting_modules()
+
     drivers = [driver for driver, _ in sorted_standings]
     races = len(race_results_list)
+    driver_index = {driver: i for i, driver in enumerate(drivers)}
 
-    driver_positions = {driver: [np.nan] * races for driver in drivers}
+    # Position, DNF and DNQ matrices (driver x race), each filled in one pass over its results
+    data = np.full((len(drivers), races), np.nan)
+    dnf_cells = np.zeros((len(drivers), races), dtype=bool)
+    dnq_cells = np.zeros((len(drivers), races), dtype=bool)
 
-    dnf_list = []  # List of drivers who DNFed in each
-
-    for i, race_results in enumerate(race_results_list):
+    for j, race_results in enumerate(race_results_list):
         for result in race_results:
-            driver = result["Driver"]
-            position = result["Position"]
-            if position > len(race_results):  # Check if position indicates a DNF
-                position = len(race_results) + 1
-                dnf_list.append(driver)
-            if driver in driver_positions:
-                driver_positions[driver][i] = position
+            i = driver_index.get(result["Driver"])
+            if i is not None:
+                data[i, j] = min(result["Position"], len(race_results) + 1)  # Anything past the field counts as a DNF
 
-    # Convert positions to a DataFrame for heatmap
-    data = np.array([positions for driver, positions in driver_positions.items()])
+    for j, dnf_drivers in enumerate(dnf_drivers_list):
+        for dnf_driver in dnf_drivers or []:
+            i = driver_index.get(dnf_driver["Driver"])
+            if i is not None:
+                dnf_cells[i, j] = True
+
+    for j, dnq_drivers in enumerate(dnq_drivers_list):
+        for dnq_driver in dnq_drivers or []:
+            i = driver_index.get(dnq_driver["Driver"])
+            if i is not None:
+                dnq_cells[i, j] = True
+
+    dnq_cells &= np.isnan(data)  # A driver with a result in the race is not shown as a DNQ
 
     # Define custom color palette
             #  White      Gold       Silver     Bronze     L. Green   L. Blue    D. Blue
@@ -324,31 +616,27 @@ def plot_driver_performance_heatmap(sorted_standings, race_results_list, dnf_dri
     norm = mcolors.BoundaryNorm(bounds, cmap.N)
 
     plt.figure(figsize=(12, 8))
-    ax = sns.heatmap(data, annot=True, fmt=".0f", cmap=cmap, norm=norm, linewidths=.5, linecolor='gray', xticklabels=range(1, races + 1), yticklabels=drivers, annot_kws={"fontsize": 9})
+    ax = sns.heatmap(data, cmap=cmap, norm=norm, linewidths=.5, linecolor='gray', xticklabels=range(1, races + 1), yticklabels=drivers)
+    annotate_heatmap(ax, data, cmap, norm)
 
-    # Apply pink color for DNQ results and display "DNQ" in the box
-    for i, driver in enumerate(drivers):
-        for j in range(races):
-            if np.isnan(data[i, j]):
-                if driver in [dnq_driver["Driver"] for dnq_driver in dnq_drivers_list[j]]:
-                    ax.add_patch(plt.Rectangle((j, i), 1, 1, fill=True, facecolor='#D89C97', edgecolor='gray', lw=0.5))
-                    ax.text(j + 0.5, i + 0.5, 'DNQ', ha='center', va='center', color='black', fontsize=8)
+    # Apply pink color for DNQ results and display "DNQ" in the box, one mesh over the masked cells
+    ax.pcolormesh(np.ma.masked_where(~dnq_cells, np.ones(data.shape)), cmap=mcolors.ListedColormap(['#D89C97']), edgecolors='gray', linewidth=0.5)
+    for i, j in np.argwhere(dnq_cells):
+        ax.text(j + 0.5, i + 0.5, 'DNQ', ha='center', va='center', color='black', fontsize=8)
 
     # Apply a pink tint for DNF results over the existing color
-    for i, driver in enumerate(drivers):
-        for j in range(races):
-            if driver in [dnf_driver["Driver"] for dnf_driver in dnf_drivers_list[j]]:
-                ax.add_patch(plt.Rectangle((j, i), 1, 1, fill=True, facecolor='#A77694', edgecolor='gray', lw=0.5))
+    ax.pcolormesh(np.ma.masked_where(~dnf_cells, np.ones(data.shape)), cmap=mcolors.ListedColormap(['#A77694']), edgecolors='gray', linewidth=0.5)
 
     plt.xlabel('Race')
     plt.ylabel('Driver')
     plt.title(f'Driver Standings by Race')
     plt.tight_layout()
 
-    # Save or show the plot
-    plt.show()  # Display the plot
+    finish_figure("Performance Heatmap")
 
 def plot_race_by_race_performance(drivers, race_results_list):
+    load_plotting_modules()
+
     races = len(race_results_list)  # Number of races
     driver_positions = {driver: [] for driver in drivers}
 
@@ -385,39 +673,18 @@ def plot_race_by_race_performance(drivers, race_results_list):
     plt.legend(loc='upper left', bbox_to_anchor=(1, 1))
     plt.tight_layout()
 
-    # Add interactive highlighting using mplcursors
-    cursor = mplcursors.cursor(highlight=True)
-
-    @cursor.connect("add")
-    def on_add(sel):
-        for line, label in lines:
-            if sel.artist == line:
-                sel.annotation.set_text(f"Driver: {label}")
-                sel.annotation.get_bbox_patch().set_facecolor("yellow")
-                sel.annotation.get_bbox_patch().set_alpha(0.8)
-                # Bolden the line and change its color to yellow when clicked
-                line.set_linewidth(4)
-                line.set_color("yellow")
-                line.set_zorder(10)  # Bring to front
-
-    @cursor.connect("remove")
-    def on_remove(sel):
-        for line, label in lines:
-            if sel.artist == line:
-                # Restore original line width and color when deselected
-                line.set_linewidth(2)
-                # Restore original color from palette
-                line.set_color(palette[drivers.index(label)])
-                line.set_zorder(1)
+    add_line_cursor(lines, dict(zip(drivers, palette)))
 
     # Set initial line width and color
     for line, driver in lines:
         line.set_linewidth(2)
         line.set_color(palette[drivers.index(driver)])
 
-    plt.show()
+    finish_figure("Race by Race")
 
 def plot_average_positions(sorted_standings, race_results_list, qualifying_results_list):
+    load_plotting_modules()
+
     drivers = [driver for driver, _ in sorted_standings]
     drivers.reverse()  # Flip the order of the drivers
 
@@ -478,31 +745,22 @@ def plot_average_positions(sorted_standings, race_results_list, qualifying_resul
 
     plt.tight_layout()
 
-    # Save or show the plot
-    plt.show()  # Display the plot
+    finish_figure("Average Positions")
 
 def plot_driver_qualifying_heatmap(sorted_standings, qualifying_results_list, dnq_drivers_list):
+    load_plotting_modules()
+
     drivers = [driver for driver, _ in sorted_standings]
     races = len(qualifying_results_list)
+    driver_index = {driver: i for i, driver in enumerate(drivers)}
 
-    driver_positions = {driver: [np.nan] * races for driver in drivers}
-
-    for i, qualifying_results in enumerate(qualifying_results_list):
-        for result in qualifying_results:
-            driver = result["Driver"]
-            position = result["Position"]
-            if driver in driver_positions:
-                driver_positions[driver][i] = position
-
-    for i, dnq_results in enumerate(dnq_drivers_list):
-        for result in dnq_results:
-            driver = result["Driver"]
-            position = result["Position"]
-            if driver in driver_positions:
-                driver_positions[driver][i] = position
-
-    # Convert positions to a DataFrame for heatmap
-    data = np.array([positions for driver, positions in driver_positions.items()])
+    # Qualifying position matrix (driver x race), DNQs keep their qualifying position
+    data = np.full((len(drivers), races), np.nan)
+    for j, (qualifying_results, dnq_results) in enumerate(zip(qualifying_results_list, dnq_drivers_list)):
+        for result in (qualifying_results or []) + (dnq_results or []):
+            i = driver_index.get(result["Driver"])
+            if i is not None:
+                data[i, j] = result["Position"]
 
     plt.figure(figsize=(12, 8))
 
@@ -510,18 +768,19 @@ def plot_driver_qualifying_heatmap(sorted_standings, qualifying_results_list, dn
     norm = mcolors.LogNorm(vmin=np.nanmin(data), vmax=np.nanmax(data))
 
     # Create the heatmap with logarithmic color scaling
-    sns.heatmap(data, annot=True, fmt=".0f", cmap="viridis_r", norm=norm, linewidths=.5, linecolor='gray',
-                xticklabels=range(1, races + 1), yticklabels=drivers, annot_kws={"fontsize": 9})
+    ax = sns.heatmap(data, cmap="viridis_r", norm=norm, linewidths=.5, linecolor='gray',
+                     xticklabels=range(1, races + 1), yticklabels=drivers)
+    annotate_heatmap(ax, data, plt.get_cmap("viridis_r"), norm)
 
     plt.xlabel('Race')
     plt.ylabel('Driver')
     plt.title(f'Qualifying by Race')
     plt.tight_layout()
 
-    # Save or show the plot
-    plt.show()  # Display the plot
+    finish_figure("Qualifying Heatmap")
 
-def plot_title_fight_progression(sorted_standings, race_results_list, series_name, qualifying_results=None, fastest_lap_data=None, most_laps_led_data=None):
+def plot_title_fight_progression(sorted_standings, points_progression, series_name):
+    load_plotting_modules()
 
     # Check if the series uses a playoff system
     playoff_config = series_playoff_config.get(series_name, {})
@@ -538,56 +797,12 @@ def plot_title_fight_progression(sorted_standings, race_results_list, series_nam
         threshold = 0  # Default threshold if standings are empty
 
     # Include top 5 drivers and others within the threshold
-    selected_drivers = [driver for driver, stats in sorted_standings if stats['Points'] >= threshold or driver in top_drivers]
+    selected_rows = [row for row, (driver, stats) in enumerate(sorted_standings) if stats['Points'] >= threshold or driver in top_drivers]
+    selected_drivers = [sorted_standings[row][0] for row in selected_rows]
 
-    # Prepare data for plotting
-    races = len(race_results_list)  # Total number of races
-    title_fight_progression = [[] for _ in range(len(selected_drivers))]  # Initialize lists for each selected driver
-
-    # Process each race separately and update standings
-    current_standings = {driver: {'Points': 0} for driver, _ in sorted_standings}
-
-    for i in range(races):
-        points_system = points_systems.get(series_name, points_systems["Other Series"])
-        points = points_system.get("points", [])
-        race_results = race_results_list[i]
-        
-        # Reset current race standings before processing
-        current_race_standings = {driver: {'Points': 0} for driver, _ in sorted_standings}
-
-        for result in race_results:
-            driver = result["Driver"]
-            position = result["Position"]
-            points = points_system.get("points")[position - 1] if position <= len(points_system.get("points")) else 0
-
-            # Add points for race result
-            current_race_standings[driver]['Points'] += points
-
-        # Process qualifying results for pole position
-        if qualifying_results:
-            pole_position_driver = qualifying_results[0].get("Driver")
-            if pole_position_driver:
-                current_standings[pole_position_driver]["Points"] += points_system.get("pole_position", 0)
-                current_standings[pole_position_driver]["Poles"] += 1
-
-        # Award points for fastest lap
-        if fastest_lap_data:
-            fastest_lap_driver = fastest_lap_data.get("Driver")
-            if fastest_lap_driver:
-                current_standings[fastest_lap_driver]["Points"] += points_system.get("fastest_lap", 0)
-
-        # Award points for most laps led
-        if most_laps_led_data:
-            most_laps_led_driver = most_laps_led_data.get("Driver")
-            if most_laps_led_driver:
-                current_standings[most_laps_led_driver]["Points"] += points_system.get("most_laps_led", 0)
-
-        # Append current race standings to overall standings for plotting
-        for j, (driver, stats) in enumerate(sorted_standings):
-            current_standings[driver]['Points'] += current_race_standings[driver]['Points']
-            if driver in selected_drivers:
-                index = selected_drivers.index(driver)
-                title_fight_progression[index].append(current_standings[driver]['Points'])
+    # Prepare data for plotting, the rows of the selected drivers
+    races = points_progression.shape[1]  # Total number of races
+    title_fight_progression = points_progression[selected_rows]
 
     # Generate a color palette with Seaborn
     palette = sns.color_palette('muted', len(selected_drivers))  # 'husl', 'pastel', 'dark', etc.
@@ -597,8 +812,8 @@ def plot_title_fight_progression(sorted_standings, race_results_list, series_nam
 
     # Plotting
     plt.figure(figsize=(10, 12))
-    for driver, points in zip(selected_drivers, title_fight_progression):
-        line, = plt.plot(range(1, races + 1), points, marker='o', label=driver, color=palette[selected_drivers.index(driver)])
+    for i, (driver, points) in enumerate(zip(selected_drivers, title_fight_progression)):
+        line, = plt.plot(range(1, races + 1), points, marker='o', label=driver, color=palette[i])
         lines.append((line, driver))
 
     # If playoffs are enabled, indicate where playoffs begin
@@ -613,81 +828,129 @@ def plot_title_fight_progression(sorted_standings, race_results_list, series_nam
     plt.xticks(range(1, races + 1))
     plt.tight_layout()
 
-    # Add interactive highlighting using mplcursors
-    cursor = mplcursors.cursor(highlight=True)
-
-    # Customize the tooltips to show the driver's name and bolden the line on click
-    @cursor.connect("add")
-    def on_add(sel):
-        for line, label in lines:
-            if sel.artist == line:
-                sel.annotation.set_text(f"Driver: {label}")
-                sel.annotation.get_bbox_patch().set_facecolor("yellow")  # Highlight tooltip background
-                sel.annotation.get_bbox_patch().set_alpha(0.8)
-                line.set_linewidth(4)
-                line.set_color("yellow")
-                line.set_zorder(10)  # Bring to front
-
-    @cursor.connect("remove")
-    def on_remove(sel):
-        for line, label in lines:
-            if sel.artist == line:
-                line.set_linewidth(2)
-                # Restore original color from palette
-                line.set_color(palette[selected_drivers.index(label)])
-                line.set_zorder(1)
+    add_line_cursor(lines, dict(zip(selected_drivers, palette)))
 
     # Set initial line width and color
-    for line, driver in lines:
+    for i, (line, driver) in enumerate(lines):
         line.set_linewidth(2)
-        line.set_color(palette[selected_drivers.index(driver)])
+        line.set_color(palette[i])
 
-    # Save or show the plot
-    plt.show()  # Display the plot
+    finish_figure("Title Fight")
 
 def extract_filename_parts(filename):
     series_name = filename
     return series_name
 
-def build_position_count(driver_name, race_results_list):
-    # Get all positions the driver has finished
-    positions = [
-        result["Position"]
-        for race in race_results_list
-        for result in race
-        if result["Driver"] == driver_name
-    ]
-    # Count how many times they finished in each position
-    # Lower positions (1st, 2nd, ...) matter more
-    return [-positions.count(pos) for pos in range(1, max(positions)+1)]
-
-def main():
-    script_directory = os.path.dirname(os.path.abspath(__file__))
-    script_filename = os.path.splitext(os.path.basename(__file__))[0]
-    series_name = extract_filename_parts(script_filename)
-
+def sort_standings(standings, finishes):
+    # Descending points, then best finish, then countback of finishes from 1st down, all read from the
+    # finishing counts apply_points keeps, so no race result is rescanned
+    def sort_key(item):
+        counts = finishes.get(item[0], [])
+        best_position = next((position for position, count in enumerate(counts, 1) if count), float("inf"))
+        return (-item[1]["Points"], best_position, *[-count for count in counts])  # negative counts, so descending by count
+
+    return sorted(standings.items(), key=sort_key)
+
+def load_standings_snapshot(script_directory, series_name, results_dir, race_files):
+    # The newest standings snapshot that is at least as new as every race file it covers.
+    # Returns the number of race files covered and the snapshot rows, or None to replay every race.
+    logs_dir = os.path.join(script_directory, 'Logs')
+    if not os.path.isdir(logs_dir):
+        return None
+
+    snapshots = []
+    for filename in os.listdir(logs_dir):
+        if filename.startswith(f"{series_name} - Round ") and filename.endswith(" Standings.json"):
+            try:
+                snapshots.append((int(filename.split(" - ")[1].split()[1]), filename))
+            except (IndexError, ValueError):
+                continue
+
+    race_orders = []
+    for filename in race_files:
+        try:
+            race_orders.append(int(filename.split(" - ")[1]))
+        except (IndexError, ValueError):
+            race_orders.append(None)
+
+    for round_number, filename in sorted(snapshots, reverse=True):
+        if round_number not in race_orders:
+            continue  # Left over from another season
+
+        covered = race_orders.index(round_number) + 1
+        snapshot_path = os.path.join(logs_dir, filename)
+        snapshot_mtime = os.stat(snapshot_path).st_mtime_ns
+        if any(os.stat(os.path.join(results_dir, race_file)).st_mtime_ns > snapshot_mtime for race_file in race_files[:covered]):
+            continue  # A covered race was rerun after this snapshot was written
+
+        with open(snapshot_path, 'r') as json_file:
+            rows = json.load(json_file)
+
+        # Snapshots written before the finishing counts were saved cannot be resumed
+        if not rows or any("Finishes" not in row for row in rows):
+            return None
+
+        return covered, rows
+
+    return None
+
+def update_standings(script_directory, series_name, verbose=True, incremental=False, verify=False):
+    # With incremental set, the latest standings snapshot is resumed and only newer races are applied.
+    # The returned race lists then hold only those newer races. verify also replays every race and
+    # raises ValueError if the two tables differ.
     results_dir = os.path.join(script_directory, os.pardir, 'Schedules', 'Races')
+    race_files = list_race_files(results_dir, series_name)
+
+    logs_dir = os.path.join(script_directory, 'Logs')
+    store_name = f"{series_name} -"
+
+    snapshot = load_standings_snapshot(script_directory, series_name, results_dir, race_files) if incremental else None
 
-    order, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list = load_results(results_dir, series_name)
+    # The results store has to hold exactly the rounds the snapshot covers, or everything is replayed
+    if snapshot:
+        stored_rounds = [round_number for season, round_number, count in read_results_store_index(logs_dir, store_name)["Rounds"]]
+        if stored_rounds != [int(race_file.split(" - ")[1]) for race_file in race_files[:snapshot[0]]]:
+            snapshot = None
+
+    covered, snapshot_rows = snapshot if snapshot else (0, [])
+
+    orders, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list = load_results(results_dir, series_name, race_files[covered:])
 
     # Extract parts from the CSV file
     discipline, region, tier, team_rules, chassis_rules, engine_rules, practice_sessions, charter_system, charter_slots, retirement_threshold = get_series_attributes_from_csv(series_name, script_directory)
 
-    if len(race_results_list) == 0:
+    if len(race_results_list) == 0 and not snapshot:
         print(f"No race results loaded from directory: '{results_dir}'")
-        return
+        return None
+
+    # Start from the snapshot, or from empty standings when every race is replayed below
+    standings.clear()
+    finishes.clear()
+    round_points.clear()
+    team_names = {}
+
+    for row in snapshot_rows:
+        standings[row["Driver"]] = {key: value for key, value in row.items() if key not in ("Rank", "Driver", "Team", "Finishes")}
+        finishes[row["Driver"]] = row["Finishes"]
+        team_names[row["Driver"]] = row["Team"]
+
+    # Name the snapshot after the last round applied, or the snapshot's own round when nothing is newer
+    order = orders[-1] if orders else race_files[covered - 1].split(" - ")[1]
 
     # Initialize a list to hold the race data to be written to JSON
     json_output_data = []
 
     driver_teams_list = {}  # Dictionary to store the teams for each driver
+    store_rows = []  # Results store rows of the races applied below
 
     # Process each race separately
-    for i, (race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data) in enumerate(zip(race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list)):
+    for i, (race_order, race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data) in enumerate(zip(orders, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list), covered):
         if race_results:
-            print(f"\nProcessing Race {i + 1}")
+            if verbose:
+                print(f"\nProcessing Race {i + 1}")
             apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data, discipline)
             reset_for_playoffs(standings, i, series_name)
+            store_rows.extend(build_results_rows(series_name, 0, race_order, race_results, qualifying_results, dnq_drivers, fastest_lap_data, most_laps_led_data))
 
             # Track teams for each driver
             for result in race_results:
@@ -698,25 +961,14 @@ def main():
                 driver_teams_list[driver].add(team)
 
         else:
-            print(f"No race results found for Race {i + 1}")
-
-    print("\n\n\n - - - Final Standings - - - \n")
-    sorted_standings = sorted(
-        standings.items(),
-        key=lambda x: (
-            -x[1]["Points"],  # descending points
-            min([
-                result["Position"]
-                for race in race_results_list
-                for result in race
-                if result["Driver"] == x[0]
-            ]),  # ascending best position (1 is best)
-            *build_position_count(x[0], race_results_list)  # negative counts, so descending by count
-        )
-    )
+            if verbose:
+                print(f"No race results found for Race {i + 1}")
+
+    if verbose:
+        print("\n\n\n - - - Final Standings - - - \n")
+    sorted_standings = sort_standings(standings, finishes)
 
     # Collect team names from all race results
-    team_names = {}
     supplier_names = {}
 
     for qualifying_results in qualifying_results_list:
@@ -739,51 +991,53 @@ def main():
                 supplier = dnq_driver["Supplier"]
                 supplier_names[driver] = supplier  # Store the supplier name for each driver
 
-    # Calculate max lengths for formatting
-    max_order_length = len(str(len(sorted_standings)))
-    max_name_length = max(len(driver) for driver, _ in sorted_standings)
-    max_team_length = max(len(team_names.get(driver, "")) for driver, _ in sorted_standings)
+    if verbose:
+        # Calculate max lengths for formatting
+        max_order_length = len(str(len(sorted_standings)))
+        max_name_length = max(len(driver) for driver, _ in sorted_standings)
+        max_team_length = max(len(team_names.get(driver, "")) for driver, _ in sorted_standings)
 
-    if discipline == "StockCar":
-        # Print headers with fixed-width formatting for StockCar
-        print(f"    {'Driver':<{max_name_length}} | {'Team':<{max_team_length}} | "
-              f"{'Points':>6} | {'Wins':>4} | {'Top 5s':>7} | {'Top 10s':>8} | {'Poles':>5} | {'DNFs':>4} | {'Races':>5}\n")
-    else:
-        # Print headers with fixed-width formatting for other disciplines
-        print(f"    {'Driver':<{max_name_length}} | {'Team':<{max_team_length}} | "
-              f"{'Points':>6} | {'Wins':>4} | {'Podiums':>7} | {'Poles':>5} | {'DNFs':>4} | {'Races':>5}\n")
-
-    # Print standings with team names
-    for i, (driver, stats) in enumerate(sorted_standings):
-        team_name = team_names.get(driver, "")
         if discipline == "StockCar":
-            print(f"{i+1:>{max_order_length}}. {driver:<{max_name_length}} | {team_name:<{max_team_length}} | "
-                  f"{stats['Points']:>6} | {stats['Wins']:>4} | {stats['Top 5s']:>7} | {stats['Top 10s']:>8} | "
-                  f"{stats['Poles']:>5} | {stats['DNFs']:>4} | {stats['Races']:>5}")
+            # Print headers with fixed-width formatting for StockCar
+            print(f"    {'Driver':<{max_name_length}} | {'Team':<{max_team_length}} | "
+                  f"{'Points':>6} | {'Wins':>4} | {'Top 5s':>7} | {'Top 10s':>8} | {'Poles':>5} | {'DNFs':>4} | {'Races':>5}\n")
         else:
-            print(f"{i+1:>{max_order_length}}. {driver:<{max_name_length}} | {team_name:<{max_team_length}} | "
-                  f"{stats['Points']:>6} | {stats['Wins']:>4} | {stats['Podiums']:>7} | {stats['Poles']:>5} | "
-                  f"{stats['DNFs']:>4} | {stats['Races']:>5}")
+            # Print headers with fixed-width formatting for other disciplines
+            print(f"    {'Driver':<{max_name_length}} | {'Team':<{max_team_length}} | "
+                  f"{'Points':>6} | {'Wins':>4} | {'Podiums':>7} | {'Poles':>5} | {'DNFs':>4} | {'Races':>5}\n")
+
+        # Print standings with team names
+        for i, (driver, stats) in enumerate(sorted_standings):
+            team_name = team_names.get(driver, "")
+            if discipline == "StockCar":
+                print(f"{i+1:>{max_order_length}}. {driver:<{max_name_length}} | {team_name:<{max_team_length}} | "
+                      f"{stats['Points']:>6} | {stats['Wins']:>4} | {stats['Top 5s']:>7} | {stats['Top 10s']:>8} | "
+                      f"{stats['Poles']:>5} | {stats['DNFs']:>4} | {stats['Races']:>5}")
+            else:
+                print(f"{i+1:>{max_order_length}}. {driver:<{max_name_length}} | {team_name:<{max_team_length}} | "
+                      f"{stats['Points']:>6} | {stats['Wins']:>4} | {stats['Podiums']:>7} | {stats['Poles']:>5} | "
+                      f"{stats['DNFs']:>4} | {stats['Races']:>5}")
 
     # Calculate and display Team Standings
     team_standings = calculate_team_points(standings, team_names)
     sorted_team_standings = sorted(team_standings.items(), key=lambda x: x[1]["Points"], reverse=True)
 
-    print("\n\n - - - Team Standings - - - \n")
-    max_order_length = len(str(len(sorted_team_standings)))
-    max_team_name_length = max(len(team) for team, _ in sorted_team_standings)
+    if verbose:
+        print("\n\n - - - Team Standings - - - \n")
+        max_order_length = len(str(len(sorted_team_standings)))
+        max_team_name_length = max(len(team) for team, _ in sorted_team_standings)
 
-    # Get all stat keys from the first team (assumes all teams have same keys)
-    stat_keys = list(sorted_team_standings[0][1].keys())
-    # Prepare header
-    header = f"    {'Team':<{max_team_name_length}} | " + " | ".join(f"{key:>{max(6, len(key))}}" for key in stat_keys)
-    print(header)
-    print('' * len(header))
+        # Get all stat keys from the first team (assumes all teams have same keys)
+        stat_keys = list(sorted_team_standings[0][1].keys())
+        # Prepare header
+        header = f"    {'Team':<{max_team_name_length}} | " + " | ".join(f"{key:>{max(6, len(key))}}" for key in stat_keys)
+        print(header)
+        print('' * len(header))
 
-    # Print each team's stats in numbered order
-    for i, (team, stats) in enumerate(sorted_team_standings):
-        row = f"{i+1:>{max_order_length}}. {team:<{max_team_name_length}} | " + " | ".join(f"{stats[key]:>{max(6, len(key))}}" for key in stat_keys)
-        print(row)
+        # Print each team's stats in numbered order
+        for i, (team, stats) in enumerate(sorted_team_standings):
+            row = f"{i+1:>{max_order_length}}. {team:<{max_team_name_length}} | " + " | ".join(f"{stats[key]:>{max(6, len(key))}}" for key in stat_keys)
+            print(row)
 
     # Prepare standings data for JSON export
     for i, (driver, stats) in enumerate(sorted_standings):
@@ -799,7 +1053,8 @@ def main():
                 "Top 10s": stats['Top 10s'],
                 "Poles": stats['Poles'],
                 "DNFs": stats['DNFs'],
-                "Races": stats['Races']
+                "Races": stats['Races'],
+                "Finishes": finishes.get(driver, [])
             })
         else:
             json_output_data.append({
@@ -811,7 +1066,8 @@ def main():
                 "Podiums": stats['Podiums'],
                 "Poles": stats['Poles'],
                 "DNFs": stats['DNFs'],
-                "Races": stats['Races']
+                "Races": stats['Races'],
+                "Finishes": finishes.get(driver, [])
             })
 
     # Define the JSON file name based on series name and the last round processed
@@ -823,60 +1079,26 @@ def main():
     with open(json_filepath, 'w') as json_file:
         json.dump(json_output_data, json_file, indent=4)
 
-    print(f"Standings saved to {json_filename}")
+    # Append the new races to the results store, a full replay rewrites it
+    write_results_store(logs_dir, store_name, store_rows, keep_rounds=covered)
 
-    # Prepare data for plotting
-    drivers = [driver for driver, _ in sorted_standings]
-    races = len(race_results_list)  # Total number of races
+    if verbose:
+        print(f"Standings saved to {json_filename}")
 
-    # Initialize lists to store points progression after each race
-    points_progression = [[] for _ in range(len(sorted_standings))]
+    # Cross-check against a full replay, which also rewrites the snapshot from every race file
+    if incremental and verify:
+        replayed_standings = update_standings(script_directory, series_name, verbose=False)[0]
+        if [stats for _, stats in sorted_standings] != [stats for _, stats in replayed_standings] or dict(sorted_standings) != dict(replayed_standings):
+            raise ValueError(f"Incremental standings after round {order} differ from a full replay of every race")
 
-    # Process each race separately and update standings
-    current_standings = {driver: {'Points': 0} for driver, _ in sorted_standings}
+    return sorted_standings, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list, discipline
 
-    for i in range(races):
-        points_system = points_systems.get(series_name, points_systems["Other Series"])
-        points = points_system.get("points", [])
-        pole_position_points = points_system.get("pole_position", 0)
-        fastest_lap_points = points_system.get("fastest_lap", 0)
-        most_laps_led_points = points_system.get("most_laps_led", 0)
-        race_results = race_results_list[i]
-        
-        # Reset current race standings before processing
-        current_race_standings = {driver: {'Points': 0} for driver, _ in sorted_standings}
+def plot_points_progression(sorted_standings, points_progression):
+    load_plotting_modules()
 
-        for result in race_results:
-            driver = result["Driver"]
-            position = result["Position"]
-            points = points_systems[series_name]["points"][position - 1] if position <= len(points_systems[series_name]["points"]) else 0
-
-            # Add points for race result
-            current_race_standings[driver]['Points'] += points
-
-        # Process qualifying results for pole position
-        if qualifying_results:
-            pole_position_driver = qualifying_results[0].get("Driver")
-            if pole_position_driver:
-                standings[pole_position_driver]["Points"] += pole_position_points
-                standings[pole_position_driver]["Poles"] += 1
-
-        # Award points for fastest lap
-        if fastest_lap_data:
-            fastest_lap_driver = fastest_lap_data.get("Driver")
-            if fastest_lap_driver:
-                standings[fastest_lap_driver]["Points"] += fastest_lap_points
-
-        # Award points for most laps led
-        if most_laps_led_data:
-            most_laps_led_driver = most_laps_led_data.get("Driver")
-            if most_laps_led_driver:
-                standings[most_laps_led_driver]["Points"] += most_laps_led_points
-
-        # Append current race standings to overall standings for plotting
-        for j, (driver, stats) in enumerate(sorted_standings):
-            current_standings[driver]['Points'] += current_race_standings[driver]['Points']
-            points_progression[j].append(current_standings[driver]['Points'])
+    # Prepare data for plotting, one row of running totals per driver in standings order
+    drivers = [driver for driver, _ in sorted_standings]
+    races = points_progression.shape[1]  # Total number of races
 
     plt.figure(figsize=(10, 12))
 
@@ -887,9 +1109,9 @@ def main():
     palette = sns.color_palette('muted', len(drivers))  # 'husl', 'pastel', 'dark', etc.
 
     # Plot each driver's points progression
-    for driver, points in zip(drivers, points_progression):
+    for i, (driver, points) in enumerate(zip(drivers, points_progression)):
         line, = plt.plot(range(1, races + 1), points, marker='o',
-                        label=driver, color=palette[drivers.index(driver)])
+                        label=driver, color=palette[i])
         lines.append((line, driver))
 
     # Add title and labels
@@ -903,37 +1125,26 @@ def main():
     plt.xticks(range(1, races + 1))
     plt.tight_layout()
 
-    # Add interactive highlighting using mplcursors
-    cursor = mplcursors.cursor(highlight=True)
-
-    # Customize the tooltips to show the driver's name and bolden the line on click
-    @cursor.connect("add")
-    def on_add(sel):
-        for line, label in lines:
-            if sel.artist == line:
-                sel.annotation.set_text(f"Driver: {label}")
-                sel.annotation.get_bbox_patch().set_facecolor("yellow")  # Highlight tooltip background
-                sel.annotation.get_bbox_patch().set_alpha(0.8)
-                line.set_linewidth(4)
-                line.set_color("yellow")
-                line.set_zorder(10)  # Bring to front
-
-    @cursor.connect("remove")
-    def on_remove(sel):
-        for line, label in lines:
-            if sel.artist == line:
-                line.set_linewidth(2)
-                # Restore original color from palette
-                line.set_color(palette[drivers.index(label)])
-                line.set_zorder(1)
+    add_line_cursor(lines, dict(zip(drivers, palette)))
 
     # Set initial line width and color
-    for line, driver in lines:
+    for i, (line, driver) in enumerate(lines):
         line.set_linewidth(2)
-        line.set_color(palette[drivers.index(driver)])
+        line.set_color(palette[i])
+
+    finish_figure("Points Progression")
+
+def plot_round_figures(standings_data, series_name):
+    # Every figure of the round, in the order they are shown
+    sorted_standings, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list, discipline = standings_data
+
+    drivers = [driver for driver, _ in sorted_standings]
+
+    # Running points totals for both progression plots, race and bonus points from the points pass summed per round
+    race_points, bonus_points = build_points_matrix(drivers, round_points)
+    points_progression = (race_points + bonus_points).cumsum(axis=1)
 
-    # Show the plot
-    plt.show()
+    plot_points_progression(sorted_standings, points_progression)
 
     plot_driver_performance_heatmap(sorted_standings, race_results_list, dnf_drivers_list, discipline, dnq_drivers_list)
 
@@ -944,7 +1155,82 @@ def main():
     # Plot and show the graphs
     plot_average_positions(sorted_standings, qualifying_results_list, race_results_list)
 
-    plot_title_fight_progression(sorted_standings, race_results_list, series_name, qualifying_results=None, fastest_lap_data=None, most_laps_led_data=None)
+    plot_title_fight_progression(sorted_standings, points_progression, series_name)
+
+def replay_standings(script_directory, series_name, race_count):
+    # Standings after the first race_count races, without printing or writing any logs
+    results_dir = os.path.join(script_directory, os.pardir, 'Schedules', 'Races')
+    orders, race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list = load_results(results_dir, series_name, list_race_files(results_dir, series_name)[:race_count])
+    discipline = get_series_attributes_from_csv(series_name, script_directory)[0]
+
+    standings.clear()
+    finishes.clear()
+    round_points.clear()
+    for i, (race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data) in enumerate(zip(race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list)):
+        if race_results:
+            apply_points(series_name, race_results, qualifying_results, dnf_drivers, dnq_drivers, fastest_lap_data, most_laps_led_data, discipline)
+            reset_for_playoffs(standings, i, series_name)
+
+    return orders[-1], (sort_standings(standings, finishes), race_results_list, qualifying_results_list, dnf_drivers_list, dnq_drivers_list, fastest_lap_data_list, most_laps_led_data_list, discipline)
+
+def export_round_figures(export_task):
+    # Renders every figure of one round to files with the Agg backend, run directly or in a worker process
+    global figure_export
+    script_directory, series_name, race_count, output_directory, formats = export_task
+
+    load_plotting_modules(headless=True)
+
+    order, standings_data = replay_standings(script_directory, series_name, race_count)
+    figure_export = {"directory": output_directory, "prefix": f"{series_name} - Round {order}", "formats": formats}
+    try:
+        plot_round_figures(standings_data, series_name)
+    finally:
+        figure_export = None
+
+    return order
+
+def export_figures(script_directory, series_name, output_directory, formats=("png",), all_rounds=False, workers=None):
+    # Writes the figures of the latest round, or of every round so far, without opening a window
+    results_dir = os.path.join(script_directory, os.pardir, 'Schedules', 'Races')
+    race_count = len(list_race_files(results_dir, series_name))
+    if race_count == 0:
+        print(f"No race results loaded from directory: '{results_dir}'")
+        return []
+
+    os.makedirs(output_directory, exist_ok=True)
+    race_counts = range(1, race_count + 1) if all_rounds else [race_count]
+    export_tasks = [(script_directory, series_name, count, output_directory, list(formats)) for count in race_counts]
+
+    # Rounds are independent, so a process pool can render several at once
+    if workers and workers > 1 and len(export_tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            orders = list(executor.map(export_round_figures, export_tasks))
+    else:
+        orders = [export_round_figures(export_task) for export_task in export_tasks]
+
+    print(f"Figures for {len(orders)} round(s) saved to {output_directory}")
+    return orders
+
+def main(export_directory=None, formats=("png",), all_rounds=False, workers=None):
+    script_directory = os.path.dirname(os.path.abspath(__file__))
+    script_filename = os.path.splitext(os.path.basename(__file__))[0]
+    series_name = extract_filename_parts(script_filename)
+
+    standings_data = update_standings(script_directory, series_name)
+    if standings_data is None:
+        return
+
+    if export_directory:
+        export_figures(script_directory, series_name, export_directory, formats, all_rounds, workers)
+    else:
+        plot_round_figures(standings_data, series_name)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Update the championship standings and plot the season.")
+    parser.add_argument("--export", metavar="DIRECTORY", help="save the figures to this directory with the Agg backend instead of showing them")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg", "pdf"], help="file formats for --export (default: png)")
+    parser.add_argument("--all-rounds", action="store_true", help="with --export, save the figures as they stood after every round")
+    parser.add_argument("--workers", type=int, default=None, help="with --export, render rounds in this many worker processes")
+    args = parser.parse_args()
+
+    main(export_directory=args.export, formats=args.format, all_rounds=args.all_rounds, workers=args.workers)
@@ -1,16 +1,28 @@
 import csv ### look for comments with "DEBUG" to find debug print statements
 import random
+import argparse
+import bisect
+import importlib.util
 import os
 import time
 import json
+import pickle
 import math
-import keyboard
-from collections import defaultdict
-from rich.console import Console
-from rich.text import Text
-from rich.live import Live
+import cProfile
+import contextlib
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 class Driver:
+    # Ratings and profile from the roster first, shared by every clone. Modifiers only change them on working copies.
+    # Then the race state, reset at the start of every round.
+    __slots__ = ("name", "nationality", "age", "psyche", "speed", "skill", "bravery", "fitness", "experience", "morale",
+                 "preferred_discipline", "preferred_track", "style", "traits", "trait_flags", "fame", "reputation", "funding",
+                 "personal_sponsors", "contract", "target", "relations", "team_name",
+                 "dnf", "fantastic_qualifying", "fantastic_race", "shocking_qualifying", "shocking_race", "tire_choice",
+                 "tire_condition", "fuel_amount", "chassis_setup", "chassis_condition", "engine_condition", "readiness",
+                 "team_confidence", "strategy")
+
     def __init__(self, name, nationality, age, psyche, speed, skill, bravery, fitness, experience, morale, preferred_discipline, preferred_track, style, traits, fame, reputation, funding, personal_sponsors, contract, target, relations, team_name):
         self.name = name
         self.nationality = nationality
@@ -26,6 +38,7 @@ class Driver:
         self.preferred_track = preferred_track
         self.style = style
         self.traits = traits.split("|")  # Split traits by "|"
+        self.trait_flags = flag_mask(self.traits)  # Same traits as bit flags for the simulation
         self.fame = float(fame)
         self.reputation = float(reputation)
         self.funding = funding.split("|") # 1k / 10k / 100k / 1m / 10m
@@ -35,6 +48,9 @@ class Driver:
         self.relations = relations      # Just like for most things, it's Terrible / Poor / Fair / Great / Excellent
 
         self.team_name = team_name
+        self.reset_race_state()
+
+    def reset_race_state(self):
         self.dnf = ""
         self.fantastic_qualifying = False
         self.fantastic_race = False
@@ -54,7 +70,57 @@ class Driver:
 
         self.strategy = "Balanced"  # Balanced / Conservative / Aggressive / Opportunistic strategy
 
+    def clone(self):
+        # Shares the ratings (the trait and funding lists included) and carries over the current race state.
+        # Spelled out, which is several times faster than looping over __slots__.
+        driver = Driver.__new__(Driver)
+        driver.name = self.name
+        driver.nationality = self.nationality
+        driver.age = self.age
+        driver.psyche = self.psyche
+        driver.speed = self.speed
+        driver.skill = self.skill
+        driver.bravery = self.bravery
+        driver.fitness = self.fitness
+        driver.experience = self.experience
+        driver.morale = self.morale
+        driver.preferred_discipline = self.preferred_discipline
+        driver.preferred_track = self.preferred_track
+        driver.style = self.style
+        driver.traits = self.traits
+        driver.trait_flags = self.trait_flags
+        driver.fame = self.fame
+        driver.reputation = self.reputation
+        driver.funding = self.funding
+        driver.personal_sponsors = self.personal_sponsors
+        driver.contract = self.contract
+        driver.target = self.target
+        driver.relations = self.relations
+        driver.team_name = self.team_name
+
+        driver.dnf = self.dnf
+        driver.fantastic_qualifying = self.fantastic_qualifying
+        driver.fantastic_race = self.fantastic_race
+        driver.shocking_qualifying = self.shocking_qualifying
+        driver.shocking_race = self.shocking_race
+        driver.tire_choice = self.tire_choice
+        driver.tire_condition = self.tire_condition
+        driver.fuel_amount = self.fuel_amount
+        driver.chassis_setup = self.chassis_setup
+        driver.chassis_condition = self.chassis_condition
+        driver.engine_condition = self.engine_condition
+        driver.readiness = self.readiness
+        driver.team_confidence = self.team_confidence
+        driver.strategy = self.strategy
+        return driver
+
 class Team:
+    # Ratings only, a race changes nothing on the loaded team. drivers is the roster, not shared between clones.
+    __slots__ = ("name", "charter", "alliance", "prestige", "color", "status", "status_flags", "primary_sponsor", "commitment",
+                 "secondary_sponsors", "chassis", "design", "performance", "aero", "gearbox", "suspension", "brakes", "reliability",
+                 "characteristics", "characteristic_flags", "engineer", "supplier", "engine", "power", "engine_reliability", "tires",
+                 "pitcrew", "strategist", "drivers")
+
     def __init__(self, name, charter, alliance, prestige, color, status, primary_sponsor, commitment, secondary_sponsors, chassis, design, performance, aero, gearbox, suspension, brakes, reliability, characteristics, engineer, supplier, engine, power, engine_reliability, tires, pitcrew, strategist):
         self.name = name
         self.charter = charter
@@ -62,6 +128,7 @@ class Team:
         self.prestige = prestige
         self.color = color
         self.status = status.split("|")  # Split traits by "|"
+        self.status_flags = flag_mask(self.status)
         self.primary_sponsor = primary_sponsor
         self.commitment = commitment        # Format: "Type/Duration/TypeOfDuration" (Type - Title/Primary/Premier)
         self.secondary_sponsors = secondary_sponsors.split("|")
@@ -74,6 +141,7 @@ class Team:
         self.brakes = float(brakes)
         self.reliability = float(reliability)
         self.characteristics = characteristics.split("|")  # Split traits by "|"
+        self.characteristic_flags = flag_mask(self.characteristics)
         self.engineer = engineer
         self.supplier = supplier
         self.engine = engine
@@ -87,14 +155,55 @@ class Team:
     def add_driver(self, driver):
         self.drivers.append(driver)
 
+    def clone(self, drivers=None):
+        # Shares the ratings, with the given drivers or the same ones in a new list
+        team = Team.__new__(Team)
+        team.name = self.name
+        team.charter = self.charter
+        team.alliance = self.alliance
+        team.prestige = self.prestige
+        team.color = self.color
+        team.status = self.status
+        team.status_flags = self.status_flags
+        team.primary_sponsor = self.primary_sponsor
+        team.commitment = self.commitment
+        team.secondary_sponsors = self.secondary_sponsors
+        team.chassis = self.chassis
+        team.design = self.design
+        team.performance = self.performance
+        team.aero = self.aero
+        team.gearbox = self.gearbox
+        team.suspension = self.suspension
+        team.brakes = self.brakes
+        team.reliability = self.reliability
+        team.characteristics = self.characteristics
+        team.characteristic_flags = self.characteristic_flags
+        team.engineer = self.engineer
+        team.supplier = self.supplier
+        team.engine = self.engine
+        team.power = self.power
+        team.engine_reliability = self.engine_reliability
+        team.tires = self.tires
+        team.pitcrew = self.pitcrew
+        team.strategist = self.strategist
+        team.drivers = list(self.drivers) if drivers is None else drivers
+        return team
+
+def clone_teams(teams):
+    # A roster of its own for one simulated world, every team and driver cloned, the ratings shared
+    return {team_name: team.clone([driver.clone() for driver in team.drivers]) for team_name, team in teams.items()}
+
+# Frozen per-session stats, the modifiers are applied to copies and never to the loaded roster
+EffectiveStats = namedtuple("EffectiveStats", ["speed", "skill", "performance", "power", "reliability"])
+
 class Weather:
-    def __init__(self, clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob):
+    def __init__(self, clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob, rng=random):
         self.conditions = ['Clear', 'Rainy', 'Overcast', 'Hot', 'Stormy']
         total_prob = clear_prob + rainy_prob + overcast_prob + hot_prob + stormy_prob
         thresholds = [clear_prob, clear_prob + rainy_prob, clear_prob + rainy_prob + overcast_prob,
                       clear_prob + rainy_prob + overcast_prob + hot_prob]
         
-        random_value = random.uniform(0, total_prob)
+        random_value = rng.uniform(0, total_prob)
         if random_value < thresholds[0]:
             self.current_condition = 'Clear'
         elif random_value < thresholds[1]:
@@ -107,9 +216,11 @@ class Weather:
             self.current_condition = "Stormy"
 
 class MarkovChain:
-    def __init__(self, order=2):
+    def __init__(self, order=2, rng=random):
         self.order = order
-        self.chains_by_type = defaultdict(lambda: defaultdict(list))
+        self.rng = rng  # Random number generator used for sentence generation
+        self.chains_by_type = {}  # text type -> {key: [next words]} while training
+        self.model = {}  # text type -> (keys, {key: (next words, cumulative weights)}) used for generation
         self.inappropriate_end_words = {"a", "an", "and", "the", "where", "why", "with", "of", "for", "to", "how", "from", "what", "that", "just"}
     
     def train(self, text, text_type):
@@ -120,34 +231,72 @@ class MarkovChain:
             return
         
         # Create the chains by sliding over 'order' number of words
+        chain = self.chains_by_type.setdefault(text_type, {})
         for i in range(len(words) - self.order):
             key = tuple(words[i:i + self.order])  # Create a tuple of words for the current state
-            self.chains_by_type[text_type][key].append(words[i + self.order])
+            chain.setdefault(key, []).append(words[i + self.order])
+
+        self.model.pop(text_type, None)  # Recompiled on the next sentence of this type
+
+    def compile(self):
+        # Fold each successor list into distinct words with cumulative counts, and keep the keys as a tuple
+        for text_type, chain in self.chains_by_type.items():
+            if text_type in self.model:
+                continue
+
+            successors = {}
+            for key, next_words in chain.items():
+                counts = {}
+                for word in next_words:
+                    counts[word] = counts.get(word, 0) + 1
+
+                cumulative_weights = []
+                total = 0
+                for count in counts.values():
+                    total += count
+                    cumulative_weights.append(total)
+
+                successors[key] = (tuple(counts), tuple(cumulative_weights))
+
+            self.model[text_type] = (tuple(chain), successors)
+
+        return self.model
+
+    def export_model(self):
+        # Plain tuples and dicts, so the compiled chain can be pickled with the series bundle
+        return self.compile()
+
+    def load_model(self, model):
+        # Reuse a chain compiled earlier instead of retraining from Text.csv
+        self.model.update(model)
     
     def generate(self, text_type, length=None, driver_name=None, team_name=None):
-        if text_type not in self.chains_by_type:
+        if text_type not in self.model:
+            self.compile()
+        if text_type not in self.model:
             return f"No data for event type: {text_type}"
         
         # Set default sentence length if not provided
         if not length:
-            length = random.randint(5, 15)  # Dynamic length for more variety
+            length = self.rng.randint(5, 15)  # Dynamic length for more variety
         
-        chain = self.chains_by_type[text_type]
-        if not chain:
+        keys, successors = self.model[text_type]
+        if not keys:
             return "No valid data to generate a sentence."
         
         # Randomly choose a starting key (words)
-        current_key = random.choice(list(chain.keys()))
+        current_key = self.rng.choice(keys)
         result = list(current_key)  # Seed the sentence with the first 'order' words
         
         for _ in range(length - self.order):
-            if current_key not in chain:
+            if current_key not in successors:
                 break
-            next_word = random.choice(chain[current_key])
+            next_words, cumulative_weights = successors[current_key]
+            next_word = self.rng.choices(next_words, cum_weights=cumulative_weights)[0]
             result.append(next_word)
             
             # Update the key by shifting the window over the result
-            current_key = tuple(result[-self.order:])
+            current_key = current_key[1:] + (next_word,)
         
         # Capitalize the first word and ensure placeholders are inserted properly
         result[0] = result[0].capitalize()
@@ -155,8 +304,9 @@ class MarkovChain:
         # Check if the last word is in the list of inappropriate words
         while result[-1] in self.inappropriate_end_words:
             next_key = tuple(result[-self.order:])  # Get the latest 'order' number of words
-            if next_key in chain:
-                result.append(random.choice(chain[next_key]))
+            if next_key in successors:
+                next_words, cumulative_weights = successors[next_key]
+                result.append(self.rng.choices(next_words, cum_weights=cumulative_weights)[0])
             else:
                 break  # Break if no further valid next word exists
         
@@ -199,19 +349,103 @@ class MarkovChain:
         if sentence[-1] in ",;":
             choices = ['.', '.', '.', '!', '!', '…', '…', '?']
             sentence = sentence[:-1]
-            return sentence + random.choice(choices)
+            return sentence + self.rng.choice(choices)
         # If ends with multiple punctuation marks (e.g., '!?'), reduce to one
         while len(sentence) > 1 and sentence[-1] in ".!…?," and sentence[-2] in ".!…?,":
             sentence = sentence[:-1]
         # If not ending with a valid end punctuation, add one
         if sentence[-1] not in ".!…?":
             choices = ['.', '.', '.', '!', '!', '…', '…', '?']
-            return sentence + random.choice(choices)
+            return sentence + self.rng.choice(choices)
         # If ends with valid punctuation, return as is
         return sentence
 
-def simulate_weather(clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob):
-    weather = Weather(clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob)
+# Trait, characteristic and status names interned as bit flags, so checks are bit tests instead of list scans
+flag_bits = {}
+
+def flag_bit(name):
+    # A name gets the next free bit the first time it is seen
+    if name not in flag_bits:
+        flag_bits[name] = 1 << len(flag_bits)
+    return flag_bits[name]
+
+def flag_mask(names):
+    mask = 0
+    for name in names:
+        mask |= flag_bit(name)
+    return mask
+
+def has_flag(mask, name):
+    # Names that were never interned are not held by any driver, team or track
+    return (mask & flag_bits.get(name, 0)) != 0
+
+# Data lists whose names are interned first, in list order, so they keep stable bits
+flag_vocabulary_lists = ["Driver Trait List", "Chassis Characteristic List", "Track Characteristic List"]
+
+def read_flag_vocabulary(script_directory):
+    names = []
+    for list_name in flag_vocabulary_lists:
+        list_path = os.path.join(script_directory, "Data", f"{list_name} - temp.txt")
+        if not os.path.exists(list_path):
+            continue
+
+        with open(list_path, encoding="utf-8") as list_file:
+            for line in list_file:
+                # Entries look like "Name - description", skip headers, notes and blank lines
+                name = line.split(" - ")[0].strip()
+                if name and " " not in name and name[0].isalpha():
+                    names.append(name)
+
+    return names
+
+# Instrumentation for a race: phase timings, event counters and an optional cProfile capture.
+# Off unless --metrics or --profile is given, the simulation then only checks race_metrics for None.
+class RaceMetrics:
+    def __init__(self, profile=False):
+        self.phases = {}  # Phase name -> seconds, phases can nest (the race includes its collision checks)
+        self.counters = {}
+        self.profiler = cProfile.Profile() if profile else None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0) + time.perf_counter() - start
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+class CountingRandom(random.Random):
+    # Draws the same numbers as random.Random, counting every call to the two primitives the other methods use
+    def __init__(self, x=None):
+        self.draws = 0
+        super().__init__(x)
+
+    def random(self):
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        self.draws += 1
+        return super().getrandbits(k)
+
+race_metrics = None
+no_phase = contextlib.nullcontext()
+
+def enable_race_metrics(profile=False):
+    global race_metrics
+    race_metrics = RaceMetrics(profile)
+
+def timed_phase(name):
+    # Times a phase into the active metrics, or a shared context that does nothing while instrumentation is off
+    if race_metrics is None:
+        return no_phase
+    return race_metrics.phase(name)
+
+def simulate_weather(clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob, rng=random):
+    weather = Weather(clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob, rng)
     return weather.current_condition
 
 def weather_modifier(weather_condition, driver, team):
@@ -219,7 +453,7 @@ def weather_modifier(weather_condition, driver, team):
         team.performance *= 0.9
         team.power *= 0.9
 
-        if all(trait not in driver.traits for trait in ['WetWeatherSpecialist']):
+        if not has_flag(driver.trait_flags, 'WetWeatherSpecialist'):
             driver.speed *= 0.95
             driver.skill *= 0.95
 
@@ -234,7 +468,7 @@ def weather_modifier(weather_condition, driver, team):
         team.performance *= 0.75
         team.power *= 0.75
 
-        if all(trait not in driver.traits for trait in ['WetWeatherSpecialist']):
+        if not has_flag(driver.trait_flags, 'WetWeatherSpecialist'):
             driver.speed *= 0.9
             driver.skill *= 0.9
 
@@ -244,7 +478,7 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['PoorAtRoadCourses']):
+        if has_flag(driver.trait_flags, 'PoorAtRoadCourses'):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
@@ -253,7 +487,7 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['PoorAtRoadCourses']):
+        if has_flag(driver.trait_flags, 'PoorAtRoadCourses'):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
@@ -262,15 +496,15 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['StreetTrackSpecialist']):
+        if has_flag(driver.trait_flags, 'StreetTrackSpecialist'):
             driver.speed *= 1.1
             driver.skill *= 1.1
         
-        if any(characteristic in team.characteristics for characteristic in ['StreetTrackSpecialist']):
+        if has_flag(team.characteristic_flags, 'StreetTrackSpecialist'):
             team.performance *= 1.1
             team.power *= 1.1
 
-        if any(trait in driver.traits for trait in ['PoorAtRoadCourses']):
+        if has_flag(driver.trait_flags, 'PoorAtRoadCourses'):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
@@ -279,11 +513,11 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['ShortTrackSpecialist']):
+        if has_flag(driver.trait_flags, 'ShortTrackSpecialist'):
             driver.speed *= 1.1
             driver.skill *= 1.1
 
-        if any(characteristic in team.characteristics for characteristic in ['ShortTrackSpecialist']):
+        if has_flag(team.characteristic_flags, 'ShortTrackSpecialist'):
             team.performance *= 1.1
             team.power *= 1.1
     
@@ -292,11 +526,11 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['MileOvalSpecialist']):
+        if has_flag(driver.trait_flags, 'MileOvalSpecialist'):
             driver.speed *= 1.1
             driver.skill *= 1.1
 
-        if any(characteristic in team.characteristics for characteristic in ['MileOvalSpecialist']):
+        if has_flag(team.characteristic_flags, 'MileOvalSpecialist'):
             team.performance *= 1.1
             team.power *= 1.1
 
@@ -305,11 +539,11 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['SpeedwaySpecialist']):
+        if has_flag(driver.trait_flags, 'SpeedwaySpecialist'):
             driver.speed *= 1.1
             driver.skill *= 1.1
 
-        if any(characteristic in team.characteristics for characteristic in ['SpeedwaySpecialist']):
+        if has_flag(team.characteristic_flags, 'SpeedwaySpecialist'):
             team.performance *= 1.1
             team.power *= 1.1
 
@@ -318,11 +552,11 @@ def circuit_type_modifier(circuit_type, driver, team):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-        if any(trait in driver.traits for trait in ['SuperspeedwaySpecialist']):
+        if has_flag(driver.trait_flags, 'SuperspeedwaySpecialist'):
             driver.speed *= 1.1
             driver.skill *= 1.1
 
-        if any(characteristic in team.characteristics for characteristic in ['SuperspeedwaySpecialist']):
+        if has_flag(team.characteristic_flags, 'SuperspeedwaySpecialist'):
             team.performance *= 1.1
             team.power *= 1.1
 
@@ -333,7 +567,7 @@ def discipline_modifier(discipline, driver):
             driver.speed *= 0.65
             driver.skill *= 0.65
 
-            if any(trait in driver.traits for trait in ['Adaptive']):
+            if has_flag(driver.trait_flags, 'Adaptive'):
                 driver.speed *= 1.15
                 driver.skill *= 1.15
 
@@ -342,7 +576,7 @@ def discipline_modifier(discipline, driver):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-            if any(trait in driver.traits for trait in ['Adaptive']):
+            if has_flag(driver.trait_flags, 'Adaptive'):
                 driver.speed *= 1.05
                 driver.skill *= 1.05
 
@@ -351,7 +585,7 @@ def discipline_modifier(discipline, driver):
             driver.speed *= 0.65
             driver.skill *= 0.65
 
-            if any(trait in driver.traits for trait in ['Adaptive']):
+            if has_flag(driver.trait_flags, 'Adaptive'):
                 driver.speed *= 1.15
                 driver.skill *= 1.15
 
@@ -360,7 +594,7 @@ def discipline_modifier(discipline, driver):
             driver.speed *= 0.85
             driver.skill *= 0.85
 
-            if any(trait in driver.traits for trait in ['Adaptive']):
+            if has_flag(driver.trait_flags, 'Adaptive'):
                 driver.speed *= 1.05
                 driver.skill *= 1.05
 
@@ -394,106 +628,106 @@ def track_difficulty_modifier(difficulty, driver):
 
     driver.skill *= 1 - ((1 - (driver.skill / 100)) * penalty_factor * experience_penalty)
 
-def style_vs_design_modifier(driver, team):
+def style_vs_design_modifier(driver, team, rng=random):
     if driver.style == "Oversteer" and team.design == "Understeer":
-        driver.speed *= random.uniform(0.85, 0.95)
-        driver.skill *= random.uniform(0.875, 0.975)
+        driver.speed *= rng.uniform(0.85, 0.95)
+        driver.skill *= rng.uniform(0.875, 0.975)
 
     if driver.style == "Oversteer" and team.design == "Balanced":
-        driver.speed *= random.uniform(0.925, 0.975)
-        driver.skill *= random.uniform(0.925, 0.975)
+        driver.speed *= rng.uniform(0.925, 0.975)
+        driver.skill *= rng.uniform(0.925, 0.975)
 
     if driver.style == "Understeer" and team.design == "Oversteer":
-        driver.speed *= random.uniform(0.85, 0.95)
-        driver.skill *= random.uniform(0.825, 0.925)
+        driver.speed *= rng.uniform(0.85, 0.95)
+        driver.skill *= rng.uniform(0.825, 0.925)
 
     if driver.style == "Understeer" and team.design == "Balanced":
-        driver.speed *= random.uniform(0.925, 0.975)
-        driver.skill *= random.uniform(0.925, 0.975)
+        driver.speed *= rng.uniform(0.925, 0.975)
+        driver.skill *= rng.uniform(0.925, 0.975)
 
     if driver.style == "Balanced" and team.design == "Oversteer":
-        driver.speed *= random.uniform(0.925, 0.975)
-        driver.skill *= random.uniform(0.925, 0.975)
+        driver.speed *= rng.uniform(0.925, 0.975)
+        driver.skill *= rng.uniform(0.925, 0.975)
 
     if driver.style == "Balanced" and team.design == "Understeer":
-        driver.speed *= random.uniform(0.925, 0.975)
-        driver.skill *= random.uniform(0.925, 0.975)
+        driver.speed *= rng.uniform(0.925, 0.975)
+        driver.skill *= rng.uniform(0.925, 0.975)
 
     if driver.style == "None":
-        driver.speed *= random.uniform(0.9, 0.975)
-        driver.skill *= random.uniform(0.9, 0.975)
+        driver.speed *= rng.uniform(0.9, 0.975)
+        driver.skill *= rng.uniform(0.9, 0.975)
 
     if team.design == "None":
-        driver.speed *= random.uniform(0.9, 0.975)
-        driver.skill *= random.uniform(0.9, 0.975)
+        driver.speed *= rng.uniform(0.9, 0.975)
+        driver.skill *= rng.uniform(0.9, 0.975)
 
-def trait_modifier(driver, sorted_schedule, race):
-    if any(trait in driver.traits for trait in ['Inconsistent']):
-        random_value = random.uniform(0, 1)
+def trait_modifier(driver, sorted_schedule, race, rng=random):
+    if has_flag(driver.trait_flags, 'Inconsistent'):
+        random_value = rng.uniform(0, 1)
         if random_value < 0.5:
-            driver.speed *= random.uniform(0.8, 0.9)
-            driver.skill *= random.uniform(0.8, 0.9)
+            driver.speed *= rng.uniform(0.8, 0.9)
+            driver.skill *= rng.uniform(0.8, 0.9)
         elif random_value > 0.85:
-            driver.speed *= random.uniform(1.05, 1.1)
-            driver.skill *= random.uniform(1.05, 1.1)
+            driver.speed *= rng.uniform(1.05, 1.1)
+            driver.skill *= rng.uniform(1.05, 1.1)
         else:
             pass
 
-    if any(trait in driver.traits for trait in ['EarlySeasonPeak']):
+    if has_flag(driver.trait_flags, 'EarlySeasonPeak'):
         current_race_order = int(race['Order'])
         if current_race_order <= len(sorted_schedule) // 2:
-            driver.speed *= random.uniform(1, 1.05)
-            driver.skill *= random.uniform(1, 1.05)
+            driver.speed *= rng.uniform(1, 1.05)
+            driver.skill *= rng.uniform(1, 1.05)
         else:
-            driver.speed *= random.uniform(0.9, 1)
-            driver.skill *= random.uniform(0.9, 1)
+            driver.speed *= rng.uniform(0.9, 1)
+            driver.skill *= rng.uniform(0.9, 1)
 
-    if any(trait in driver.traits for trait in ['LateSeasonPeak']):
+    if has_flag(driver.trait_flags, 'LateSeasonPeak'):
         current_race_order = int(race['Order'])
         if current_race_order >= len(sorted_schedule) // 2:
-            driver.speed *= random.uniform(1, 1.05)
-            driver.skill *= random.uniform(1, 1.05)
+            driver.speed *= rng.uniform(1, 1.05)
+            driver.skill *= rng.uniform(1, 1.05)
         else:
-            driver.speed *= random.uniform(0.9, 1)
-            driver.skill *= random.uniform(0.9, 1)
+            driver.speed *= rng.uniform(0.9, 1)
+            driver.skill *= rng.uniform(0.9, 1)
 
-    if any(trait in driver.traits for trait in ['Overwhelmed']):
-        random_value = random.uniform(0, 1)
+    if has_flag(driver.trait_flags, 'Overwhelmed'):
+        random_value = rng.uniform(0, 1)
         if random_value < 0.5:
-            driver.speed *= random.uniform(0.825, 0.9) # Slower due to hesitation
-            driver.skill *= random.uniform(0.9, 0.975)
+            driver.speed *= rng.uniform(0.825, 0.9) # Slower due to hesitation
+            driver.skill *= rng.uniform(0.9, 0.975)
         elif random_value > 0.75:
-            driver.speed *= random.uniform(0.9, 0.975)
-            driver.skill *= random.uniform(0.825, 0.9) # Decreased skill under pressure
+            driver.speed *= rng.uniform(0.9, 0.975)
+            driver.skill *= rng.uniform(0.825, 0.9) # Decreased skill under pressure
         else:
             pass
 
-def race_trait_modifier(driver, starting_position, qualifying_results, track_characteristics, iteration):
+def race_trait_modifier(driver, starting_position, qualifying_results, track_flags, iteration, rng=random):
     num_drivers = len(qualifying_results)
     bottom_25 = int(num_drivers * 0.75)
 
     if iteration == 0:
         if starting_position > bottom_25:
-            if any(trait in driver.traits for trait in ['Heroic']):
+            if has_flag(driver.trait_flags, 'Heroic'):
                 driver.speed *= 1.05
                 driver.skill *= 1.05
-            if any(trait in driver.traits for trait in ['Yielding']):
+            if has_flag(driver.trait_flags, 'Yielding'):
                 driver.speed *= 0.9
                 driver.skill *= 0.9
 
         if starting_position == 0:
-            if any(trait in driver.traits for trait in ['PoorFromPole']):
+            if has_flag(driver.trait_flags, 'PoorFromPole'):
                 driver.speed *= 0.9
                 driver.skill *= 0.9
-            if any(trait in driver.traits for trait in ['GreatFromPole']):
+            if has_flag(driver.trait_flags, 'GreatFromPole'):
                 driver.speed *= 1.05
                 driver.skill *= 1.05
 
     if iteration == 0:
-        if any(t_characteristic in track_characteristics for t_characteristic in ['Prestigious']):
-            random_value = random.uniform(0, 1)
+        if has_flag(track_flags, 'Prestigious'):
+            random_value = rng.uniform(0, 1)
             if random_value < 0.15:
-                driver.skill *= random.uniform(0.95, 0.975)
+                driver.skill *= rng.uniform(0.95, 0.975)
 
 def chassis_performance_and_power_modifier(team, track_speed):
     if track_speed == "Low":
@@ -512,7 +746,7 @@ def chassis_performance_and_power_modifier(team, track_speed):
     team.performance += team.suspension * 0.1
     team.performance += team.brakes * 0.1
 
-def simulate_practice(driver, team):
+def simulate_practice(driver, team, rng=random):
     setup_knowledge = 0.35
     driver_knowledge = 0.35
 
@@ -532,465 +766,491 @@ def simulate_practice(driver, team):
     driver_knowledge *= driver.experience
 
     if team.engineer == "Terrible":
-        if random.uniform(0, 1) > 0.5:
-            setup_knowledge += random.uniform(0.025, 0.125)
-            driver_knowledge += random.uniform(0.025, 0.125)
+        if rng.uniform(0, 1) > 0.5:
+            setup_knowledge += rng.uniform(0.025, 0.125)
+            driver_knowledge += rng.uniform(0.025, 0.125)
         else:
-            setup_knowledge *= random.uniform(0.9, 1)
-            driver_knowledge *= random.uniform(0.9, 1)
+            setup_knowledge *= rng.uniform(0.9, 1)
+            driver_knowledge *= rng.uniform(0.9, 1)
 
     if team.engineer == "Poor":
-        if random.uniform(0, 1) > 0.4:
-            setup_knowledge += random.uniform(0.05, 0.15)
-            driver_knowledge += random.uniform(0.05, 0.15)
+        if rng.uniform(0, 1) > 0.4:
+            setup_knowledge += rng.uniform(0.05, 0.15)
+            driver_knowledge += rng.uniform(0.05, 0.15)
         else:
-            setup_knowledge *= random.uniform(0.9, 1)
-            driver_knowledge *= random.uniform(0.9, 1)
+            setup_knowledge *= rng.uniform(0.9, 1)
+            driver_knowledge *= rng.uniform(0.9, 1)
 
     if team.engineer == "Fair":
-        if random.uniform(0, 1) > 0.3:
-            setup_knowledge += random.uniform(0.075, 0.175)
-            driver_knowledge += random.uniform(0.075, 0.175)
+        if rng.uniform(0, 1) > 0.3:
+            setup_knowledge += rng.uniform(0.075, 0.175)
+            driver_knowledge += rng.uniform(0.075, 0.175)
         else:
-            setup_knowledge *= random.uniform(0.9, 1)
-            driver_knowledge *= random.uniform(0.9, 1)
+            setup_knowledge *= rng.uniform(0.9, 1)
+            driver_knowledge *= rng.uniform(0.9, 1)
 
     if team.engineer == "Great":
-        if random.uniform(0, 1) > 0.2:
-            setup_knowledge += random.uniform(0.1, 0.2)
-            driver_knowledge += random.uniform(0.1, 0.2)
+        if rng.uniform(0, 1) > 0.2:
+            setup_knowledge += rng.uniform(0.1, 0.2)
+            driver_knowledge += rng.uniform(0.1, 0.2)
         else:
-            setup_knowledge *= random.uniform(0.9, 1)
-            driver_knowledge *= random.uniform(0.9, 1)
+            setup_knowledge *= rng.uniform(0.9, 1)
+            driver_knowledge *= rng.uniform(0.9, 1)
 
     if team.engineer == "Excellent":
-        if random.uniform(0, 1) > 0.1:
-            setup_knowledge += random.uniform(0.15, 0.25)
-            driver_knowledge += random.uniform(0.15, 0.25)
+        if rng.uniform(0, 1) > 0.1:
+            setup_knowledge += rng.uniform(0.15, 0.25)
+            driver_knowledge += rng.uniform(0.15, 0.25)
         else:
-            setup_knowledge *= random.uniform(0.9, 1)
-            driver_knowledge *= random.uniform(0.9, 1)
+            setup_knowledge *= rng.uniform(0.9, 1)
+            driver_knowledge *= rng.uniform(0.9, 1)
 
     return setup_knowledge, driver_knowledge
 
-def simulate_qualifying(team, weather_condition, discipline, event, grid_size, circuit_type, series_name, script_directory, track_speed, track_characteristics, sorted_schedule, race, practice_sessions, difficulty):
-    standings_data = read_standings_data(series_name, script_directory, discipline)
+def calculate_effective_stats(driver, team, weather_condition, discipline, circuit_type, difficulty, sorted_schedule, race, practice_sessions, rng=random):
+    # Work on clones so the loaded driver and team keep their base stats
+    driver = driver.clone()
+    team = team.clone()
 
-    # List to store qualifying results for all drivers in the team
-    qualifying_results = []
+    # Apply modifiers. Effects are applied to the race def as well
+    weather_modifier(weather_condition, driver, team)
+    circuit_type_modifier(circuit_type, driver, team)
+    discipline_modifier(discipline, driver)
+    style_vs_design_modifier(driver, team, rng)
+    trait_modifier(driver, sorted_schedule, race, rng)
+    track_difficulty_modifier(difficulty, driver)
 
-    # Create a copy of the drivers list to iterate over
-    drivers_copy = team.drivers[:]
+    morale_modifier(driver)
 
-    for driver in drivers_copy:
+    # normalizer(driver, team)
 
-        # Check and remove drivers based on contract status and probabilities
+    for _ in range(int(practice_sessions)):
+        setup_knowledge, driver_knowledge = simulate_practice(driver, team, rng)
+        if setup_knowledge:  # Ensure the result is valid
+        # Accumulate the practice results using the chassis_setup attribute
+            driver.chassis_setup = min(driver.chassis_setup + setup_knowledge, 1)  # Cap at 1
+            driver.readiness = min(driver.readiness + driver_knowledge, 1)  # Cap at 1
 
-        if any(status in team.status for status in ['Insecure']) and standings_data:
-            # Calculate the number of races missed by the driver
-            entry_standings = standings_data.get("entrants_standings", [])
-            current_race_order = int(race['Order'])
-            missed_races = 0
-            for entry in entry_standings:
-                if entry["Entrant"] == team.name:
-                    missed_races = current_race_order - entry["Races"]
+    # DEBUG print(f"Driver {driver.name} Setup Knowledge: {driver.chassis_setup}, Driver Knowledge: {driver.readiness}")
 
-            # Calculate the threshold based on missed races
-            threshold = 0.1 + (0.1 * (missed_races / 2))
+    team.performance *= driver.chassis_setup
+    team.power *= driver.chassis_setup
 
-            if event != 'Premier' and random.uniform(0, 1) < threshold:
-                team.drivers.remove(driver)
-                continue
+    driver.speed *= driver.readiness
+    driver.skill *= driver.readiness
 
-        if any(status in team.status for status in ['Limited']) and event != 'Premier' and random.uniform(0, 1) < 0.66:
-            team.drivers.remove(driver)
-            continue
+    return EffectiveStats(driver.speed, driver.skill, team.performance, team.power, team.reliability)
 
-        if any(status in team.status for status in ['Guest']) and random.uniform(0, 1) < 0.925:
-            team.drivers.remove(driver)
-            continue
+def calculate_race_stats(driver, stats, starting_position, qualifying_results, track_flags, rng=random):
+    # Race start modifiers are applied once on top of the qualifying stats
+    driver = driver.clone()
+    driver.speed = stats.speed
+    driver.skill = stats.skill
 
-        # For Premier contract, ensure they participate in "Premier" events
-        if any(status in team.status for status in ['Premier']) and event != 'Premier' and random.uniform(0, 1) < 0.975:
-            continue
+    race_trait_modifier(driver, starting_position, qualifying_results, track_flags, 0, rng)
 
-        # Apply modifiers. Effects are applied to the race def as well
-        weather_modifier(weather_condition, driver, team)
-        circuit_type_modifier(circuit_type, driver, team)
-        discipline_modifier(discipline, driver)
-        style_vs_design_modifier(driver, team)
-        trait_modifier(driver, sorted_schedule, race)
-        track_difficulty_modifier(difficulty, driver)
+    return stats._replace(speed=driver.speed, skill=driver.skill)
 
-        morale_modifier(driver)
+def simulate_qualifying(driver, team, weather_condition, discipline, event, circuit_type, standings_data, track_speed, track_characteristics, sorted_schedule, race, practice_sessions, difficulty, rng=random):
+    # Check whether the driver enters, based on contract status and probabilities
 
-        # normalizer(driver, team)
+    if has_flag(team.status_flags, 'Insecure') and standings_data:
+        # Calculate the number of races missed by the driver
+        entry = standings_data.get("entrants_by_name", {}).get(team.name)
+        current_race_order = int(race['Order'])
+        missed_races = 0
+        if entry:
+            missed_races = current_race_order - entry["Races"]
 
-        for _ in range(int(practice_sessions)):
-            setup_knowledge, driver_knowledge = simulate_practice(driver, team)
-            if setup_knowledge:  # Ensure the result is valid
-            # Accumulate the practice results using the chassis_setup attribute
-                driver.chassis_setup = min(driver.chassis_setup + setup_knowledge, 1)  # Cap at 1
-                driver.readiness = min(driver.readiness + driver_knowledge, 1)  # Cap at 1
-        
-        # DEBUG print(f"Driver {driver.name} Setup Knowledge: {driver.chassis_setup}, Driver Knowledge: {driver.readiness}")
-        
-        team.performance *= driver.chassis_setup
-        team.power *= driver.chassis_setup
-
-        driver.speed *= driver.readiness
-        driver.skill *= driver.readiness
-
-        driver.fantastic_qualifying = False  # Reset fantastic_qualifying attribute
-        driver.shocking_qualifying = False  # Reset shocking_qualifying attribute
-        driver.fantastic_race = False
-        driver.shocking_race = False
-
-        randomness = random.uniform(-0.05, 0.05)
-        fantastic_chance = 0.0075
-        shocking_chance = 0.015
-
-        fantastic_chance += (driver.speed / 10000)
-        shocking_chance += ((100 - driver.speed) / 10000)
-
-        if any(status in team.status for status in ['R/D']) and random.uniform(0, 1) < 0.5:
-            fantastic_chance *= 1.1
-            shocking_chance *= 1.25
-
-        if team.strategist == "Terrible":
-            fantastic_chance *= random.uniform(0.875, 0.925)
-            shocking_chance *= random.uniform(1.075, 1.125)
-        elif team.strategist == "Poor":
-            fantastic_chance *= random.uniform(0.925, 0.975)
-            shocking_chance *= random.uniform(1.025, 1.075)
-        elif team.strategist == "Great":
-            fantastic_chance *= random.uniform(1.025, 1.075)
-            shocking_chance *= random.uniform(0.925, 0.975)
-        elif team.strategist == "Excellent":
-            fantastic_chance *= random.uniform(1.075, 1.125)
-            shocking_chance *= random.uniform(0.875, 0.925)
-
-        if weather_condition == 'Clear':
-            randomness = random.uniform(-0.05, 0.05)
-            if random.uniform(0, 1) < fantastic_chance:
-                driver.fantastic_qualifying = True
-            if random.uniform(0, 1) < shocking_chance:
-                driver.shocking_qualifying = True
-
-        elif weather_condition == 'Rainy':
-            randomness = random.uniform(-0.15, 0.15)
-            if random.uniform(0, 1) < (fantastic_chance * 2.5):
-                driver.fantastic_qualifying = True
-            if random.uniform(0, 1) < (shocking_chance * 2.5):
-                driver.shocking_qualifying = True
-
-        elif weather_condition == 'Overcast':
-            if random.uniform(0, 1) < fantastic_chance:
-                driver.fantastic_qualifying = True
-            if random.uniform(0, 1) < (shocking_chance * 0.5):
-                driver.shocking_qualifying = True
-
-        elif weather_condition == 'Hot':
-            if random.uniform(0, 1) < (fantastic_chance * 0.5):
-                driver.fantastic_qualifying = True
-            if random.uniform(0, 1) < (shocking_chance * 1.5):
-                driver.shocking_qualifying = True
+        # Calculate the threshold based on missed races
+        threshold = 0.1 + (0.1 * (missed_races / 2))
 
-        else:
-            randomness = random.uniform(-0.2, 0.2)
-            if random.uniform(0, 1) < (fantastic_chance * 5):
-                driver.fantastic_qualifying = True
-            if random.uniform(0, 1) < (shocking_chance * 5):
-                driver.shocking_qualifying = True
-        
-        # Store the original skill value
-        original_skill = driver.skill
-        original_speed = driver.speed
-
-        special_modifier = 1
-        if driver.fantastic_qualifying:
-            # DEBUG print(f"{driver.name} Fantastic Qualifying")
-            if random.uniform(0, 1) < 0.75:
+        if event != 'Premier' and rng.uniform(0, 1) < threshold:
+            return None  # Driver does not enter this event
+
+    if has_flag(team.status_flags, 'Limited') and event != 'Premier' and rng.uniform(0, 1) < 0.66:
+        return None  # Driver does not enter this event
+
+    if has_flag(team.status_flags, 'Guest') and rng.uniform(0, 1) < 0.925:
+        return None  # Driver does not enter this event
+
+    # For Premier contract, ensure they participate in "Premier" events
+    if has_flag(team.status_flags, 'Premier') and event != 'Premier' and rng.uniform(0, 1) < 0.975:
+        return None  # Driver does not enter this event
+
+    stats = calculate_effective_stats(driver, team, weather_condition, discipline, circuit_type, difficulty, sorted_schedule, race, practice_sessions, rng)
+
+    driver.fantastic_qualifying = False  # Reset fantastic_qualifying attribute
+    driver.shocking_qualifying = False  # Reset shocking_qualifying attribute
+    driver.fantastic_race = False
+    driver.shocking_race = False
+
+    randomness = rng.uniform(-0.05, 0.05)
+    fantastic_chance = 0.0075
+    shocking_chance = 0.015
+
+    fantastic_chance += (stats.speed / 10000)
+    shocking_chance += ((100 - stats.speed) / 10000)
+
+    if has_flag(team.status_flags, 'R/D') and rng.uniform(0, 1) < 0.5:
+        fantastic_chance *= 1.1
+        shocking_chance *= 1.25
+
+    if team.strategist == "Terrible":
+        fantastic_chance *= rng.uniform(0.875, 0.925)
+        shocking_chance *= rng.uniform(1.075, 1.125)
+    elif team.strategist == "Poor":
+        fantastic_chance *= rng.uniform(0.925, 0.975)
+        shocking_chance *= rng.uniform(1.025, 1.075)
+    elif team.strategist == "Great":
+        fantastic_chance *= rng.uniform(1.025, 1.075)
+        shocking_chance *= rng.uniform(0.925, 0.975)
+    elif team.strategist == "Excellent":
+        fantastic_chance *= rng.uniform(1.075, 1.125)
+        shocking_chance *= rng.uniform(0.875, 0.925)
+
+    if weather_condition == 'Clear':
+        randomness = rng.uniform(-0.05, 0.05)
+        if rng.uniform(0, 1) < fantastic_chance:
+            driver.fantastic_qualifying = True
+        if rng.uniform(0, 1) < shocking_chance:
+            driver.shocking_qualifying = True
+
+    elif weather_condition == 'Rainy':
+        randomness = rng.uniform(-0.15, 0.15)
+        if rng.uniform(0, 1) < (fantastic_chance * 2.5):
+            driver.fantastic_qualifying = True
+        if rng.uniform(0, 1) < (shocking_chance * 2.5):
+            driver.shocking_qualifying = True
+
+    elif weather_condition == 'Overcast':
+        if rng.uniform(0, 1) < fantastic_chance:
+            driver.fantastic_qualifying = True
+        if rng.uniform(0, 1) < (shocking_chance * 0.5):
+            driver.shocking_qualifying = True
+
+    elif weather_condition == 'Hot':
+        if rng.uniform(0, 1) < (fantastic_chance * 0.5):
+            driver.fantastic_qualifying = True
+        if rng.uniform(0, 1) < (shocking_chance * 1.5):
+            driver.shocking_qualifying = True
+
+    else:
+        randomness = rng.uniform(-0.2, 0.2)
+        if rng.uniform(0, 1) < (fantastic_chance * 5):
+            driver.fantastic_qualifying = True
+        if rng.uniform(0, 1) < (shocking_chance * 5):
+            driver.shocking_qualifying = True
+
+    special_modifier = 1
+    if driver.fantastic_qualifying:
+        # DEBUG print(f"{driver.name} Fantastic Qualifying")
+        if rng.uniform(0, 1) < 0.75:
+            special_modifier *= 1.25
+            if rng.uniform(0, 1) < 0.5:
+                # DEBUG print(f"{driver.name} Even More Fantastic (Q)")
                 special_modifier *= 1.25
-                if random.uniform(0, 1) < 0.5:
-                    # DEBUG print(f"{driver.name} Even More Fantastic (Q)")
+                if rng.uniform(0, 1) < 0.25:
+                    # DEBUG print(f"{driver.name} EVEN MORE FANTASTIC")
                     special_modifier *= 1.25
-                    if random.uniform(0, 1) < 0.25:
-                        # DEBUG print(f"{driver.name} EVEN MORE FANTASTIC")
-                        special_modifier *= 1.25
-            else:
-                special_modifier *= 1.25
+        else:
+            special_modifier *= 1.25
 
-        if driver.shocking_qualifying:
-            # DEBUG print(f"{driver.name} Shocking Qualifying")
-            if random.uniform(0, 1) < 0.75:
+    if driver.shocking_qualifying:
+        # DEBUG print(f"{driver.name} Shocking Qualifying")
+        if rng.uniform(0, 1) < 0.75:
+            special_modifier *= 0.75
+            if rng.uniform(0, 1) < 0.5:
+                # DEBUG print(f"{driver.name} Even More Shocking (Q)")
                 special_modifier *= 0.75
-                if random.uniform(0, 1) < 0.5:
-                    # DEBUG print(f"{driver.name} Even More Shocking (Q)")
+                if rng.uniform(0, 1) < 0.25:
+                    # DEBUG print(f"{driver.name} EVEN MORE SHOCKING")
                     special_modifier *= 0.75
-                    if random.uniform(0, 1) < 0.25:
-                        # DEBUG print(f"{driver.name} EVEN MORE SHOCKING")
-                        special_modifier *= 0.75
-            else:
-                special_modifier *= 0.75
+        else:
+            special_modifier *= 0.75
 
-        if circuit_type in ['Superspeedway']:
-            randomness *= 1.25
-        elif circuit_type in ['Speedway']:
-            randomness *= 1.2
-        elif circuit_type in ['Mile Oval']:
-            randomness *= 1.15
-        elif circuit_type in ['Short Track']:
-            randomness *= 1.1
+    if circuit_type in ['Superspeedway']:
+        randomness *= 1.25
+    elif circuit_type in ['Speedway']:
+        randomness *= 1.2
+    elif circuit_type in ['Mile Oval']:
+        randomness *= 1.15
+    elif circuit_type in ['Short Track']:
+        randomness *= 1.1
 
-        if discipline == 'StockCar':
-            randomness *= 1.15
+    if discipline == 'StockCar':
+        randomness *= 1.15
 
-        random_factor = 1 + (randomness * 2)
+    random_factor = 1 + (randomness * 2)
 
-        if any(trait in driver.traits for trait in ['QualifyingSpecialist']):
-            driver.speed *= 1.1
-            driver.skill *= 1.1
+    speed = stats.speed
+    skill = stats.skill
 
-        qualifying_result = (((driver.speed + (driver.skill / 2) + (driver.bravery / 10)) * 0.75) * special_modifier) + team.performance + team.power
-        qualifying_result *= random_factor
-        qualifying_results.append(qualifying_result)
+    if has_flag(driver.trait_flags, 'QualifyingSpecialist'):
+        speed *= 1.1
+        skill *= 1.1
 
-        # Reset the driver's skill to its original value
-        driver.skill = original_skill
-        driver.speed = original_speed
+    qualifying_result = (((speed + (skill / 2) + (driver.bravery / 10)) * 0.75) * special_modifier) + stats.performance + stats.power
+    qualifying_result *= random_factor
 
-    if not qualifying_results:  # If no drivers qualified, return None
-        return None
+    return stats, qualifying_result
+
+def simulate_grid_qualifying(teams, weather_condition, discipline, event, grid_size, circuit_type, standings_data, track_speed, track_characteristics, sorted_schedule, race, practice_sessions, difficulty, rng=random):
+    # Every entrant runs exactly once, then the grid and DNQ list are built from the single sorted pass
+    qualifying_results = {}
+    effective_stats = {}
+    for team in teams.values():
+        for driver in team.drivers:
+            result = simulate_qualifying(driver, team, weather_condition, discipline, event, circuit_type, standings_data, track_speed, track_characteristics, sorted_schedule, race, practice_sessions, difficulty, rng)
 
-    # Sort the qualifying results in descending order
-    qualifying_results.sort(reverse=True)
+            if result is not None:  # Skip drivers who did not enter
+                stats, qualifying_time = result
+                qualifying_results[(team.name, driver.name)] = (driver, qualifying_time)
+                effective_stats[(team.name, driver.name)] = stats
+
+    # Sort qualifying results and DNQ results separately based on the times
+    sorted_qualifying_results = sorted(qualifying_results.items(), key=lambda x: x[1][1], reverse=True)
+
+    # Apply grid size limit
+    dnq_results = sorted_qualifying_results[grid_size:]
+    sorted_qualifying_results = sorted_qualifying_results[:grid_size]
+
+    # Ensure drivers with empty team.charter are in sorted_qualifying_results
+    for driver in dnq_results[:]:
+        team_name, driver_name = driver[0]
+        team = teams[team_name]
+        if team.charter == "TRUE":
+            # Move driver to sorted_qualifying_results
+            sorted_qualifying_results.append(driver)
+            dnq_results.remove(driver)
+
+    # Ensure grid size limit is maintained
+    while len(sorted_qualifying_results) > grid_size:
+        # Move the lowest driver to dnq_results, but ensure drivers with empty team.charter are not moved
+        for i in range(len(sorted_qualifying_results) - 1, -1, -1):
+            team_name, driver_name = sorted_qualifying_results[i][0]
+            team = teams[team_name]
+            if team.charter != "TRUE":
+                dnq_results.append(sorted_qualifying_results.pop(i))
+                break
 
-    # Drivers who qualify outside of the grid size DNQ
-    qualified_drivers = qualifying_results[:grid_size]
-    dnq_drivers = qualifying_results[grid_size:]
+    # Sort the DNQ results by time
+    dnq_results = sorted(dnq_results, key=lambda x: x[1][1], reverse=True)
 
-    return qualified_drivers, dnq_drivers
+    return sorted_qualifying_results, dnq_results, effective_stats
 
-def simulate_race(driver, team, starting_position, weather_condition, discipline, circuit_type, qualifying_results, sorted_qualifying_results, track_characteristics, iteration, iterations):
+def simulate_race(driver, team, stats, starting_position, weather_condition, discipline, circuit_type, qualifying_results, sorted_qualifying_results, track_flags, iteration, iterations, rng=random):
     # Reset qualifying attributes for the race simulation
     driver.fantastic_qualifying = False  # Reset fantastic_qualifying attribute
     driver.shocking_qualifying = False  # Reset shocking_qualifying attribute
 
-    original_performance = team.performance
-    original_power = team.power
-
     adjusted_tire_effect = 1 - (1 - driver.tire_condition) * 0.25
-    team.performance *= adjusted_tire_effect
-    team.power *= adjusted_tire_effect
-
-    race_trait_modifier(driver, starting_position, qualifying_results, track_characteristics, iteration)
+    performance = stats.performance * adjusted_tire_effect
+    power = stats.power * adjusted_tire_effect
 
     pitstop = 0
 
     if driver.tire_condition < 0.5:
-        pitstop = simulate_pitstop(team)
+        pitstop = simulate_pitstop(team, rng)
         # DEBUG print(f"Iteration {iteration + 1} | {driver.name} Pitstop: {pitstop}")
+        if race_metrics is not None:
+            race_metrics.count("pit_stops")
         driver.tire_condition = 1.0  # Reset tire condition after pitstop
 
     if not team.drivers:
         # If there are no drivers in the team, return a performance score of 0
         return 0
 
-    if simulate_crash(driver, iterations) == "Crash":
+    if simulate_crash(driver, stats, iterations, rng) == "Crash":
         driver.dnf = "Crash"
         # If the driver crashes, return a performance score of 0
         return 0
 
-    if simulate_retirement(driver, team, starting_position, qualifying_results, iteration, iterations) == "Retirement":
+    if simulate_retirement(driver, team, stats, starting_position, qualifying_results, iteration, iterations, rng) == "Retirement":
         driver.dnf = "Retirement"
         # If the driver encounters a mechanical issue, return a performance score of 0
         return 0
 
-    # Store the original skill value
-    original_skill = driver.skill
-    original_speed = driver.speed
-
     # Progressive fitness impact
     progress_factor = iteration / iterations  # from 0.0 (start) to almost 1.0 (end)
     fitness_effect = 1 - (1 - driver.fitness) * progress_factor
-    driver.skill *= fitness_effect
-    driver.speed *= fitness_effect
+    skill = stats.skill * fitness_effect
+    speed = stats.speed * fitness_effect
 
-    randomness = random.uniform(-0.05, 0.05)
+    randomness = rng.uniform(-0.05, 0.05)
     fantastic_chance = 0.0075
     shocking_chance = 0.015
 
     race_strategy = 0
 
-    if any(t_characteristic in track_characteristics for t_characteristic in ['Chaotic']):
+    if has_flag(track_flags, 'Chaotic'):
         fantastic_chance *= 1.1
         shocking_chance *= 1.1
 
-    if any(t_characteristic in track_characteristics for t_characteristic in ['Tame']):
+    if has_flag(track_flags, 'Tame'):
         fantastic_chance *= 0.9
         shocking_chance *= 0.9
 
-    fantastic_chance += (driver.skill / 10000) - ((1 - team.reliability) / 1000)
-    shocking_chance += ((100 - driver.skill) / 10000) + ((1 - team.reliability) / 1000)
+    fantastic_chance += (skill / 10000) - ((1 - stats.reliability) / 1000)
+    shocking_chance += ((100 - skill) / 10000) + ((1 - stats.reliability) / 1000)
 
     if team.strategist == "Terrible":
-        fantastic_chance *= random.uniform(0.875, 0.925)
-        shocking_chance *= random.uniform(1.075, 1.125)
-        strategy_value = random.uniform(0, 1)
+        fantastic_chance *= rng.uniform(0.875, 0.925)
+        shocking_chance *= rng.uniform(1.075, 1.125)
+        strategy_value = rng.uniform(0, 1)
         if strategy_value > 0.9:
-            race_strategy = random.uniform(0.1, 0.2)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(0.1, 0.2)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 1.1
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 0.9
         elif strategy_value < 0.3:
-            race_strategy = random.uniform(-0.3, -0.2)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.3, -0.2)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
         else:
-            race_strategy = random.uniform(-0.2, -0.15)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.2, -0.15)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
 
     if team.strategist == "Poor":
-        fantastic_chance *= random.uniform(0.925, 0.975)
-        shocking_chance *= random.uniform(1.025, 1.075)
-        strategy_value = random.uniform(0, 1)
+        fantastic_chance *= rng.uniform(0.925, 0.975)
+        shocking_chance *= rng.uniform(1.025, 1.075)
+        strategy_value = rng.uniform(0, 1)
         if strategy_value > 0.9:
-            race_strategy = random.uniform(0.15, 0.25)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(0.15, 0.25)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 1.1
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 0.9
         elif strategy_value < 0.3:
-            race_strategy = random.uniform(-0.25, -0.15)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.25, -0.15)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
         else:
-            race_strategy = -random.uniform(-0.15, -0.05)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = -rng.uniform(-0.15, -0.05)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
 
     if team.strategist == "Fair":
-        strategy_value = random.uniform(0, 1)
+        strategy_value = rng.uniform(0, 1)
         if strategy_value > 0.75:
-            race_strategy = random.uniform(0.18, 0.28)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(0.18, 0.28)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 1.1
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 0.9
         elif strategy_value < 0.25:
-            race_strategy = random.uniform(-0.22, -0.12)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.22, -0.12)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
         else:
-            race_strategy = -random.uniform(-0.12, -0.02)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = -rng.uniform(-0.12, -0.02)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
 
     if team.strategist == "Great":
-        fantastic_chance *= random.uniform(1.025, 1.075)
-        shocking_chance *= random.uniform(0.925, 0.975)
-        strategy_value = random.uniform(0, 1)
+        fantastic_chance *= rng.uniform(1.025, 1.075)
+        shocking_chance *= rng.uniform(0.925, 0.975)
+        strategy_value = rng.uniform(0, 1)
         if strategy_value > 0.7:
-            race_strategy = random.uniform(0.2, 0.3)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(0.2, 0.3)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 1.1
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 0.9
         elif strategy_value < 0.1:
-            race_strategy = random.uniform(-0.2, -0.1)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.2, -0.1)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
         else:
-            race_strategy = random.uniform(-0.1, 0)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.1, 0)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
 
     if team.strategist == "Excellent":
-        fantastic_chance *= random.uniform(1.075, 1.125)
-        shocking_chance *= random.uniform(0.875, 0.925)
-        strategy_value = random.uniform(0, 1)
+        fantastic_chance *= rng.uniform(1.075, 1.125)
+        shocking_chance *= rng.uniform(0.875, 0.925)
+        strategy_value = rng.uniform(0, 1)
         if strategy_value > 0.7:
-            race_strategy = random.uniform(0.25, 0.35)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(0.25, 0.35)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 1.1
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 0.9
         elif strategy_value < 0.1:
-            race_strategy = random.uniform(-0.15, -0.05)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.15, -0.05)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
         else:
-            race_strategy = random.uniform(-0.05, 0)
-            if any(trait in driver.traits for trait in ['Strategist']):
+            race_strategy = rng.uniform(-0.05, 0)
+            if has_flag(driver.trait_flags, 'Strategist'):
                 race_strategy *= 0.9
-            if any(trait in driver.traits for trait in ['PoorCommunicator']):
+            if has_flag(driver.trait_flags, 'PoorCommunicator'):
                 race_strategy *= 1.1
 
     if weather_condition == 'Clear':
-        randomness = random.uniform(-0.05, 0.05)
-        if random.uniform(0, 1) < fantastic_chance:  # Chance for fantastic race
+        randomness = rng.uniform(-0.05, 0.05)
+        if rng.uniform(0, 1) < fantastic_chance:  # Chance for fantastic race
             driver.fantastic_race = True
-        if random.uniform(0, 1) < shocking_chance:  # Chance for shocking race
+        if rng.uniform(0, 1) < shocking_chance:  # Chance for shocking race
             driver.shocking_race = True
 
     elif weather_condition == 'Rainy':
         race_strategy *= 1.25
-        randomness = random.uniform(-0.15, 0.15)
-        if random.uniform(0, 1) < (fantastic_chance * 2.5):  # Chance for fantastic race
+        randomness = rng.uniform(-0.15, 0.15)
+        if rng.uniform(0, 1) < (fantastic_chance * 2.5):  # Chance for fantastic race
             driver.fantastic_race = True
-        if random.uniform(0, 1) < (shocking_chance * 2.5):  # Chance for shocking race
+        if rng.uniform(0, 1) < (shocking_chance * 2.5):  # Chance for shocking race
             driver.shocking_race = True
 
     elif weather_condition == 'Overcast':
-        if random.uniform(0, 1) < fantastic_chance:  # Chance for fantastic race
+        if rng.uniform(0, 1) < fantastic_chance:  # Chance for fantastic race
             driver.fantastic_race = True
-        if random.uniform(0, 1) < (shocking_chance * 0.5):  # Chance for shocking race
+        if rng.uniform(0, 1) < (shocking_chance * 0.5):  # Chance for shocking race
             driver.shocking_race = True
 
     elif weather_condition == 'Hot':
-        if random.uniform(0, 1) < (fantastic_chance * 0.5):  # Chance for fantastic race
+        if rng.uniform(0, 1) < (fantastic_chance * 0.5):  # Chance for fantastic race
             driver.fantastic_race = True
-        if random.uniform(0, 1) < (shocking_chance * 1.5):  # Chance for shocking race
+        if rng.uniform(0, 1) < (shocking_chance * 1.5):  # Chance for shocking race
             driver.shocking_race = True
 
     else:
         race_strategy *= 1.5
-        randomness = random.uniform(-0.2, 0.2)
-        if random.uniform(0, 1) < (fantastic_chance * 5):  # Chance for fantastic race
+        randomness = rng.uniform(-0.2, 0.2)
+        if rng.uniform(0, 1) < (fantastic_chance * 5):  # Chance for fantastic race
             driver.fantastic_race = True
-        if random.uniform(0, 1) < (shocking_chance * 5):  # Chance for shocking race
+        if rng.uniform(0, 1) < (shocking_chance * 5):  # Chance for shocking race
             driver.shocking_race = True
 
     special_modifier = 1
     if driver.fantastic_race:
         # DEBUG print(f"{driver.name} Fantastic Race")
-        if random.uniform(0, 1) < 0.75:
+        if rng.uniform(0, 1) < 0.75:
             special_modifier *= 1.25
-            if random.uniform(0, 1) < 0.5:
+            if rng.uniform(0, 1) < 0.5:
                 # DEBUG print(f"{driver.name} Even More Fantastic Race")
                 special_modifier *= 1.25
-                if random.uniform(0, 1) < 0.25:
+                if rng.uniform(0, 1) < 0.25:
                     # DEBUG print(f"{driver.name} EVEN MORE FANTASTIC RACE")
                     special_modifier *= 1.25
         else:
@@ -998,12 +1258,12 @@ def simulate_race(driver, team, starting_position, weather_condition, discipline
 
     if driver.shocking_race:
         # DEBUG print(f"{driver.name} Shocking Race")
-        if random.uniform(0, 1) < 0.75:
+        if rng.uniform(0, 1) < 0.75:
             special_modifier *= 0.75
-            if random.uniform(0, 1) < 0.5:
+            if rng.uniform(0, 1) < 0.5:
                 # DEBUG print(f"{driver.name} Even More Shocking Race")
                 special_modifier *= 0.75
-                if random.uniform(0, 1) < 0.25:
+                if rng.uniform(0, 1) < 0.25:
                     # DEBUG print(f"{driver.name} EVEN MORE SHOCKING RACE")
                     special_modifier *= 0.75
         else:
@@ -1035,86 +1295,79 @@ def simulate_race(driver, team, starting_position, weather_condition, discipline
     if discipline == 'StockCar':
         randomness *= 1.15
     
-    if any(t_characteristic in track_characteristics for t_characteristic in ['Tame']):
+    if has_flag(track_flags, 'Tame'):
         randomness *= 0.95
     
-    if any(t_characteristic in track_characteristics for t_characteristic in ['Chaotic']):
+    if has_flag(track_flags, 'Chaotic'):
         randomness *= 1.05
 
     if iteration == 0:
-        if any(trait in driver.traits for trait in ['QualifyingSpecialist']):
-            driver.speed *= 0.9
-            driver.skill *= 0.9
+        if has_flag(driver.trait_flags, 'QualifyingSpecialist'):
+            speed *= 0.9
+            skill *= 0.9
     
     random_factor = 1 + (randomness * 2)
 
     strategy_factor = 1 + race_strategy / iterations
 
-    race_result = ((((driver.speed / 2) + driver.skill) * 0.75) * special_modifier) + team.performance + team.power
+    race_result = ((((speed / 2) + skill) * 0.75) * special_modifier) + performance + power
     race_result *= strategy_factor # Apply strategy factor
     race_result *= random_factor # Apply randomness
     race_result *= position_factor # Better starting position gives a performance boost
     if pitstop != 0:
         race_result *= pitstop
 
-    # Reset the driver's skill to its original value
-    driver.skill = original_skill
-    driver.speed = original_speed
-
-    team.performance = original_performance
-    team.power = original_power
-
     driver.fantastic_race = False
     driver.shocking_race = False
 
-    driver.tire_condition -= random.uniform(0.1, 0.2)
+    driver.tire_condition -= rng.uniform(0.1, 0.2)
 
     return race_result
 
-def simulate_pitstop(team):
+def simulate_pitstop(team, rng=random):
     # Simulate a pit stop based on driver skill and team performance
     pitstop_base = 0.5
 
     if team.pitcrew == "Terrible":
-        pitstop = pitstop_base * random.uniform(0.875, 0.925)
+        pitstop = pitstop_base * rng.uniform(0.875, 0.925)
         mistake_chance = 0.075
     elif team.pitcrew == "Poor":
-        pitstop = pitstop_base * random.uniform(0.9, 0.95)
+        pitstop = pitstop_base * rng.uniform(0.9, 0.95)
         mistake_chance = 0.06
     elif team.pitcrew == "Fair":
-        pitstop = pitstop_base * random.uniform(0.925, 0.975)
+        pitstop = pitstop_base * rng.uniform(0.925, 0.975)
         mistake_chance = 0.045
     elif team.pitcrew == "Great":
-        pitstop = pitstop_base * random.uniform(0.95, 1.0)
+        pitstop = pitstop_base * rng.uniform(0.95, 1.0)
         mistake_chance = 0.03
     elif team.pitcrew == "Excellent":
-        pitstop = pitstop_base * random.uniform(0.975, 1.025)
+        pitstop = pitstop_base * rng.uniform(0.975, 1.025)
         mistake_chance = 0.015
     
-    if random.uniform(0, 1) < mistake_chance:
+    if rng.uniform(0, 1) < mistake_chance:
         # Simulate a pit stop mistake
-        pitstop *= random.uniform(0.25, 0.5)
+        pitstop *= rng.uniform(0.25, 0.5)
 
     return pitstop
 
-def simulate_retirement(driver, team, starting_position, qualifying_results, iteration, iterations):
+def simulate_retirement(driver, team, stats, starting_position, qualifying_results, iteration, iterations, rng=random):
     num_drivers = len(qualifying_results)
     top_30 = int(num_drivers * 0.3)
 
     # Clamp team.reliability to be at most 0.99
-    reliability = min(team.reliability, 0.99)
+    reliability = min(stats.reliability, 0.99)
     threshold = 0.8
 
     race_wear = 1 - (iteration / iterations)
 
-    if any(status in team.status for status in ['Start/Park']) and starting_position > top_30:
+    if has_flag(team.status_flags, 'Start/Park') and starting_position > top_30:
         reliability *= 0.1
         threshold *= 0.1
 
-    if team.status != "Start/Park":
-        if random.uniform(0, 1) > reliability:
-            if random.uniform(0, 1) > race_wear:
-                if random.uniform(0, 1) > threshold:
+    if not has_flag(team.status_flags, 'Start/Park'):
+        if rng.uniform(0, 1) > reliability:
+            if rng.uniform(0, 1) > race_wear:
+                if rng.uniform(0, 1) > threshold:
                     return "Retirement"
                 else:
                     return ""
@@ -1123,25 +1376,25 @@ def simulate_retirement(driver, team, starting_position, qualifying_results, ite
         else:
             return ""
     else:
-        if random.uniform(0, 1) > reliability:
-            if random.uniform(0, 1) > threshold:
+        if rng.uniform(0, 1) > reliability:
+            if rng.uniform(0, 1) > threshold:
                 return "Retirement"
             else:
                 return ""
         else:
             return ""
 
-def simulate_crash(driver, iterations):
-    speed_vs_skill_difference = 1 + ((driver.skill - driver.speed) / 100)
-    skill_vs_bravery_difference = 1 + ((driver.skill - driver.bravery) / 100)
-    skill_probability = min((driver.skill * speed_vs_skill_difference * (skill_vs_bravery_difference)) / 100, 0.99)
+def simulate_crash(driver, stats, iterations, rng=random):
+    speed_vs_skill_difference = 1 + ((stats.skill - stats.speed) / 100)
+    skill_vs_bravery_difference = 1 + ((stats.skill - driver.bravery) / 100)
+    skill_probability = min((stats.skill * speed_vs_skill_difference * (skill_vs_bravery_difference)) / 100, 0.99)
 
     iteration_factor = 1 - (1 / iterations)
 
     # Compare random values with probabilities derived from driver skill and crash probability
-    if random.uniform(0, 1) > skill_probability:
-        if random.uniform(0, 1) > 0.925:
-            if random.uniform(0, 1) > iteration_factor:
+    if rng.uniform(0, 1) > skill_probability:
+        if rng.uniform(0, 1) > 0.925:
+            if rng.uniform(0, 1) > iteration_factor:
                 return "Crash"
             else:
                 return ""
@@ -1150,10 +1403,12 @@ def simulate_crash(driver, iterations):
     else:
         return ""
 
-def simulate_overtakes_blocks_clean_air(driver, team, teams, starting_position, new_race_results, iteration, iterations):
+def simulate_overtakes_blocks_clean_air(driver, team, stats, registry, starting_position, new_race_results, iteration, iterations, rng=random):
     race_result_mod = 0.0
     failure_collided_drivers = []
     num_drivers = len(new_race_results)
+    overtakes_attempted = 0
+    blocks_attempted = 0
 
     # Overtake logic (can't happen in 1st place)
     if 1 < starting_position < num_drivers:
@@ -1163,46 +1418,45 @@ def simulate_overtakes_blocks_clean_air(driver, team, teams, starting_position,
         ahead_indices = [i for i in range(max(0, starting_position - 6), starting_position - 1)]
         # Weight for number of overtakes (favor fewer)
         overtake_weights = [0.5, 0.3, 0.15, 0.05, 0.025]
-        if any(trait in driver.traits for trait in ['Aggressive']):
+        if has_flag(driver.trait_flags, 'Aggressive'):
             overtake_weights = [0.45, 0.25, 0.15, 0.1, 0.075]
-        if any(trait in driver.traits for trait in ['Cautious']):
+        if has_flag(driver.trait_flags, 'Cautious'):
             overtake_weights = [0.55, 0.35, 0.15, 0.025, 0.01]
-        num_overtakes = random.choices(range(1, min(6, len(ahead_indices)+1)), weights=overtake_weights[:len(ahead_indices)], k=1)[0]
-        overtakes_attempted = 0
+        num_overtakes = rng.choices(range(1, min(6, len(ahead_indices)+1)), weights=overtake_weights[:len(ahead_indices)], k=1)[0]
         for idx in reversed(ahead_indices[-num_overtakes:]):
             other_team_name, other_driver_name, other_result = new_race_results[idx]
-            perf_adv = (team.performance + team.power) - other_result
+            perf_adv = (stats.performance + stats.power) - other_result
             bravery_factor = driver.bravery
             # Higher chance if performance advantage and bravery are high
             overtake_chance = 0.15 * mid_factor + 0.25 * max(0, perf_adv / 100) + 0.6 * (bravery_factor / 100)
-            if any(trait in driver.traits for trait in ['GreatOvertaker']):
+            if has_flag(driver.trait_flags, 'GreatOvertaker'):
                 overtake_chance *= 1.1
-            if any(trait in driver.traits for trait in ['PoorOvertaker']):
+            if has_flag(driver.trait_flags, 'PoorOvertaker'):
                 overtake_chance *= 0.9
             overtake_chance = min(overtake_chance, 0.85)
             # Success/failure
-            skill_factor = 0.2 * (driver.skill / 100)
-            speed_factor = 0.1 * (driver.speed / 100)
+            skill_factor = 0.2 * (stats.skill / 100)
+            speed_factor = 0.1 * (stats.speed / 100)
             success_chance = overtake_chance + skill_factor + speed_factor
-            roll = random.uniform(0, 1)
+            roll = rng.uniform(0, 1)
             if roll < success_chance:
                 race_result_mod += 0.025  # Successful overtake
             else:
                 race_result_mod -= 0.01  # Failed overtake
-                if random.uniform(0, 1) < 0.01:
+                if rng.uniform(0, 1) < 0.01:
                     # Critical failure: collision
                     # DEBUG print(f"Collision between {driver.name} and {other_driver_name} (overtake)")
-                    if random.uniform(0, 1) < 0.75:
+                    if race_metrics is not None:
+                        race_metrics.count("collisions")
+                    if rng.uniform(0, 1) < 0.75:
                         driver.dnf = "Collision"
                         failure_collided_drivers.append(driver.name)
-                    if random.uniform(0, 1) < 0.5:
-                        # Find the actual Driver object from the teams dictionary
-                        for team in teams.values():
-                            driver_obj = next((d for d in team.drivers if d.name == other_driver_name), None)
-                            if driver_obj:
-                                driver_obj.dnf = "Collision"
-                                failure_collided_drivers.append(other_driver_name)
-                                break
+                    if rng.uniform(0, 1) < 0.5:
+                        # Find the actual Driver object from the registry
+                        entry = registry.get((other_team_name, other_driver_name))
+                        if entry:
+                            entry[1].dnf = "Collision"
+                            failure_collided_drivers.append(other_driver_name)
             overtakes_attempted += 1
 
     # Block logic (can't happen in last place)
@@ -1212,40 +1466,40 @@ def simulate_overtakes_blocks_clean_air(driver, team, teams, starting_position,
         # Check cars behind
         behind_indices = [i for i in range(starting_position, min(num_drivers, starting_position + 5))]
         block_weights = [0.5, 0.3, 0.15, 0.05, 0.025]
-        num_blocks = random.choices(range(1, min(6, len(behind_indices)+1)), weights=block_weights[:len(behind_indices)], k=1)[0]
-        blocks_attempted = 0
+        num_blocks = rng.choices(range(1, min(6, len(behind_indices)+1)), weights=block_weights[:len(behind_indices)], k=1)[0]
         for idx in behind_indices[:num_blocks]:
             other_team_name, other_driver_name, other_result = new_race_results[idx]
-            perf_disadv = other_result - (team.performance + team.power)
-            skill_factor = driver.skill
+            perf_disadv = other_result - (stats.performance + stats.power)
+            skill_factor = stats.skill
             # Higher chance if performance disadvantage and skill are high
             block_chance = 0.15 * mid_factor + 0.25 * max(0, perf_disadv / 100) + 0.6 * (skill_factor / 100)
-            if any(trait in driver.traits for trait in ['GreatBlocker']):
+            if has_flag(driver.trait_flags, 'GreatBlocker'):
                 block_chance *= 1.1
-            if any(trait in driver.traits for trait in ['PoorBlocker']):
+            if has_flag(driver.trait_flags, 'PoorBlocker'):
                 block_chance *= 0.9
             block_chance = min(block_chance, 0.85)
             bravery_factor = 0.2 * (driver.bravery / 100)
             success_chance = block_chance + bravery_factor
-            roll = random.uniform(0, 1)
+            roll = rng.uniform(0, 1)
             if roll < success_chance:
                 race_result_mod += 0.0  # Successful block
             else:
                 race_result_mod -= 0.025  # Failed block
-                if random.uniform(0, 1) < 0.01:
+                if rng.uniform(0, 1) < 0.01:
                     # Critical failure: collision
                     # DEBUG print(f"Collision between {driver.name} and {other_driver_name} (block)")
-                    if random.uniform(0, 1) < 0.75:
+                    if race_metrics is not None:
+                        race_metrics.count("collisions")
+                    if rng.uniform(0, 1) < 0.75:
                         driver.dnf = "Collision"
                         failure_collided_drivers.append(driver.name)
-                    if random.uniform(0, 1) < 0.5:
-                        # Find the actual Driver object from the teams dictionary
-                        for team in teams.values():
-                            driver_obj = next((d for d in team.drivers if d.name == other_driver_name), None)
-                            if driver_obj:
-                                driver_obj.dnf = "Collision"
-                                failure_collided_drivers.append(other_driver_name)
-                                break
+                    if rng.uniform(0, 1) < 0.5:
+                        # Find the actual Driver object from the registry
+                        entry = registry.get((other_team_name, other_driver_name))
+                        if entry:
+                            entry[1].dnf = "Collision"
+                            failure_collided_drivers.append(other_driver_name)
+                    blocks_attempted += 1
                     break
             blocks_attempted += 1
 
@@ -1255,42 +1509,47 @@ def simulate_overtakes_blocks_clean_air(driver, team, teams, starting_position,
 
     # Chance that clean air effect even happens at all
     activation_chance = 0.5 * spread_factor + 0.5 * fringe_factor
-    if random.uniform(0, 1) < activation_chance:
+    if rng.uniform(0, 1) < activation_chance:
         clean_air_chance = 0.5 * fringe_factor + 0.5 * spread_factor
 
-        if any(trait in driver.traits for trait in ['GreatInCleanAir']):
+        if has_flag(driver.trait_flags, 'GreatInCleanAir'):
             clean_air_chance *= 1.1
-        if any(trait in driver.traits for trait in ['PoorInCleanAir']):
+        if has_flag(driver.trait_flags, 'PoorInCleanAir'):
             clean_air_chance *= 0.9
 
         clean_air_chance = min(clean_air_chance, 0.95)
 
-        speed_factor = 0.7 * (driver.speed / 100)
-        skill_factor = 0.2 * (driver.skill / 100)
+        speed_factor = 0.7 * (stats.speed / 100)
+        skill_factor = 0.2 * (stats.skill / 100)
 
         success_chance = clean_air_chance + speed_factor + skill_factor
-        roll = random.uniform(0, 1)
+        roll = rng.uniform(0, 1)
 
         if roll < success_chance:
             race_result_mod += 0.015  # Successful clean air
         else:
             race_result_mod -= 0.015  # Failed clean air
 
+    if race_metrics is not None:
+        race_metrics.count("overtake_attempts", overtakes_attempted)
+        race_metrics.count("block_attempts", blocks_attempted)
+
     return race_result_mod, failure_collided_drivers
 
-def simulate_collision(new_race_results, teams, iterations):
+def simulate_collision(new_race_results, registry, effective_stats, iterations, rng=random):
     # List to store the drivers involved in collisions
     collided_drivers = []
 
     # Iterate over the sorted race results to check for proximity and collision chances
     for i, (team_name, driver_name, race_result) in enumerate(new_race_results):
         # Find the driver object corresponding to the driver_name
-        team = next((team for team in teams.values() if team.name == team_name), None)
-        driver = next((driver for driver in team.drivers if driver.name == driver_name), None) if team else None
+        entry = registry.get((team_name, driver_name))
 
-        if not driver:
+        if not entry:
             continue  # Skip if the driver object is not found
 
+        driver = entry[1]
+
         # Proximity threshold: Assume a driver is at risk of collision if they are within 3 positions
         proximity_candidates = []
 
@@ -1302,36 +1561,509 @@ def simulate_collision(new_race_results, teams, iterations):
         if proximity_candidates:
             num_collisions = min(4, len(proximity_candidates))
             weights = [0.5, 0.2, 0.1, 0.05][:num_collisions]
-            selected_js = random.sample(proximity_candidates, k=random.choices(range(1, num_collisions + 1), weights=weights)[0])
+            selected_js = rng.sample(proximity_candidates, k=rng.choices(range(1, num_collisions + 1), weights=weights)[0])
 
             for selected_j in selected_js:
                 other_team_name, other_driver_name, _ = new_race_results[selected_j]
-                other_team = next((team for team in teams.values() if team.name == other_team_name), None)
-                other_driver = next((driver for driver in other_team.drivers if driver.name == other_driver_name), None) if other_team else None
+                other_entry = registry.get((other_team_name, other_driver_name))
 
-                if not other_driver:
+                if not other_entry:
                     continue  # Skip if the other driver object is not found
 
+                other_driver = other_entry[1]
+
                 # Simulate a collision chance
-                speed_vs_skill_difference = 1 + ((driver.skill - driver.speed) / 100)
-                skill_probability = min((driver.skill * speed_vs_skill_difference) / 100, 0.99)
+                stats = effective_stats[(team_name, driver_name)]
+                speed_vs_skill_difference = 1 + ((stats.skill - stats.speed) / 100)
+                skill_probability = min((stats.skill * speed_vs_skill_difference) / 100, 0.99)
 
                 iteration_factor = 1 - (1 / iterations)
 
                 # If a collision occurs (chance is met), mark both drivers as involved
-                if random.uniform(0, 1) > min(driver.skill / 100, 0.999) and random.uniform(0, 1) > skill_probability:
-                    if random.uniform(0, 1) > 0.99:
-                        if random.uniform(0, 1) > iteration_factor:
+                if rng.uniform(0, 1) > min(stats.skill / 100, 0.999) and rng.uniform(0, 1) > skill_probability:
+                    if rng.uniform(0, 1) > 0.99:
+                        if rng.uniform(0, 1) > iteration_factor:
                             if other_driver.dnf == "":  # Avoid marking the driver multiple times
                                 driver.dnf = "Collision"
                                 other_driver.dnf = "Collision"
                                 collided_drivers.append(driver)
                                 collided_drivers.append(other_driver)
+                                if race_metrics is not None:
+                                    race_metrics.count("collisions")
 
     return collided_drivers
 
+class RaceField:
+    # The whole grid as NumPy columns, so one race iteration is simulated for every car at once.
+    # Follows the distributions of simulate_race, simulate_pitstop, simulate_crash, simulate_retirement,
+    # simulate_overtakes_blocks_clean_air and simulate_collision.
+    # step_share is how much of a coarse iteration one step stands for, the lap engine steps once per lap.
+    # The running order, who is still running and why a car is out stay arrays for the whole race,
+    # write_dnfs copies the DNF causes to the drivers once it is over.
+    dnf_causes = ("", "Crash", "Retirement", "Collision")
+
+    def __init__(self, entrants, registry, race_stats, qualifying_count, weather_condition, discipline, circuit_type, track_flags, iterations, generator, step_share=1):
+        import numpy as np  # Only the numpy and laps engines need it
+
+        self.keys = list(entrants)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.drivers = [registry[key][1] for key in self.keys]
+        self.generator = generator
+        self.iterations = iterations
+        self.step_share = step_share
+        self.qualifying_count = qualifying_count
+
+        teams = [registry[key][0] for key in self.keys]
+        stats = [race_stats[key] for key in self.keys]
+
+        for driver in self.drivers:
+            driver.fantastic_qualifying = False
+            driver.shocking_qualifying = False
+
+        self.speed = np.array([s.speed for s in stats])
+        self.skill = np.array([s.skill for s in stats])
+        self.performance = np.array([s.performance for s in stats])
+        self.power = np.array([s.power for s in stats])
+        self.reliability = np.array([s.reliability for s in stats])
+        self.fitness = np.array([driver.fitness for driver in self.drivers])
+        self.tire_condition = np.array([driver.tire_condition for driver in self.drivers], dtype=float)
+        self.qualifying_specialist = np.array([has_flag(driver.trait_flags, 'QualifyingSpecialist') for driver in self.drivers])
+        self.start_park = np.array([has_flag(team.status_flags, 'Start/Park') for team in teams])
+
+        # Crash chance per iteration only depends on the race stats
+        self.bravery = bravery = np.array([driver.bravery for driver in self.drivers])
+        speed_vs_skill_difference = 1 + ((self.skill - self.speed) / 100)
+        skill_vs_bravery_difference = 1 + ((self.skill - bravery) / 100)
+        skill_probability = np.minimum((self.skill * speed_vs_skill_difference * skill_vs_bravery_difference) / 100, 0.99)
+        self.crash_chance = (1 - np.maximum(skill_probability, 0)) * (1 - 0.925) * (1 / iterations)
+
+        # Chance of a collision with one neighbour picked in simulate_collision
+        collision_probability = np.minimum((self.skill * speed_vs_skill_difference) / 100, 0.99)
+        self.collision_chance = (1 - np.minimum(self.skill / 100, 0.999)) * (1 - collision_probability) * 0.01 / iterations
+
+        # Overtake, block and clean air traits
+        def trait(name, present, absent=1):
+            return np.array([present if has_flag(driver.trait_flags, name) else absent for driver in self.drivers])
+        self.overtake_weights = np.where(trait('Cautious', True, False)[:, None], [0.55, 0.35, 0.15, 0.025, 0.01],
+                                         np.where(trait('Aggressive', True, False)[:, None], [0.45, 0.25, 0.15, 0.1, 0.075], [0.5, 0.3, 0.15, 0.05, 0.025]))
+        self.overtake_modifier = trait('GreatOvertaker', 1.1) * trait('PoorOvertaker', 0.9)
+        self.block_modifier = trait('GreatBlocker', 1.1) * trait('PoorBlocker', 0.9)
+        self.clean_air_modifier = trait('GreatInCleanAir', 1.1) * trait('PoorInCleanAir', 0.9)
+
+        # Race state: car indices in running order (the entrants come in grid order), who is running and
+        # the DNF cause as an index into dnf_causes
+        self.order = np.arange(len(self.keys))
+        self.running = np.array([driver.dnf == "" for driver in self.drivers])
+        self.race_form = np.ones(len(self.keys))  # Pace multiplier held for the whole race, see simulate_laps
+        self.dnf = np.array([self.dnf_causes.index(driver.dnf) for driver in self.drivers])
+        self.result = np.zeros(len(self.keys))
+
+        # Pit crew: (low, high, mistake chance)
+        pitcrew_ratings = {
+            "Terrible": (0.875, 0.925, 0.075),
+            "Poor": (0.9, 0.95, 0.06),
+            "Fair": (0.925, 0.975, 0.045),
+            "Great": (0.95, 1.0, 0.03),
+            "Excellent": (0.975, 1.025, 0.015)
+        }
+        pitcrew = np.array([pitcrew_ratings[team.pitcrew] for team in teams])
+        self.pitstop_low, self.pitstop_high, self.mistake_chance = pitcrew.T
+
+        # Strategist: fantastic and shocking multiplier ranges, then the good/bad thresholds and the three strategy ranges
+        strategist_ratings = {
+            "Terrible": (0.875, 0.925, 1.075, 1.125, 0.9, 0.3, 0.1, 0.2, -0.3, -0.2, -0.2, -0.15),
+            "Poor": (0.925, 0.975, 1.025, 1.075, 0.9, 0.3, 0.15, 0.25, -0.25, -0.15, 0.15, 0.05),
+            "Fair": (1, 1, 1, 1, 0.75, 0.25, 0.18, 0.28, -0.22, -0.12, 0.12, 0.02),
+            "Great": (1.025, 1.075, 0.925, 0.975, 0.7, 0.1, 0.2, 0.3, -0.2, -0.1, -0.1, 0),
+            "Excellent": (1.075, 1.125, 0.875, 0.925, 0.7, 0.1, 0.25, 0.35, -0.15, -0.05, -0.05, 0)
+        }
+        no_strategist = (1, 1, 1, 1, 2, -1, 0, 0, 0, 0, 0, 0)
+        strategist = np.array([strategist_ratings.get(team.strategist, no_strategist) for team in teams])
+        (self.fantastic_low, self.fantastic_high, self.shocking_low, self.shocking_high, self.good_threshold, self.bad_threshold,
+         self.good_low, self.good_high, self.bad_low, self.bad_high, self.neutral_low, self.neutral_high) = strategist.T
+
+        strategist_trait = np.array([has_flag(driver.trait_flags, 'Strategist') for driver in self.drivers])
+        poor_communicator = np.array([has_flag(driver.trait_flags, 'PoorCommunicator') for driver in self.drivers])
+        self.good_strategy_modifier = np.where(strategist_trait, 1.1, 1) * np.where(poor_communicator, 0.9, 1)
+        self.bad_strategy_modifier = np.where(strategist_trait, 0.9, 1) * np.where(poor_communicator, 1.1, 1)
+
+        # Race wide factors
+        self.base_fantastic_chance = 0.0075
+        self.base_shocking_chance = 0.015
+        if has_flag(track_flags, 'Chaotic'):
+            self.base_fantastic_chance *= 1.1
+            self.base_shocking_chance *= 1.1
+        if has_flag(track_flags, 'Tame'):
+            self.base_fantastic_chance *= 0.9
+            self.base_shocking_chance *= 0.9
+
+        # Weather: (randomness range, fantastic multiplier, shocking multiplier, strategy multiplier)
+        weather_factors = {
+            "Clear": (0.05, 1, 1, 1),
+            "Rainy": (0.15, 2.5, 2.5, 1.25),
+            "Overcast": (0.05, 1, 0.5, 1),
+            "Hot": (0.05, 0.5, 1.5, 1)
+        }
+        self.randomness_range, self.weather_fantastic, self.weather_shocking, self.weather_strategy = weather_factors.get(weather_condition, (0.2, 5, 5, 1.5))
+
+        # Circuit type: (position penalty, randomness multiplier)
+        circuit_factors = {
+            "Superspeedway": (0.07, 1.25),
+            "Speedway": (0.08, 1.2),
+            "Mile Oval": (0.09, 1.15),
+            "Short Track": (0.11, 1.1),
+            "Road Course": (0.15, 1),
+            "Grand Prix": (0.15, 1),
+            "Street Track": (0.18, 1)
+        }
+        self.position_penalty, randomness_modifier = circuit_factors.get(circuit_type, (0.13, 1))
+        if discipline == 'StockCar':
+            randomness_modifier *= 1.15
+        if has_flag(track_flags, 'Tame'):
+            randomness_modifier *= 0.95
+        if has_flag(track_flags, 'Chaotic'):
+            randomness_modifier *= 1.05
+        self.randomness_range *= randomness_modifier
+
+    def simulate_iteration(self, iteration, contacts=True):
+        import numpy as np
+
+        # One iteration for every car from the current running order, then (with contacts) the overtakes, blocks,
+        # clean air and collisions of simulate_race_iteration. Updates the running order and the results.
+        count = len(self.keys)
+        starting_position = np.empty(count)
+        starting_position[self.order] = np.arange(1, count + 1)
 
-def calculate_fastest_lap_and_laps_led(sorted_qualifying_results, dnq_results, sorted_race_results, total_laps, base_time):
+        pace, pitting, pitstop, finished = self.simulate_pace(starting_position, iteration)
+
+        position_factor = 1 / (1 + (starting_position - 1) * self.position_penalty)
+
+        race_result = pace * position_factor
+        race_result *= pitstop
+        race_result = np.where(finished, race_result, 0)
+
+        # From here on in running order
+        ordered_result = race_result[self.order]
+        if contacts:
+            race_result_mod, failure_collided, overtakes_attempted, blocks_attempted = self.simulate_contacts(race_result, iteration)
+            # A car whose own pass ended in a collision scores 0 this iteration even if it stays in the race
+            ordered_result = np.where(failure_collided | ~self.running[self.order], 0, ordered_result * (1 + race_result_mod))
+            if race_metrics is not None:
+                race_metrics.count("overtake_attempts", overtakes_attempted)
+                race_metrics.count("block_attempts", blocks_attempted)
+
+        # Same as sorting by (result != 0, result) descending, ties keep the running order
+        self.result[self.order] = ordered_result
+        self.order = self.order[np.lexsort((-ordered_result, ordered_result == 0))]
+
+    def race_results(self):
+        # The running order as (team name, driver name, result) tuples
+        result = self.result.tolist()
+        return [(*self.keys[i], result[i]) for i in self.order.tolist()]
+
+    def write_dnfs(self):
+        import numpy as np
+
+        for i in np.flatnonzero(self.dnf).tolist():
+            self.drivers[i].dnf = self.dnf_causes[self.dnf[i]]
+
+    def draw_counts(self, available, weights, draw):
+        import numpy as np
+
+        # rng.choices(range(1, available + 1), weights=weights[:available]) for every car, weights has one row per car
+        cumulative = np.cumsum(np.where(np.arange(weights.shape[1]) < available[:, None], weights, 0), axis=1)
+        return 1 + (draw[:, None] * cumulative[:, -1:] >= cumulative).sum(axis=1)
+
+    def simulate_contacts(self, race_result, iteration, hazard_scale=1, outcomes=True):
+        import numpy as np
+
+        # simulate_overtakes_blocks_clean_air and simulate_collision for every car at once. Each car's passes are
+        # judged on the results before anyone's pass is applied. Collided cars are taken out of the race here.
+        # Returns, in running order, the result modifier and whose own pass ended in a collision, then the
+        # overtake and block attempts. hazard_scale scales the chance that a failed pass ends in a collision.
+        # Without outcomes only the collisions are resolved and the modifier is left at 0.
+        count = len(self.keys)
+        order = self.order
+        slot = np.arange(count)  # Running position - 1
+        ordered_result = race_result[order]
+        speed, skill, bravery = self.speed[order], self.skill[order], self.bravery[order]
+        strength = self.performance[order] + self.power[order]
+        mid_factor = 1 - np.abs(slot - (count / 2)) / (count / 2)
+
+        race_result_mod = np.zeros(count)
+        failure_collided = np.zeros(count, dtype=bool)
+        collided = np.zeros(count, dtype=bool)
+        collisions = 0
+
+        # Every random number the passes need: a count draw and four rolls per attempt, for overtakes then blocks
+        draws = self.generator.random((2, 21, count))
+
+        def fail_pass(failed, target, rolls):
+            # Critical failure: the car itself is out 75% of the time, the other car 50%
+            nonlocal collisions
+            critical = failed & (rolls[0] < 0.01 * hazard_scale)
+            if not critical.any():
+                return critical
+            self_out = critical & (rolls[1] < 0.75)
+            other_out = critical & (rolls[2] < 0.5)
+            failure_collided[self_out | other_out] = True
+            collided[self_out] = True
+            collided[target[other_out]] = True
+            collisions += int(critical.sum())
+            return critical
+
+        # Without outcomes the passes only matter when one of their critical failure rolls comes up
+        contested = outcomes or bool((draws[:, 2::4] < 0.01 * hazard_scale).any())
+
+        # Overtakes on up to five cars ahead, closest first, not in first or last place
+        overtaking = (slot > 0) & (slot < count - 1) & contested
+        overtakes = self.draw_counts(np.minimum(slot, 5), self.overtake_weights[order], draws[0, 0]) if contested else 0
+        overtakes_attempted = 0
+        for distance in range(1, 6):
+            attempt = overtaking & (overtakes >= distance)
+            if not attempt.any():
+                break
+            overtakes_attempted += int(attempt.sum())
+            rolls = draws[0, distance * 4 - 3:distance * 4 + 1]
+            if not outcomes and not (attempt & (rolls[1] < 0.01 * hazard_scale)).any():
+                continue  # No critical failure possible this round
+            target = np.maximum(slot - distance, 0)
+            overtake_chance = 0.15 * mid_factor + 0.25 * np.maximum(0, (strength - ordered_result[target]) / 100) + 0.6 * (bravery / 100)
+            overtake_chance = np.minimum(overtake_chance * self.overtake_modifier[order], 0.85)
+            success_chance = overtake_chance + 0.2 * (skill / 100) + 0.1 * (speed / 100)
+            failed = attempt & (rolls[0] >= success_chance)
+            race_result_mod += np.where(attempt, np.where(failed, -0.01, 0.025), 0)
+            fail_pass(failed, target, rolls[1:])
+
+        # Blocks on up to five cars behind, closest first, not in last place. A collision ends the blocking.
+        blocking = (slot < count - 1) & contested
+        blocks = self.draw_counts(np.minimum(count - 1 - slot, 5), np.array([[0.5, 0.3, 0.15, 0.05, 0.025]]), draws[1, 0]) if contested else 0
+        blocks_attempted = 0
+        for distance in range(1, 6):
+            attempt = blocking & (blocks >= distance)
+            if not attempt.any():
+                break
+            blocks_attempted += int(attempt.sum())
+            rolls = draws[1, distance * 4 - 3:distance * 4 + 1]
+            if not outcomes and not (attempt & (rolls[1] < 0.01 * hazard_scale)).any():
+                continue  # No critical failure possible this round
+            target = np.minimum(slot + distance, count - 1)
+            block_chance = 0.15 * mid_factor + 0.25 * np.maximum(0, (ordered_result[target] - strength) / 100) + 0.6 * (skill / 100)
+            block_chance = np.minimum(block_chance * self.block_modifier[order], 0.85)
+            success_chance = block_chance + 0.2 * (bravery / 100)
+            failed = attempt & (rolls[0] >= success_chance)
+            race_result_mod -= np.where(failed, 0.025, 0)
+            blocking &= ~fail_pass(failed, target, rolls[1:])
+
+        # Clean air at the fringes of the order, more as the race spreads out
+        if outcomes:
+            rolls = self.generator.random((2, count))
+            spread_factor = min(1.0, iteration / max(1, self.iterations))
+            fringe_factor = np.where(slot == 0, 0, (count - 1 - slot) / count)
+            active = rolls[0] < 0.5 * spread_factor + 0.5 * fringe_factor
+            clean_air_chance = np.minimum((0.5 * fringe_factor + 0.5 * spread_factor) * self.clean_air_modifier[order], 0.95)
+            success_chance = clean_air_chance + 0.7 * (speed / 100) + 0.2 * (skill / 100)
+            race_result_mod += np.where(active, np.where(rolls[1] < success_chance, 0.015, -0.015), 0)
+
+        self.dnf[order[collided]] = 3
+        self.running[order[collided]] = False
+
+        # Neighbour collisions: each car picks some of the four cars behind it, the one picked must still be running.
+        # Which ones were picked only matters when a collision roll comes up.
+        rolls = self.generator.random((9, count))
+        available = np.minimum(count - 1 - slot, 4)
+        in_reach = np.arange(4) < available[:, None]
+        hit = in_reach & (rolls[5:9].T < self.collision_chance[order][:, None])
+        if hit.any():
+            picks = self.draw_counts(available, np.array([[0.5, 0.2, 0.1, 0.05]]), rolls[0])
+            keys = np.where(in_reach, rolls[1:5].T, 2)
+            hit &= keys.argsort(axis=1).argsort(axis=1) < picks[:, None]
+        for distance in np.flatnonzero(hit.any(axis=0)).tolist():
+            for car in np.flatnonzero(hit[:, distance]).tolist():
+                other = order[car + distance + 1]
+                if self.dnf[other] == 0:
+                    self.dnf[[order[car], other]] = 3
+                    self.running[[order[car], other]] = False
+                    collisions += 1
+
+        if race_metrics is not None:
+            race_metrics.count("generator_draws", draws.size + (11 if outcomes else 9) * count)
+            race_metrics.count("collisions", collisions)
+
+        return race_result_mod, failure_collided, overtakes_attempted, blocks_attempted
+
+    def simulate_pace(self, starting_position, iteration):
+        import numpy as np
+
+        # One step for every car: pit stops, crashes, retirements and the pace before the running position counts.
+        # Returns the pace, who pitted, the pit stop multiplier and who is still running at the end of the step,
+        # which is the field's running mask from then on.
+        iterations = self.iterations
+        count = len(self.keys)
+
+        # Cars already out of the race (crash, retirement or a collision) score 0
+        running = self.running
+
+        # Every random number this iteration needs, one row per use
+        draws = self.generator.random((17, count))
+
+        adjusted_tire_effect = 1 - (1 - self.tire_condition) * 0.25
+        performance = self.performance * adjusted_tire_effect
+        power = self.power * adjusted_tire_effect
+
+        # Pit stops, with the occasional mistake
+        pitting = running & (self.tire_condition < 0.5)
+        pitstop = 0.5 * (self.pitstop_low + draws[0] * (self.pitstop_high - self.pitstop_low))
+        pitstop = np.where(draws[1] < self.mistake_chance, pitstop * (0.25 + draws[2] * 0.25), pitstop)
+        pitstop = np.where(pitting, pitstop, 1)
+        self.tire_condition[pitting] = 1.0
+
+        if race_metrics is not None:
+            race_metrics.count("generator_draws", draws.size)
+            race_metrics.count("pit_stops", int(pitting.sum()))
+
+        crashed = running & (draws[3] < self.crash_chance)
+
+        # Retirement, Start/Park entrants outside the top 30% fold early. Start/Park entrants don't wait for race wear.
+        top_30 = int(self.qualifying_count * 0.3)
+        start_parking = self.start_park & (starting_position > top_30)
+        reliability = np.minimum(self.reliability, 0.99) * np.where(start_parking, 0.1, 1)
+        threshold = 0.8 * np.where(start_parking, 0.1, 1)
+        race_wear = np.where(self.start_park, 1, iteration / iterations)
+        retirement_chance = (1 - reliability) * race_wear * (1 - threshold) * self.step_share
+        retired = running & ~crashed & (draws[4] < retirement_chance)
+
+        # Progressive fitness impact
+        fitness_effect = 1 - (1 - self.fitness) * (iteration / iterations)
+        skill = self.skill * fitness_effect
+        speed = self.speed * fitness_effect
+
+        fantastic_chance = self.base_fantastic_chance + (skill / 10000) - ((1 - self.reliability) / 1000)
+        shocking_chance = self.base_shocking_chance + ((100 - skill) / 10000) + ((1 - self.reliability) / 1000)
+        fantastic_chance *= self.fantastic_low + draws[5] * (self.fantastic_high - self.fantastic_low)
+        shocking_chance *= self.shocking_low + draws[6] * (self.shocking_high - self.shocking_low)
+
+        # Strategy call: good above the strategist's threshold, bad below it, otherwise the neutral range
+        good = draws[7] > self.good_threshold
+        bad = ~good & (draws[7] < self.bad_threshold)
+        low = np.where(good, self.good_low, np.where(bad, self.bad_low, self.neutral_low))
+        high = np.where(good, self.good_high, np.where(bad, self.bad_high, self.neutral_high))
+        race_strategy = (low + draws[8] * (high - low)) * np.where(good, self.good_strategy_modifier, self.bad_strategy_modifier)
+        race_strategy *= self.weather_strategy
+
+        randomness = (draws[9] * 2 - 1) * self.randomness_range
+
+        fantastic_race = draws[10] < fantastic_chance * self.weather_fantastic
+        shocking_race = draws[11] < shocking_chance * self.weather_shocking
+
+        # 1.25 at least, 37.5% of those get a second 1.25 and a quarter of those a third
+        special_modifier = np.where(fantastic_race, 1.25 * np.where(draws[12] < 0.75 * 0.5, 1.25 * np.where(draws[13] < 0.25, 1.25, 1), 1), 1)
+        special_modifier *= np.where(shocking_race, 0.75 * np.where(draws[14] < 0.75 * 0.5, 0.75 * np.where(draws[15] < 0.25, 0.75, 1), 1), 1)
+
+        if iteration == 0:
+            speed = np.where(self.qualifying_specialist, speed * 0.9, speed)
+            skill = np.where(self.qualifying_specialist, skill * 0.9, skill)
+
+        random_factor = 1 + (randomness * 2)
+        strategy_factor = 1 + race_strategy / iterations
+
+        pace = ((((speed / 2) + skill) * 0.75) * special_modifier) + performance + power
+        pace *= strategy_factor
+        pace *= random_factor * self.race_form
+
+        finished = running & ~crashed & ~retired
+
+        # Tire wear for everyone still running
+        self.tire_condition -= np.where(finished, (0.1 + draws[16] * 0.1) * self.step_share, 0)
+
+        self.dnf[crashed] = 1
+        self.dnf[retired] = 2
+        self.running = finished
+
+        return pace, pitting, pitstop, finished
+
+    def simulate_laps(self, grid_order, laps, base_time):
+        import numpy as np
+
+        # Lap by lap race on cumulative race time, every car advances one lap per step.
+        # The coarse position factor and pit stop multiplier become dirty air and time lost in the pit lane.
+        count = len(self.keys)
+        self.order = order = np.array([self.index[key] for key in grid_order], dtype=int)
+        position = np.empty(count)
+        position[order] = np.arange(1, count + 1)
+
+        # Every gap below was set on a 90 second Grand Prix lap and scales with the track's base time
+        time_scale = base_time / 90
+        race_time = (position - 1) * 0.2 * time_scale  # Staggered grid slots
+        laps_completed = np.zeros(count, dtype=int)
+        laps_led = np.zeros(count, dtype=int)
+        fastest_lap = np.full(count, np.inf)
+        total_pace = np.zeros(count)
+
+        # Each coarse iteration's randomness can reorder the field, but over a lap per step it averages out and the
+        # fastest car nearly always wins. One draw of the same range held for the whole race gives the race to race
+        # spread of the coarse engines back, while every lap keeps its own smaller noise on top.
+        self.race_form = 1 + (self.generator.random(count) * 2 - 1) * self.randomness_range * 2
+        overtake_margin = self.position_penalty * 2 * time_scale  # Pace in hand needed to get by, harder on street tracks
+        dirty_air_gap = 0.2 * time_scale
+
+        for lap in range(laps):
+            pace, pitting, pitstop, finished = self.simulate_pace(position, lap)
+
+            # Collisions from failed passes and from running close together, as in the coarse engines. A lap carries
+            # its step_share of an iteration's pass hazard, so a race has as many collisions as the scalar engine.
+            # The passes themselves are left to dirty air below.
+            race_result = np.where(finished, pace / (1 + (position - 1) * self.position_penalty), 0)
+            self.simulate_contacts(race_result, lap, self.step_share, outcomes=False)
+            finished = self.running
+
+            # The pace to time scale of calculate_fastest_lap_and_laps_led on a 90 second lap, as a share of the base
+            # time so short tracks keep positive lap times. Pit stops cost more with a slower crew.
+            lap_time = np.maximum(base_time - 0.05 * pace * time_scale, base_time * 0.5)
+            lap_time += np.where(pitting, base_time * 0.125 / pitstop, 0)
+            new_time = (race_time + lap_time).tolist()
+
+            # Dirty air: a car that closes up without enough pace in hand stays behind
+            running = finished.tolist()
+            held = 0
+            for car_ahead, car in zip(order[:-1].tolist(), order[1:].tolist()):
+                if running[car] and running[car_ahead] and new_time[car_ahead] - overtake_margin < new_time[car] < new_time[car_ahead] + dirty_air_gap:
+                    new_time[car] = new_time[car_ahead] + dirty_air_gap
+                    held += 1
+            new_time = np.array(new_time)
+
+            fastest_lap = np.where(finished, np.minimum(fastest_lap, new_time - race_time), fastest_lap)
+            race_time = np.where(finished, new_time, race_time)
+            total_pace += np.where(finished, pace, 0)
+            laps_completed += finished
+
+            # Running order: most laps first, then least time
+            previous_order = order
+            self.order = order = np.lexsort((race_time, -laps_completed))
+            position[order] = np.arange(1, count + 1)
+
+            # An attempt is either a car held in dirty air or a pass, counted as each car whose position improved
+            if race_metrics is not None:
+                race_metrics.count("overtake_attempts", held + int((position[previous_order] < np.arange(1, count + 1)).sum()))
+            if finished[order[0]]:
+                laps_led[order[0]] += 1
+
+        self.write_dnfs()
+
+        # Finishers keep their average pace as the result, retirements score 0 like the other engines
+        average_pace = np.where(laps_completed == laps, total_pace / max(1, laps), 0).tolist()
+        race_results = [(*self.keys[i], average_pace[i]) for i in order.tolist()]
+
+        driver_names = [driver_name for _, driver_name in self.keys]
+        lap_data = {
+            "race_time": dict(zip(driver_names, race_time.tolist())),
+            "fastest_lap": dict(zip(driver_names, fastest_lap.tolist())),
+            "laps_led": dict(zip(driver_names, laps_led.tolist()))
+        }
+
+        return race_results, lap_data
+
+def calculate_fastest_lap_and_laps_led(sorted_qualifying_results, dnq_results, sorted_race_results, total_laps, base_time, rng=random, lap_data=None):
     fastest_lap_times = []
     qualifying_lap_times = []
     full_race_times = []
@@ -1377,11 +2109,18 @@ def calculate_fastest_lap_and_laps_led(sorted_qualifying_results, dnq_results, s
         # Better positions should lead to better lap times (lower numbers)
         position_factor = (position - 1) / (len(sorted_race_results) - 1)  # Higher position, worse time
         race_result_factor = max(0, 0.05 * race_result)  # Ensure non-negative contribution
-        fastest_lap_time = base_time + (position_factor * 5) - race_result_factor + random.uniform(0, 30)
+        if lap_data is not None:
+            # The lap engine timed every lap, so use the real fastest lap and race time
+            fastest_lap_time = lap_data["fastest_lap"][driver_names]
+        else:
+            fastest_lap_time = base_time + (position_factor * 5) - race_result_factor + rng.uniform(0, 30)
         fastest_lap_times.append(fastest_lap_time)
 
         # Calculate full race time for this driver
-        full_race_time = (base_time - race_result_factor) * total_laps
+        if lap_data is not None:
+            full_race_time = lap_data["race_time"][driver_names]
+        else:
+            full_race_time = (base_time - race_result_factor) * total_laps
         full_race_times.append(full_race_time)  # Store each driver's race time
         
         # Format the full race time for display
@@ -1389,11 +2128,15 @@ def calculate_fastest_lap_and_laps_led(sorted_qualifying_results, dnq_results, s
         full_race_seconds = full_race_time % 60
         formatted_race_times.append("{:d}:{:05.2f}".format(full_race_minutes, full_race_seconds))
 
+        if lap_data is not None:
+            laps_led[driver_names] = lap_data["laps_led"][driver_names]
+            continue
+
         # Simulate laps led based on position and performance
         base_laps = 0
         for driver in driver_names.split(", "):  # Split in case there are multiple drivers
             # Calculate laps led but ensure it doesn’t exceed total_laps
-            laps_led[driver] = max(0, int(base_laps + (1 - position_factor) * (total_laps / 4) + (race_result_factor / 10) - random.uniform(-15, 60)))
+            laps_led[driver] = max(0, int(base_laps + (1 - position_factor) * (total_laps / 4) + (race_result_factor / 10) - rng.uniform(-15, 60)))
             # Clamp the laps led to not exceed total_laps
             laps_led[driver] = min(laps_led[driver], total_laps)
 
@@ -1443,37 +2186,51 @@ def get_series_attributes_from_csv(series_name, directory):
     # If no match is found, raise an error
     raise ValueError(f"No match found for series_name: {series_name}")
 
-def get_color_hex_from_csv(color_name, directory):
+def read_color_map(directory):
     csv_file_path = os.path.join(directory, 'Data', 'Colors.csv')
     
     if not os.path.exists(csv_file_path):
         raise FileNotFoundError(f"'Data Colors.csv' file not found in the specified directory: {csv_file_path}")
     
+    # Color name -> hex, the first row wins if a name is listed twice
+    color_map = {}
     with open(csv_file_path, mode='r', newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
-            if row['Color'] == color_name:
-                return row['Hex']
-    
-    raise ValueError(f"No match found for color_name: {color_name}")
+            color_map.setdefault(row['Color'], row['Hex'])
+
+    return color_map
 
-def get_sponsor_branding_color_hex(sponsor_name, series_name, directory):
+def read_sponsor_branding_map(series_name, directory):
     csv_file_path = os.path.join(directory, 'World', 'Sponsors', f"Sponsors - {series_name}.csv")
 
     if not os.path.exists(csv_file_path):
         raise FileNotFoundError(f"Sponsors file not found: {csv_file_path}")
 
+    # Sponsor name -> branding color name(s), the first row wins if a name is listed twice
+    sponsor_branding = {}
     with open(csv_file_path, mode='r', newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
-            if row['Name'] == sponsor_name:
-                return row.get('Branding', '')
+            sponsor_branding.setdefault(row['Name'], row.get('Branding', ''))
 
-    raise ValueError(f"No match found for sponsor: {sponsor_name}")
+    return sponsor_branding
+
+# Parsed standings by (series, discipline), reused until the Logs directory or the standings file changes
+standings_cache = {}
 
 def read_standings_data(series_name, script_directory, discipline):
     json_filepath = os.path.join(script_directory, 'Championships', 'Logs')
 
+    # Adding a standings file changes the directory mtime, rewriting one changes the file mtime
+    directory_mtime = os.stat(json_filepath).st_mtime_ns
+    cached = standings_cache.get((series_name, discipline))
+    if cached and cached["directory_mtime"] == directory_mtime:
+        if cached["file"] is None or (os.path.exists(cached["file"]) and os.stat(cached["file"]).st_mtime_ns == cached["file_mtime"]):
+            return cached["data"]
+
+    standings_cache[(series_name, discipline)] = {"directory_mtime": directory_mtime, "file": None, "file_mtime": None, "data": None}
+
     most_recent_file = None
     most_recent_round = None
 
@@ -1502,6 +2259,7 @@ def read_standings_data(series_name, script_directory, discipline):
         return None  # Return None or any default value as needed
 
     # Load data from the most recent file
+    most_recent_mtime = os.stat(most_recent_file).st_mtime_ns
     with open(most_recent_file, 'r') as json_file:
         most_recent_standings = json.load(json_file)
 
@@ -1585,28 +2343,55 @@ def read_standings_data(series_name, script_directory, discipline):
                     "Races": entry["e_Races"]
                 })
 
+    # The Championships script only writes driver rows, the entrants are summed up from them
+    if not entrants_standings:
+        entrants_standings = build_entrant_standings(drivers_standings)
+
     # Return structured standings data
-    return {
+    standings_data = {
         "drivers_standings": drivers_standings,
         "teams_standings": teams_standings,
-        "entrants_standings": entrants_standings
+        "entrants_standings": entrants_standings,
+        "entrants_by_name": {entry["Entrant"]: entry for entry in entrants_standings}
     }
 
-def combine_driver_names(drivers):
-    return " / ".join(driver.name for driver in drivers)
+    standings_cache[(series_name, discipline)] = {"directory_mtime": directory_mtime, "file": most_recent_file, "file_mtime": most_recent_mtime, "data": standings_data}
 
-def main():
-    # Get the directory path of the script
-    script_directory = os.path.dirname(os.path.abspath(__file__))
+    return standings_data
 
-    # Get the filename without extension
-    script_filename = os.path.splitext(os.path.basename(__file__))[0]
+def build_entrant_standings(drivers_standings):
+    # Entrant rows from driver rows, every driver counts for the entry in their "Team" field
+    entrants = {}
+    for row in drivers_standings:
+        entrant = entrants.setdefault(row["Team"], {"Entrant": row["Team"]})
+        for key, value in row.items():
+            if key not in ("Rank", "Driver", "Team"):
+                entrant[key] = entrant.get(key, 0) + value
 
-    # Assuming the series_name is derived directly from the script filename
+    entrants_standings = sorted(entrants.values(), key=lambda x: x["Points"], reverse=True)
+    return [{"Rank": rank + 1, **entrant} for rank, entrant in enumerate(entrants_standings)]
+
+def combine_driver_names(drivers):
+    return " / ".join(driver.name for driver in drivers)
+
+def get_series_sources(script_directory, script_filename, series_name):
+    # Every file the series bundle is compiled from, a change to any of them rebuilds the bundle
+    return [
+        os.path.abspath(__file__),
+        os.path.join(script_directory, f"{script_filename}.csv"),
+        os.path.join(script_directory, "Schedules", f"Schedule - {script_filename}.csv"),
+        os.path.join(script_directory, 'Championships', 'Rules', 'Championship Rules.csv'),
+        os.path.join(script_directory, 'Data', 'Colors.csv'),
+        os.path.join(script_directory, 'World', 'Sponsors', f"Sponsors - {series_name}.csv"),
+        os.path.join(script_directory, "Data", "Text.csv")
+    ] + [os.path.join(script_directory, "Data", f"{list_name} - temp.txt") for list_name in flag_vocabulary_lists]
+
+def compile_series(script_directory, script_filename):
+    # Parse every CSV input once into plain data, the Driver and Team objects are built from it in load_series
     series_name = script_filename.split(" - ")[-1]  # Adjust this based on your filename format
 
     # Extract parts from the CSV file
-    discipline, region, tier, team_rules, chassis_rules, engine_rules, practice_sessions, charter_system, charter_slots, retirement_threshold = get_series_attributes_from_csv(series_name, script_directory)
+    attributes = get_series_attributes_from_csv(series_name, script_directory)
 
     # Construct the CSV file path
     csv_filename = f"{script_filename}.csv"
@@ -1615,92 +2400,87 @@ def main():
     # Check if the CSV file exists
     if not os.path.exists(csv_file_path):
         print(f"Error: {csv_filename} not found in the script directory.")
-        return
+        return None
 
-    # Read data from CSV
-    teams = {}
-    drivers = []
+    color_map = read_color_map(script_directory)
+    sponsor_branding = None  # Only read when a team has a title sponsor
+
+    # One entry per CSV row: the team and driver constructor arguments and the color name(s)
+    team_args_by_name = {}
+    entries = []
 
     with open(csv_file_path, newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
             team_name = row['Team']
-            
-            if team_name not in teams:
-                teams[team_name] = Team(
-                    team_name,
-                    row['Charter'],
-                    row['Alliance'],
-                    row['Prestige'],
-                    "",  # Initial color (will be updated later)
-                    row['Status'],
-                    row['Primary Sponsor'],     # Sponsor
-                    row['Commitment'],  # Sponsor
-                    row['Secondary Sponsors'],
-                    row['Chassis'],
-                    row['Design'],
-                    row['Performance'],
-                    row['Aero'],
-                    row['Gearbox'],
-                    row['Suspension'],
-                    row['Brakes'],
-                    row['Reliability'],
-                    row['Characteristics'],
-                    row['Engineer'],
-                    row['Supplier'],
-                    row['Engine'],
-                    row['Power'],
-                    row['Engine Reliability'],
-                    row['Tires'],
-                    row['Pit Crew'],
-                    row['Strategist']
-                )
-
-            # Update color after ensuring team exists in the dictionary
-            if teams[team_name].commitment.split("|")[0] == "Title":
-                color_name = get_sponsor_branding_color_hex(
-                    teams[team_name].primary_sponsor, series_name, script_directory
-                )
+
+            if team_name not in team_args_by_name:
+                team_args_by_name[team_name] = {
+                    "name": team_name,
+                    "charter": row['Charter'],
+                    "alliance": row['Alliance'],
+                    "prestige": row['Prestige'],
+                    "color": "",  # Initial color (picked when the series is loaded)
+                    "status": row['Status'],
+                    "primary_sponsor": row['Primary Sponsor'],     # Sponsor
+                    "commitment": row['Commitment'],  # Sponsor
+                    "secondary_sponsors": row['Secondary Sponsors'],
+                    "chassis": row['Chassis'],
+                    "design": row['Design'],
+                    "performance": row['Performance'],
+                    "aero": row['Aero'],
+                    "gearbox": row['Gearbox'],
+                    "suspension": row['Suspension'],
+                    "brakes": row['Brakes'],
+                    "reliability": row['Reliability'],
+                    "characteristics": row['Characteristics'],
+                    "engineer": row['Engineer'],
+                    "supplier": row['Supplier'],
+                    "engine": row['Engine'],
+                    "power": row['Power'],
+                    "engine_reliability": row['Engine Reliability'],
+                    "tires": row['Tires'],
+                    "pitcrew": row['Pit Crew'],
+                    "strategist": row['Strategist']
+                }
+            team_args = team_args_by_name[team_name]
+
+            # Title sponsors bring their own branding colors
+            if team_args["commitment"].split("|")[0] == "Title":
+                if sponsor_branding is None:
+                    sponsor_branding = read_sponsor_branding_map(series_name, script_directory)
+                if team_args["primary_sponsor"] not in sponsor_branding:
+                    raise ValueError(f"No match found for sponsor: {team_args['primary_sponsor']}")
+                color_name = sponsor_branding[team_args["primary_sponsor"]]
             else:
                 color_name = row['Color']
 
-            # Handle multiple colors by randomly selecting one
-            color_choices = color_name.split('|')
-            selected_color_name = random.choice(color_choices).strip()
-
-            # Replace with its hex value
-            color_hex = get_color_hex_from_csv(selected_color_name, script_directory)
-
-            # Update the team's color with the selected hex color
-            teams[team_name].color = color_hex
-            
-            driver = Driver(
-                row['Name'],
-                row['Nationality'],
-                row['Age'],
-                row['Psyche'],
-                row['Speed'],
-                row['Skill'],
-                row['Bravery'],
-                row['Fitness'],
-                row['Experience'],
-                row['Morale'],
-                row['Discipline'],
-                row['Preference'],
-                row['Style'],
-                row['Traits'],
-                row['Fame'],
-                row['Reputation'],
-                row['Funding'],
-                row['Personal Sponsors'],
-                row['Contract'],
-                row['Target'],
-                row['Relations'],
-                team_name
-            )
-            
-            teams[team_name].add_driver(driver)
-            drivers.append(driver)
+            driver_args = {
+                "name": row['Name'],
+                "nationality": row['Nationality'],
+                "age": row['Age'],
+                "psyche": row['Psyche'],
+                "speed": row['Speed'],
+                "skill": row['Skill'],
+                "bravery": row['Bravery'],
+                "fitness": row['Fitness'],
+                "experience": row['Experience'],
+                "morale": row['Morale'],
+                "preferred_discipline": row['Discipline'],
+                "preferred_track": row['Preference'],
+                "style": row['Style'],
+                "traits": row['Traits'],
+                "fame": row['Fame'],
+                "reputation": row['Reputation'],
+                "funding": row['Funding'],
+                "personal_sponsors": row['Personal Sponsors'],
+                "contract": row['Contract'],
+                "target": row['Target'],
+                "relations": row['Relations'],
+                "team_name": team_name
+            }
+
+            entries.append({"team": team_args, "driver": driver_args, "color": color_name})
 
     # Construct the schedule CSV file path
     schedule_csv_path = os.path.join(script_directory, "Schedules", f"Schedule - {script_filename}.csv")
@@ -1708,7 +2488,7 @@ def main():
     # Check if the schedule CSV file exists
     if not os.path.exists(schedule_csv_path):
         print(f"Error: Schedule CSV file not found in the 'Schedules' subdirectory.")
-        return
+        return None
 
     # Read schedule data from CSV
     schedule = []
@@ -1720,55 +2500,218 @@ def main():
     # Sort schedule based on the "Order" column
     sorted_schedule = sorted(schedule, key=lambda x: int(x['Order']))
 
-    # Check if the "Races" directory exists and get the most recent race file
-    results_dir = os.path.join(script_directory, "Schedules", "Races")
-    os.makedirs(results_dir, exist_ok=True)
+    # Train and compile the news chain now so presenting a race does not retrain it from Text.csv
+    markov_model = None
+    if os.path.exists(os.path.join(script_directory, "Data", "Text.csv")):
+        with timed_phase("markov training"):
+            markov = MarkovChain()
+            markov.load_from_csv(script_directory, delimiter='|')
+            markov_model = markov.export_model()
+
+    return {
+        "series_name": series_name,
+        "attributes": attributes,
+        "flag_vocabulary": read_flag_vocabulary(script_directory),
+        "entries": entries,
+        "color_map": color_map,
+        "sorted_schedule": sorted_schedule,
+        "markov_model": markov_model
+    }
+
+def load_series_bundle(script_directory, script_filename):
+    # The compiled series is kept next to the sources and rebuilt when any source changes
+    series_name = script_filename.split(" - ")[-1]
+    bundle_path = os.path.join(script_directory, f"{script_filename}.bundle.pickle")
+
+    sources = {}
+    for source_path in get_series_sources(script_directory, script_filename, series_name):
+        sources[source_path] = os.stat(source_path).st_mtime_ns if os.path.exists(source_path) else None
+
+    if os.path.exists(bundle_path):
+        try:
+            with open(bundle_path, 'rb') as bundle_file:
+                bundle = pickle.load(bundle_file)
+            if bundle.get("sources") == sources:
+                return bundle
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            pass  # A damaged bundle is simply rebuilt
+
+    with timed_phase("compile series"):
+        bundle = compile_series(script_directory, script_filename)
+    if bundle is None:
+        return None
+    bundle["sources"] = sources
+
+    # Write to a temporary file first so a parallel reader never sees half a bundle
+    try:
+        temp_path = f"{bundle_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as bundle_file:
+            pickle.dump(bundle, bundle_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, bundle_path)
+    except OSError:
+        pass  # The bundle is only a cache, a read-only directory just means compiling every run
+
+    return bundle
+
+def load_series(script_directory, script_filename, rng=random):
+    bundle = load_series_bundle(script_directory, script_filename)
+    if bundle is None:
+        return None
+
+    discipline, region, tier, team_rules, chassis_rules, engine_rules, practice_sessions, charter_system, charter_slots, retirement_threshold = bundle["attributes"]
 
-    # Get all JSON files in the directory
-    race_files = [f for f in os.listdir(results_dir) if f.endswith(".json")]
+    # Trait and characteristic flags are interned before the drivers and teams are built
+    for name in bundle["flag_vocabulary"]:
+        flag_bit(name)
+
+    teams = {}
+    drivers = []
+
+    for entry in bundle["entries"]:
+        team_name = entry["team"]["name"]
+
+        if team_name not in teams:
+            teams[team_name] = Team(**entry["team"])
+
+        # Handle multiple colors by randomly selecting one
+        color_choices = entry["color"].split('|')
+        selected_color_name = rng.choice(color_choices).strip()
+
+        # Replace with its hex value
+        if selected_color_name not in bundle["color_map"]:
+            raise ValueError(f"No match found for color_name: {selected_color_name}")
+
+        # Update the team's color with the selected hex color
+        teams[team_name].color = bundle["color_map"][selected_color_name]
+
+        driver = Driver(**entry["driver"])
+
+        teams[team_name].add_driver(driver)
+        drivers.append(driver)
+
+    return {
+        "series_name": bundle["series_name"],
+        "discipline": discipline,
+        "region": region,
+        "tier": tier,
+        "practice_sessions": practice_sessions,
+        "charter_system": charter_system,
+        "charter_slots": charter_slots,
+        "retirement_threshold": retirement_threshold,
+        "teams": teams,
+        "drivers": drivers,
+        "sorted_schedule": bundle["sorted_schedule"],
+        "markov_model": bundle["markov_model"]
+    }
+
+def get_last_race_order(results_dir, series_name):
+    # Get all race JSON files in the directory, metrics records sit next to them
+    race_files = [f for f in os.listdir(results_dir) if f.endswith(".json") and not f.endswith(".metrics.json")]
 
     # Filter files for the same series
     series_race_files = [
         f for f in race_files if f.startswith(series_name)
     ]
 
-    # Determine the most recent race order
-    if series_race_files:
-        # Extract the order from the filenames, assuming the format is "Series Name - Order - Circuit.json"
-        race_orders = []
-        for file in series_race_files:
-            parts = file.split(" - ")
-            if len(parts) >= 2:  # Ensure the filename has at least "Series Name - Order"
-                try:
-                    race_order = int(parts[1])  # Extract and convert the "Order" part to an integer
-                    race_orders.append((race_order, file))
-                except ValueError:
-                    continue  # Skip files where the order isn't a valid integer
-
-        # If race orders exist, find the highest order (most recent race)
-        if race_orders:
-            last_race_order, last_race_file = max(race_orders, key=lambda x: x[0])
-
-            # Run the next race in the schedule
-            next_race = next((race for race in sorted_schedule if int(race['Order']) > last_race_order), None)
-            if next_race:
-                race = next_race
+    # Extract the order from the filenames, assuming the format is "Series Name - Order - Circuit.json"
+    race_orders = []
+    for file in series_race_files:
+        parts = file.split(" - ")
+        if len(parts) >= 2:  # Ensure the filename has at least "Series Name - Order"
+            try:
+                race_orders.append(int(parts[1]))  # Extract and convert the "Order" part to an integer
+            except ValueError:
+                continue  # Skip files where the order isn't a valid integer
+
+    # No valid race order means no race has been run yet
+    if not race_orders:
+        return None
+
+    return max(race_orders)
+
+def build_driver_registry(teams):
+    # (team name, driver name) -> (team, driver), so results tuples can be resolved without scanning the teams
+    registry = {}
+    for team in teams.values():
+        for driver in team.drivers:
+            registry[(team.name, driver.name)] = (team, driver)
+
+    return registry
+
+def simulate_race_iteration(sorted_race_results, teams, registry, qualifying_results, race_stats, weather_condition, discipline, circuit_type, track_flags, iteration, iterations, rng=random):
+    # One iteration of the scalar engine: every running car's result, then overtakes, blocks and collisions.
+    # Returns the new running order. RaceField.simulate_iteration is the numpy engine's version.
+    new_race_results = []
+    for i, (team_name, driver_name, _) in enumerate(sorted_race_results):
+        team = teams[team_name]
+        starting_position = i + 1
+        if team.drivers:  # Check if the team has at least one driver
+            driver = qualifying_results[(team_name, driver_name)][0]
+            if driver.dnf == "Retirement" or driver.dnf == "Crash" or driver.dnf == "Collision":
+                race_result = 0  # Mark the race result as 0 for retirement
             else:
-                print(f"No remaining races to run in the schedule for {series_name}.")
-                return
+                race_result = simulate_race(driver, team, race_stats[(team_name, driver_name)], starting_position, weather_condition, discipline, circuit_type, qualifying_results, sorted_race_results, track_flags, iteration, iterations, rng)
+            new_race_results.append((team_name, driver_name, race_result))
         else:
-            # No valid race order was found, run the first race
-            race = sorted_schedule[0]
-    else:
-        # No files exist for this series, run the first race in the schedule
-        race = sorted_schedule[0]
+            pass  # Do nothing if no drivers available for the team
 
-    # At this point, 'race' contains the next race to run, either from the schedule or the first race
+    # Apply overtakes/blocks/clean air effects for each driver in new_race_results
+    for i, (team_name, driver_name, race_result) in enumerate(new_race_results):
+        entry = registry.get((team_name, driver_name))
+        if entry:
+            team, driver = entry
+            race_result_mod, failure_collided_drivers = simulate_overtakes_blocks_clean_air(
+                driver, team, race_stats[(team_name, driver_name)], registry, i + 1, new_race_results, iteration, iterations, rng)
+            # Set race result to 0 for collided drivers
+            if failure_collided_drivers:
+                new_race_results[i] = (team_name, driver_name, 0)
+                for collided_name in failure_collided_drivers:
+                    for j, (tname, dname, rresult) in enumerate(new_race_results):
+                        if dname == collided_name:
+                            new_race_results[j] = (tname, dname, 0)
+            else:
+                # Apply race_result_mod if not DNF
+                if race_result != 0:
+                    new_race_results[i] = (team_name, driver_name, race_result + (race_result * race_result_mod))
+
+    # Simulate collisions after each iteration
+    with timed_phase("collisions"):
+        collided_drivers = simulate_collision(new_race_results, registry, race_stats, iterations, rng)
+    for collided_driver in collided_drivers:
+        for i, (team_name, driver_name, race_result) in enumerate(new_race_results):
+            if collided_driver.name == driver_name:
+                new_race_results[i] = (team_name, driver_name, 0)  # Set race result to 0 for collided drivers
+                break
+
+    # Sort race results by performance score after each iteration
+    sorted_new_race_results = sorted(new_race_results, key=lambda x: (x[2] != 0, x[2]), reverse=True)
+
+    # # Print the winner of each iteration except the last one
+    # DEBUG if iteration < iterations - 1:
+    #     print(f"Iteration {iteration + 1} Results:")
+    #     for pos, (team_name, driver_name, race_result) in enumerate(sorted_new_race_results):
+    #         driver = next((d for d in teams[team_name].drivers if d.name == driver_name), None)
+    #         if driver:
+    #             # Find the previous position of the driver
+    #             previous_position = next(
+    #             (prev_pos for prev_pos, (prev_team_name, prev_driver_name, _) in enumerate(new_race_results)
+    #             if prev_team_name == team_name and prev_driver_name == driver_name),
+    #             None
+    #             )
+    #             # Calculate movement
+    #             movement = previous_position - pos if previous_position is not None else None
+    #             movement_str = f"({movement:+})" if movement is not None else "(N/A)"
+    #             print(f"{pos + 1}. {driver_name} ({team_name}) with score {race_result} {movement_str}")
+    #     print("\n")
+
+    return sorted_new_race_results
+
+def simulate_round(series, race, teams, standings_data, rng=random, engine="scalar"):
+    discipline = series["discipline"]
+    practice_sessions = series["practice_sessions"]
+    sorted_schedule = series["sorted_schedule"]
 
     # Extract race details (as before)
-    order = race['Order']
-    circuit = race['Circuit']
-    country = race['Country']
     event = race['Event']
     circuit_type = race['Type']
 
@@ -1782,231 +2725,262 @@ def main():
     stormy_prob = float(race['Stormy'])
 
     track_characteristics = race['Characteristics'].split('|')
+    track_flags = flag_mask(track_characteristics)
 
     total_laps = float(race['Laps'])
     base_time = float(race['Base Time'])
-    lap_record = race['Lap Record']
     grid_size = int(race['Grid Size'])
 
     # Simulate weather for the event
-    weather_condition = simulate_weather(clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob)
-
-    print(f"\n(Round {order}: {circuit} - {country} - {circuit_type} - {int(total_laps)} laps)\n")
-    print(f"Weather: {weather_condition}")
-    print(f"Lap Record: {lap_record}")
+    weather_condition = simulate_weather(clear_prob, rainy_prob, overcast_prob, hot_prob, stormy_prob, rng)
 
-    # Wait for user input before displaying qualifying results
-    # input("\n...")
+    registry = build_driver_registry(teams)
 
-    time.sleep(0.75)  # Add a delay between each entry
+    # Clear the race state left by a previous round so one loaded roster can be reused
+    for team, driver in registry.values():
+        driver.reset_race_state()
 
     # Qualifying
-    qualifying_results = {}
-    for team in teams.values():
-        for driver in team.drivers:
-            result = simulate_qualifying(team, weather_condition, discipline, event, grid_size, circuit_type, series_name, script_directory, track_speed, track_characteristics, sorted_schedule, race, practice_sessions, difficulty)
-            
-            if result is not None:  # Skip if qualifying result is None
-                qualified_drivers, dnq_drivers = result  # Extract qualified and DNQ lists
-
-                # Store qualifying times for individual drivers
-                for qualifying_time in qualified_drivers:
-                    qualifying_results[(team.name, driver.name)] = (driver, qualifying_time)  # Qualified drivers
-                                                            # JACKPOT! ^
-
-    # Sort qualifying results and DNQ results separately based on the times
-    sorted_qualifying_results = sorted(qualifying_results.items(), key=lambda x: x[1][1], reverse=True)
-
-    # Apply grid size limit
-    dnq_results = sorted_qualifying_results[grid_size:]
-    sorted_qualifying_results = sorted_qualifying_results[:grid_size]
-
-    # Ensure drivers with empty team.charter are in sorted_qualifying_results
-    for driver in dnq_results[:]:
-        team_name, driver_name = driver[0]
-        team = teams[team_name]
-        if team.charter == "TRUE":
-            # Move driver to sorted_qualifying_results
-            sorted_qualifying_results.append(driver)
-            dnq_results.remove(driver)
+    with timed_phase("qualifying"):
+        sorted_qualifying_results, dnq_results, effective_stats = simulate_grid_qualifying(teams, weather_condition, discipline, event, grid_size, circuit_type, standings_data, track_speed, track_characteristics, sorted_schedule, race, practice_sessions, difficulty, rng)
+        qualifying_results = dict(sorted_qualifying_results + dnq_results)
 
-    # Ensure grid size limit is maintained
-    while len(sorted_qualifying_results) > grid_size:
-        # Move the lowest driver to dnq_results, but ensure drivers with empty team.charter are not moved
-        for i in range(len(sorted_qualifying_results) - 1, -1, -1):
-            team_name, driver_name = sorted_qualifying_results[i][0]
-            team = teams[team_name]
-            if team.charter != "TRUE":
-                dnq_results.append(sorted_qualifying_results.pop(i))
-                break
-
-    # Sort the DNQ results by time
-    dnq_results = sorted(dnq_results, key=lambda x: x[1][1], reverse=True)
+        # Race start modifiers are applied once per entrant on top of the qualifying stats
+        race_stats = {}
+        for i, ((team_name, driver_name), (driver, _)) in enumerate(sorted_qualifying_results):
+            race_stats[(team_name, driver_name)] = calculate_race_stats(driver, effective_stats[(team_name, driver_name)], i + 1, qualifying_results, track_flags, rng)
 
     # Race
     race_results = []
     position_changes = []
     iteration = 0  # Initialize iteration before using it
     iterations = int((total_laps * base_time) / 750)  # Initialize iterations before using it
-    for i, ((team_name, driver_name), _) in enumerate(sorted_qualifying_results):
-        team = teams[team_name]
-        starting_position = i + 1
-        if team.drivers:  # Check if the team has at least one driver
-            race_result = simulate_race(team.drivers[0], team, starting_position, weather_condition, discipline, circuit_type, qualifying_results, sorted_qualifying_results, track_characteristics, iteration, iterations)
-            race_results.append((team_name, driver_name, race_result))
-        else:
-            pass  # Do nothing if no drivers available for the team
-
-    # Sort race results by performance score after the race
-    sorted_race_results = sorted(race_results, key=lambda x: (x[2] != 0, x[2]), reverse=True)
 
-    # Simulate the race over multiple iterations
-    for iteration in range(iterations):
-        new_race_results = []
-        for i, (team_name, driver_name, _) in enumerate(sorted_race_results):
-            team = teams[team_name]
-            starting_position = i + 1
-            if team.drivers:  # Check if the team has at least one driver
-                driver = team.drivers[0]
-                if driver.dnf == "Retirement" or driver.dnf == "Crash" or driver.dnf == "Collision":
-                    race_result = 0  # Mark the race result as 0 for retirement
+    with timed_phase("race"):
+        # The NumPy engine holds the field as arrays and runs each iteration for every car at once
+        field = None
+        if engine == "numpy":
+            import numpy as np
+
+            field = RaceField([key for key, _ in sorted_qualifying_results], registry, race_stats, len(qualifying_results), weather_condition, discipline, circuit_type, track_flags, iterations, np.random.default_rng(rng.getrandbits(64)))
+
+        # The laps engine uses the same field but steps once per lap, each lap being a share of a coarse iteration
+        lap_data = None
+        if engine == "laps":
+            import numpy as np
+
+            laps = int(total_laps)
+            field = RaceField([key for key, _ in sorted_qualifying_results], registry, race_stats, len(qualifying_results), weather_condition, discipline, circuit_type, track_flags, laps, np.random.default_rng(rng.getrandbits(64)), step_share=iterations / laps)
+            race_results, lap_data = field.simulate_laps([key for key, _ in sorted_qualifying_results], laps, base_time)
+            iterations = 0  # The laps already are the whole race
+        elif field is not None:
+            # Iteration 0 from the grid without the neighbour pass, then the whole race on the field's arrays
+            field.simulate_iteration(iteration, contacts=False)
+            for iteration in range(iterations):
+                field.simulate_iteration(iteration)
+            field.write_dnfs()
+            race_results = field.race_results()
+        else:
+            for i, ((team_name, driver_name), (driver, _)) in enumerate(sorted_qualifying_results):
+                team = teams[team_name]
+                starting_position = i + 1
+                if team.drivers:  # Check if the team has at least one driver
+                    race_result = simulate_race(driver, team, race_stats[(team_name, driver_name)], starting_position, weather_condition, discipline, circuit_type, qualifying_results, sorted_qualifying_results, track_flags, iteration, iterations, rng)
+                    race_results.append((team_name, driver_name, race_result))
                 else:
-                    race_result = simulate_race(driver, team, starting_position, weather_condition, discipline, circuit_type, qualifying_results, sorted_race_results, track_characteristics, iteration, iterations)
-                new_race_results.append((team_name, driver_name, race_result))
-            else:
-                pass  # Do nothing if no drivers available for the team
+                    pass  # Do nothing if no drivers available for the team
 
-        # Apply overtakes/blocks/clean air effects for each driver in new_race_results
-        for i, (team_name, driver_name, race_result) in enumerate(new_race_results):
-            team = teams[team_name]
-            driver = next((d for d in team.drivers if d.name == driver_name), None)
-            if driver:
-                race_result_mod, failure_collided_drivers = simulate_overtakes_blocks_clean_air(
-                    driver, team, teams, i + 1, new_race_results, iteration, iterations)
-                # Set race result to 0 for collided drivers
-                if failure_collided_drivers:
-                    new_race_results[i] = (team_name, driver_name, 0)
-                    for collided_name in failure_collided_drivers:
-                        for j, (tname, dname, rresult) in enumerate(new_race_results):
-                            if dname == collided_name:
-                                new_race_results[j] = (tname, dname, 0)
-                else:
-                    # Apply race_result_mod if not DNF
-                    if race_result != 0:
-                        new_race_results[i] = (team_name, driver_name, race_result + (race_result * race_result_mod))
-
-        # Simulate collisions after each iteration
-        collided_drivers = simulate_collision(new_race_results, teams, iterations)
-        for collided_driver in collided_drivers:
-            for i, (team_name, driver_name, race_result) in enumerate(new_race_results):
-                if collided_driver.name == driver_name:
-                    new_race_results[i] = (team_name, driver_name, 0)  # Set race result to 0 for collided drivers
-                    break
+        # Sort race results by performance score after the race, the field engines are already in running order
+        if field is not None:
+            sorted_race_results = race_results
+        else:
+            sorted_race_results = sorted(race_results, key=lambda x: (x[2] != 0, x[2]), reverse=True)
+
+            # Simulate the race over multiple iterations
+            for iteration in range(iterations):
+                sorted_race_results = simulate_race_iteration(sorted_race_results, teams, registry, qualifying_results, race_stats, weather_condition, discipline, circuit_type, track_flags, iteration, iterations, rng)
 
-        # Sort race results by performance score after each iteration
-        sorted_race_results = sorted(new_race_results, key=lambda x: (x[2] != 0, x[2]), reverse=True)
-
-        # # Print the winner of each iteration except the last one
-        # DEBUG if iteration < iterations - 1:
-        #     print(f"Iteration {iteration + 1} Results:")
-        #     for pos, (team_name, driver_name, race_result) in enumerate(sorted_race_results):
-        #         driver = next((d for d in teams[team_name].drivers if d.name == driver_name), None)
-        #         if driver:
-        #             # Find the previous position of the driver
-        #             previous_position = next(
-        #             (prev_pos for prev_pos, (prev_team_name, prev_driver_name, _) in enumerate(new_race_results)
-        #             if prev_team_name == team_name and prev_driver_name == driver_name),
-        #             None
-        #             )
-        #             # Calculate movement
-        #             movement = previous_position - pos if previous_position is not None else None
-        #             movement_str = f"({movement:+})" if movement is not None else "(N/A)"
-        #             print(f"{pos + 1}. {driver_name} ({team_name}) with score {race_result} {movement_str}")
-        #     print("\n")
+    if race_metrics is not None:
+        race_metrics.count("race_steps", int(total_laps) if lap_data is not None else iterations)
 
     # Calculate position changes by comparing original qualifying position with final race position
+    qualifying_positions = {key: qual_position for qual_position, (key, _) in enumerate(sorted_qualifying_results)}
     for race_position, (team_name_race, driver_name_race, race_result) in enumerate(sorted_race_results):
-        for qual_position, ((team_name_qual, driver_name_qual), _) in enumerate(sorted_qualifying_results):
-            if team_name_race == team_name_qual and driver_name_race == driver_name_qual:
-                # Calculate position change
-                position_change = qual_position - race_position
-                position_changes.append((team_name_race, driver_name_race, position_change))
-                break  # Stop inner loop once we find the match
+        qual_position = qualifying_positions.get((team_name_race, driver_name_race))
+        if qual_position is not None:
+            # Calculate position change
+            position_change = qual_position - race_position
+            position_changes.append((team_name_race, driver_name_race, position_change))
 
     highest_position_change = max(position_changes, key=lambda x: x[2])
 
     # Extract relevant information
     highest_team_name, highest_driver_name, position_change = highest_position_change
 
-    console = Console()
-
-    fastest_lap_driver, fastest_lap_time, most_laps_led_driver, most_laps_led_count, formatted_qualifying_lap_times, formatted_race_times = calculate_fastest_lap_and_laps_led(sorted_qualifying_results, dnq_results, sorted_race_results, total_laps, base_time)
+    with timed_phase("fastest lap and laps led"):
+        fastest_lap_driver, fastest_lap_time, most_laps_led_driver, most_laps_led_count, formatted_qualifying_lap_times, formatted_race_times = calculate_fastest_lap_and_laps_led(sorted_qualifying_results, dnq_results, sorted_race_results, total_laps, base_time, rng, lap_data)
 
-    # Shuffle entries randomly
-    randomized_results = sorted_qualifying_results.copy()
-    random.shuffle(randomized_results)
+    # Separate finished drivers from DNF drivers
+    finished_drivers = []
+    dnf_drivers = []
 
-    # List to keep track of entries that have been "revealed"
-    revealed_results = []
+    for i, (team_name, driver_name, race_result) in enumerate(sorted_race_results):
+        supplier = teams[team_name].supplier
 
-    # Function to build the current leaderboard as Text
-    def build_leaderboard_text(revealed_results, new_entry=None):
-        leaderboard_text = Text("\n - - - Qualifying Order - - - \n\n")
-        
-        if not revealed_results:
-            return leaderboard_text
-        
-        # Calculate max lengths for alignment
-        max_name_length = max(len(driver_name) for (_, driver_name), _ in revealed_results)
-        max_order_length = len(str(len(revealed_results)))
+        color = teams[team_name].color
 
-        # Build each line for the leaderboard
-        for i, ((team_name, driver_name), qualifying_result) in enumerate(revealed_results):
-            supplier = teams[team_name].supplier
+        entry = registry.get((team_name, driver_name))  # Find correct driver object
+        driver = entry[1] if entry else None
+        if race_result == 0 and driver and (driver.dnf == "Crash" or driver.dnf == "Collision" or driver.dnf == "Retirement"):
+            dnf_drivers.append((team_name, driver_name, driver.dnf, supplier, color))
+        else:
+            finished_drivers.append((team_name, driver_name, race_result, supplier, color))
 
-            color = teams[team_name].color
+    return {
+        "weather_condition": weather_condition,
+        "sorted_qualifying_results": sorted_qualifying_results,
+        "dnq_results": dnq_results,
+        "sorted_race_results": sorted_race_results,
+        "finished_drivers": finished_drivers,
+        "dnf_drivers": dnf_drivers,
+        "highest_position_change": highest_position_change,
+        "fastest_lap_driver": fastest_lap_driver,
+        "fastest_lap_time": fastest_lap_time,
+        "most_laps_led_driver": most_laps_led_driver,
+        "most_laps_led_count": most_laps_led_count,
+        "formatted_qualifying_lap_times": formatted_qualifying_lap_times,
+        "formatted_race_times": formatted_race_times
+    }
 
+class QualifyingLeaderboard:
+    # The qualifying order as it is revealed, kept sorted with bisect so a refresh only re-renders the rows that moved
+    def __init__(self, teams, formatted_qualifying_lap_times):
+        from rich.text import Text  # Only needed when a race is presented
+
+        self.Text = Text
+        self.teams = teams
+        self.lap_times = dict(formatted_qualifying_lap_times)
+        self.sort_keys = []  # Negated qualifying results, best first, in step with entries
+        self.entries = []
+        self.max_name_length = 0
+        self.team_texts = {}
+        self.row_cache = {}  # team_driver -> (position, name length, rendered row)
+
+    def build_team_text(self, team_name):
+        if team_name not in self.team_texts:
+            team = self.teams[team_name]
             main_team_name, *rest = team_name.split("- ")
 
-            if teams[team_name].alliance != "":
-                rest.append(f"/ {teams[team_name].alliance}")
+            if team.alliance != "":
+                rest.append(f"/ {team.alliance}")
 
-            colored_team_name = Text(main_team_name, style=color)
+            team_text = self.Text()
+            team_text.append(main_team_name, style=team.color)
+            if rest:
+                team_text.append(f" - {' '.join(rest)}")
+            if team.supplier:
+                team_text.append(f" - {team.supplier}")
+            team_text.append(")\n")
+            self.team_texts[team_name] = team_text
+
+        return self.team_texts[team_name]
+
+    def build_row(self, position, team_driver):
+        cached = self.row_cache.get(team_driver)
+        if cached and cached[0] == position and cached[1] == self.max_name_length:
+            return cached[2]
+
+        team_name, driver_name = team_driver
+        row = self.Text(f"{position:2}. {driver_name.ljust(self.max_name_length)}     ({self.lap_times[driver_name]})     (")
+        row.append(self.build_team_text(team_name))
+        self.row_cache[team_driver] = (position, self.max_name_length, row)
+        return row
+
+    def add(self, team_driver, qualifying_result):
+        # bisect_right keeps ties in reveal order, the same as appending and re-sorting
+        sort_key = -qualifying_result[1]
+        index = bisect.bisect_right(self.sort_keys, sort_key)
+        self.sort_keys.insert(index, sort_key)
+        self.entries.insert(index, team_driver)
+        self.max_name_length = max(self.max_name_length, len(team_driver[1]))
+
+    def build_text(self, new_entry=None):
+        leaderboard_text = self.Text("\n - - - Qualifying Order - - - \n\n")
+
+        for i, team_driver in enumerate(self.entries):
+            row = self.build_row(i + 1, team_driver)
+
+            # Make the new entry bold, on a copy so the cached row stays plain
+            if team_driver == new_entry:
+                row = row.copy()
+                row.stylize("bold")
+
+            leaderboard_text.append(row)
 
-            # Find the correct formatted qualifying lap time for this driver from qualifying_data
-            driver_qualifying_time = next(time for name, time in formatted_qualifying_lap_times if name == driver_name)
+        return leaderboard_text
 
-            # Construct the line for each driver
-            line = Text(f"{i+1:2}. {driver_name.ljust(max_name_length)}     ({driver_qualifying_time})     (")
-            line.append(colored_team_name)
-            if rest:
-                line.append(f" - {' '.join(rest)}")
-            if supplier:
-                line.append(f" - {supplier}")
-            line.append(")\n")
+def present_round(script_directory, race, teams, round_results, rng=random, markov_model=None):
+    # The terminal UI is only imported when a race is presented, batch runs never load it
+    from rich.console import Console
+    from rich.text import Text
+    from rich.live import Live
 
-            # Make the new entry bold
-            if new_entry and (team_name, driver_name) == new_entry:
-                line.stylize("bold")
+    order = race['Order']
+    circuit = race['Circuit']
+    country = race['Country']
+    circuit_type = race['Type']
+    total_laps = float(race['Laps'])
+    lap_record = race['Lap Record']
+    grid_size = int(race['Grid Size'])
 
-            leaderboard_text.append(line)
+    weather_condition = round_results["weather_condition"]
+    sorted_qualifying_results = round_results["sorted_qualifying_results"]
+    dnq_results = round_results["dnq_results"]
+    sorted_race_results = round_results["sorted_race_results"]
+    finished_drivers = round_results["finished_drivers"]
+    dnf_drivers = round_results["dnf_drivers"]
+    fastest_lap_driver = round_results["fastest_lap_driver"]
+    fastest_lap_time = round_results["fastest_lap_time"]
+    most_laps_led_driver = round_results["most_laps_led_driver"]
+    most_laps_led_count = round_results["most_laps_led_count"]
+    formatted_qualifying_lap_times = round_results["formatted_qualifying_lap_times"]
+    formatted_race_times = round_results["formatted_race_times"]
 
-        return leaderboard_text
+    # Extract relevant information
+    highest_team_name, highest_driver_name, position_change = round_results["highest_position_change"]
+
+    print(f"\n(Round {order}: {circuit} - {country} - {circuit_type} - {int(total_laps)} laps)\n")
+    print(f"Weather: {weather_condition}")
+    print(f"Lap Record: {lap_record}")
+
+    # Wait for user input before displaying qualifying results
+    # input("\n...")
+
+    time.sleep(0.75)  # Add a delay between each entry
+
+    console = Console()
+
+    # Shuffle entries randomly
+    randomized_results = sorted_qualifying_results.copy()
+    rng.shuffle(randomized_results)
+
+    # Entries that have been "revealed" so far
+    leaderboard = QualifyingLeaderboard(teams, formatted_qualifying_lap_times)
 
     # Use Live to update the leaderboard in place
-    with Live(build_leaderboard_text(revealed_results), refresh_per_second=4, console=console) as live:
+    with Live(leaderboard.build_text(), refresh_per_second=4, console=console) as live:
         for team_driver, qualifying_result in randomized_results:
-            # Add the new result to the revealed list and sort it
-            revealed_results.append((team_driver, qualifying_result))
-            revealed_results.sort(key=lambda x: x[1][1], reverse=True)  # Sort by qualifying result (time or score)
+            # Insert the new result at its place in the order
+            leaderboard.add(team_driver, qualifying_result)
 
             # Update the leaderboard display with the new entry highlighted
-            live.update(build_leaderboard_text(revealed_results, new_entry=team_driver))
+            live.update(leaderboard.build_text(new_entry=team_driver))
             time.sleep(0.5)  # Delay to simulate qualifying results coming in progressively
 
    # Print DNQ drivers
     if dnq_results:
         print("\n - - - Failed to Qualify - - - \n")
+        max_name_length = max(len(driver_name) for (_, driver_name), _ in sorted_qualifying_results)
         for i, ((team_name, driver_name), qualifying_result) in enumerate(dnq_results):
             supplier = teams[team_name].supplier
 
@@ -2019,10 +2993,7 @@ def main():
 
             colored_team_name = Text(main_team_name, style=color)
 
-            max_name_length = max(len(driver_name) for (_, driver_name), _ in sorted_qualifying_results)
-
-            # Find the correct formatted qualifying lap time for this driver from qualifying_data
-            driver_qualifying_time = next(time for name, time in formatted_qualifying_lap_times if name == driver_name)
+            driver_qualifying_time = leaderboard.lap_times[driver_name]
 
             # Construct the full line with colors
             line = Text(f"{i+1+grid_size:2}. {driver_name.ljust(max_name_length)}     ({driver_qualifying_time})     (")
@@ -2039,18 +3010,21 @@ def main():
     time.sleep(1)  # Add a delay between each entry
 
     # Initialize MarkovChain
-    markov = MarkovChain()
-    markov.load_from_csv(script_directory, delimiter='|')
+    markov = MarkovChain(rng=rng)
+    if markov_model is not None:
+        markov.load_model(markov_model)  # Compiled with the series bundle
+    else:
+        markov.load_from_csv(script_directory, delimiter='|')
 
     def insert_curses(text):
         # Smaller numbers of curse insertions are weighted higher
         weights = [0.75, 0.5, 0.05, 0.025, 0.025]
-        num_curses = random.choices(range(0, 5), weights=weights, k=1)[0]
+        num_curses = rng.choices(range(0, 5), weights=weights, k=1)[0]
         for _ in range(num_curses):
             words = text.split()
             if len(words) > 2:
-                idx = random.randint(1, len(words) - 2)
-                words.insert(idx, random.choice(["d*** well", "f******", "f******", "freaking", "honestly", "seriously", "effing", "bloody", "absolutely"]))
+                idx = rng.randint(1, len(words) - 2)
+                words.insert(idx, rng.choice(["d*** well", "f******", "f******", "freaking", "honestly", "seriously", "effing", "bloody", "absolutely"]))
                 text = " ".join(words)
         return text
 
@@ -2062,23 +3036,24 @@ def main():
         bottom_25 = int(num_drivers * 0.75)
 
         if i <= top_25 and i <= driver.target:
-            if random.uniform(0, 1) < 0.4 or i == 0:  # Allow more interviews for top drivers
+            if rng.uniform(0, 1) < 0.4 or i == 0:  # Allow more interviews for top drivers
                 text = markov.generate("Good Interview", driver_name=driver_name, team_name=team_name)
                 text = insert_curses(text)
                 print(f"INTERVIEW - ({driver_name} - {i + 1}):       '" + text + "'")
 
         if i >= bottom_25 and i >= driver.target:
-            if random.uniform(0, 1) < 0.2:
+            if rng.uniform(0, 1) < 0.2:
                 text = markov.generate("Poor Interview", driver_name=driver_name, team_name=team_name)
                 text = insert_curses(text)
                 print(f"INTERVIEW - ({driver_name} - {i + 1}):       '" + text + "'")
     
     for i, ((team_name, driver_name), qualifying_result) in enumerate(dnq_results):
-        if random.uniform(0, 1) < 0.2:
+        if rng.uniform(0, 1) < 0.2:
             text = markov.generate("Poor Interview", driver_name=driver_name, team_name=team_name)
             text = insert_curses(text)
             print(f"INTERVIEW - ({driver_name} - DNQ):       '" + text + "'")
 
+    # import keyboard  # Needs root on Linux, so only import it here if the wait below is re-enabled
     # keyboard.wait('space')
     time.sleep(1.5)  # Add delay between each entry
 
@@ -2087,28 +3062,6 @@ def main():
     max_name_length_race = max(len(driver_name) for _, driver_name, _ in sorted_race_results)
     max_order_length_race = len(str(len(sorted_race_results)))  # Length of the highest numbered order
 
-    # Separate finished drivers from DNF drivers
-    finished_drivers = []
-    dnf_drivers = []
-
-    for i, (team_name, driver_name, race_result) in enumerate(sorted_race_results):
-        supplier = teams[team_name].supplier
-
-        color = teams[team_name].color
-
-        main_team_name, *rest = team_name.split("- ")
-
-        if teams[team_name].alliance != "":
-            rest.append(f"/ {teams[team_name].alliance}")
-
-        colored_team_name = Text(main_team_name, style=color)
-
-        driver = next((driver for driver in teams[team_name].drivers if driver.name in driver_name.split(' / ')), None)  # Find correct driver object
-        if race_result == 0 and driver and (driver.dnf == "Crash" or driver.dnf == "Collision" or driver.dnf == "Retirement"):
-            dnf_drivers.append((team_name, driver_name, driver.dnf, supplier, color))
-        else:
-            finished_drivers.append((team_name, driver_name, race_result, supplier, color))
-
     # Print finished drivers
     for i, (team_name, driver_name, race_result, supplier, color) in enumerate(finished_drivers):
         main_team_name, *rest = team_name.split("- ")  # Split team name
@@ -2172,15 +3125,15 @@ def main():
         bottom_20 = int(num_drivers * 0.8)
 
         if i == 0:
-            if random.uniform(0, 1) < 0.5:
+            if rng.uniform(0, 1) < 0.5:
                 print(f"{driver_name} ({team_name}) takes victory!\n")
             else:
                 print(f"{driver_name} ({team_name}) wins!\n")
         if i == 0:
             second_place = sorted_race_results[1][1]
             second_place_team = sorted_race_results[1][0]
-            if random.uniform(0, 1) < 0.5:  # Adjust the probability as needed
-                if random.uniform(0, 1) < 0.5:
+            if rng.uniform(0, 1) < 0.5:  # Adjust the probability as needed
+                if rng.uniform(0, 1) < 0.5:
                     print(f"{driver_name} ({team_name}) beats {second_place} ({second_place_team}) to take victory!\n")
                 else:
                     print(f"{driver_name} ({team_name}) outduels {second_place} ({second_place_team}) for the win!\n")
@@ -2189,25 +3142,49 @@ def main():
         num_drivers = len(finished_drivers)
         top_25 = int(num_drivers * 0.25)
         bottom_25 = int(num_drivers * 0.75)
+        driver = next((driver for driver in teams[team_name].drivers if driver.name in driver_name.split(' / ')), None)  # Find correct driver object
+        if not driver:
+            continue
+
         if i <= top_25 and i <= driver.target:
-            if random.uniform(0, 1) < 0.5 or i == 0:  # Adjust the probability as needed
+            if rng.uniform(0, 1) < 0.5 or i == 0:  # Adjust the probability as needed
                 text = markov.generate("Good Interview", driver_name=driver_name, team_name=team_name)
                 text = insert_curses(text)
                 print(f"INTERVIEW - ({driver_name} - {i + 1}):       '" + text + "'")
 
         if i >= bottom_25 and i >= driver.target:
-            if random.uniform(0, 1) < 0.25:  # Adjust the probability as needed
+            if rng.uniform(0, 1) < 0.25:  # Adjust the probability as needed
                 text = markov.generate("Poor Interview", driver_name=driver_name, team_name=team_name)
                 text = insert_curses(text)
                 print(f"INTERVIEW - ({driver_name} - {i + 1}):       '" + text + "'")
     
     for i, (team_name, driver_name, _, _, _) in enumerate(dnf_drivers):
-        if random.uniform(0, 1) < 0.25:  # Adjust the probability as needed
+        if rng.uniform(0, 1) < 0.25:  # Adjust the probability as needed
             text = markov.generate("Poor Interview", driver_name=driver_name, team_name=team_name)
             text = insert_curses(text)
             print(f"INTERVIEW - ({driver_name} - DNF):       '" + text + "'")
 
-    # Save race results to a JSON file
+
+def build_race_results_data(series, race, teams, round_results):
+    series_name = series["series_name"]
+    order = race['Order']
+    circuit = race['Circuit']
+    event = race['Event']
+    lap_record = race['Lap Record']
+    grid_size = int(race['Grid Size'])
+
+    weather_condition = round_results["weather_condition"]
+    sorted_qualifying_results = round_results["sorted_qualifying_results"]
+    dnq_results = round_results["dnq_results"]
+    finished_drivers = round_results["finished_drivers"]
+    dnf_drivers = round_results["dnf_drivers"]
+    fastest_lap_driver = round_results["fastest_lap_driver"]
+    fastest_lap_time = round_results["fastest_lap_time"]
+    most_laps_led_driver = round_results["most_laps_led_driver"]
+    most_laps_led_count = round_results["most_laps_led_count"]
+    formatted_qualifying_lap_times = round_results["formatted_qualifying_lap_times"]
+    formatted_race_times = round_results["formatted_race_times"]
+
     race_results_data = {
         "Series": series_name,
         "Order": order,
@@ -2235,6 +3212,34 @@ def main():
         "Most Laps Led": {"Driver": most_laps_led_driver, "Laps": most_laps_led_count}
     }
 
+    return race_results_data
+
+def run_race(script_directory, series, race, teams, rng=random, present=True, engine="scalar"):
+    series_name = series["series_name"]
+    order = race['Order']
+    circuit = race['Circuit']
+
+    # With instrumentation on the race draws from a counting copy of the generator, which hands its state back afterwards
+    race_rng = rng
+    if race_metrics is not None:
+        race_rng = CountingRandom()
+        race_rng.setstate(rng.getstate())
+        if race_metrics.profiler is not None:
+            race_metrics.profiler.enable()
+
+    with timed_phase("standings read"):
+        standings_data = read_standings_data(series_name, script_directory, series["discipline"])
+
+    with timed_phase("simulate round"):
+        round_results = simulate_round(series, race, teams, standings_data, race_rng, engine)
+
+    # The leaderboard reveal, delays and news are skipped when only the results are wanted
+    if present:
+        with timed_phase("presentation"):
+            present_round(script_directory, race, teams, round_results, race_rng, series.get("markov_model"))
+
+    race_results_data = build_race_results_data(series, race, teams, round_results)
+
     # Create the directory if it doesn't exist
     results_dir = os.path.join(script_directory, "Schedules", "Races")
     os.makedirs(results_dir, exist_ok=True)
@@ -2244,8 +3249,292 @@ def main():
     json_file_path = os.path.join(results_dir, json_filename)
 
     # Write the race results to the JSON file
+    with timed_phase("results json"):
+        with open(json_file_path, 'w') as json_file:
+            json.dump(race_results_data, json_file, indent=4)
+
+    if race_metrics is not None:
+        rng.setstate(race_rng.getstate())
+        write_race_metrics(json_file_path, series, race, engine, round_results, race_rng.draws)
+
+    return json_file_path
+
+def write_race_metrics(json_file_path, series, race, engine, round_results, rng_draws):
+    # The metrics record goes next to the race JSON as "<race file>.metrics.json", the profile as "<race file>.prof"
+    global race_metrics
+    metrics = race_metrics
+    base_path = os.path.splitext(json_file_path)[0]
+
+    profile_filename = None
+    if metrics.profiler is not None:
+        metrics.profiler.disable()
+        metrics.profiler.dump_stats(f"{base_path}.prof")
+        profile_filename = os.path.basename(f"{base_path}.prof")
+
+    metrics.count("rng_draws", rng_draws)
+
+    dnfs = {}
+    for _, _, cause, _, _ in round_results["dnf_drivers"]:
+        dnfs[cause] = dnfs.get(cause, 0) + 1
+
+    record = {
+        "Series": series["series_name"],
+        "Order": race['Order'],
+        "Circuit": race['Circuit'],
+        "Engine": engine,
+        "Entrants": len(round_results["sorted_qualifying_results"]) + len(round_results["dnq_results"]),
+        "Weather": round_results["weather_condition"],
+        "Phases": {name: round(seconds, 6) for name, seconds in metrics.phases.items()},
+        "Counters": dict(sorted(metrics.counters.items())),
+        "DNFs": dict(sorted(dnfs.items())),
+        "Profile": profile_filename
+    }
+
+    with open(f"{base_path}.metrics.json", 'w') as json_file:
+        json.dump(record, json_file, indent=4)
+
+    # The next race starts a record of its own
+    race_metrics = RaceMetrics(metrics.profiler is not None)
+
+def load_championship_module(script_directory, script_filename):
+    # The Championships script shares this script's filename, so load it by path rather than by import name
+    module_path = os.path.join(script_directory, "Championships", f"{script_filename}.py")
+
+    if not os.path.exists(module_path):
+        raise FileNotFoundError(f"Championships script not found: {module_path}")
+
+    spec = importlib.util.spec_from_file_location("championship", module_path)
+    championship = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(championship)
+    return championship
+
+def run_season(script_directory, script_filename, series, remaining_races, rng=random, present=True, engine="scalar", verify_standings=False):
+    championship = load_championship_module(script_directory, script_filename)
+    championship_directory = os.path.dirname(championship.__file__)
+
+    for race in remaining_races:
+        # The roster is never modified by a round, so every round reuses the loaded teams
+        run_race(script_directory, series, race, series["teams"], rng, present, engine)
+
+        # Update the standings so the next round sees this round's results, only this round is applied to the last snapshot
+        championship.update_standings(championship_directory, series["series_name"], verbose=present, incremental=True, verify=verify_standings)
+
+def build_standings_data(sorted_standings, team_names):
+    # What read_standings_data returns for the standings file the Championships script would write after this round
+    drivers_standings = []
+    for rank, (driver, stats) in enumerate(sorted_standings):
+        drivers_standings.append({"Rank": rank + 1, "Driver": driver, "Team": team_names[driver], **stats})
+
+    entrants_standings = build_entrant_standings(drivers_standings)
+
+    return {
+        "drivers_standings": drivers_standings,
+        "teams_standings": [],
+        "entrants_standings": entrants_standings,
+        "entrants_by_name": {entry["Entrant"]: entry for entry in entrants_standings}
+    }
+
+def simulate_season(series, championship, seed, engine="scalar", season=0):
+    # Every season gets its own generator, so a seed always replays the same season
+    rng = random.Random(seed)
+
+    series_name = series["series_name"]
+    discipline = series["discipline"]
+
+    season_standings = {}
+    season_finishes = {}  # Finishing position counts for the tiebreaks
+    team_names = {}  # Each driver's latest entry, as the standings file records it
+    race_results_list = []
+    store_rows = []  # Rows for the championship's results store, numbered with season
+    standings_data = None  # No standings exist before the first round
+
+    teams = clone_teams(series["teams"])  # Each season races a roster of its own
+    for i, race in enumerate(series["sorted_schedule"]):
+        round_results = simulate_round(series, race, teams, standings_data, rng, engine)
+        race_results_data = build_race_results_data(series, race, teams, round_results)
+
+        race_results = race_results_data["Race Results"]
+        championship.apply_points(series_name, race_results, race_results_data["Qualifying Results"], race_results_data["DNF Drivers"], race_results_data["DNQ Drivers"], race_results_data["Fastest Lap"], race_results_data["Most Laps Led"], discipline, season_standings, season_finishes, round_points=None)
+        championship.reset_for_playoffs(season_standings, i, series_name)
+
+        # apply_points appends the DNF drivers, so this holds every classified driver
+        for result in race_results + race_results_data["DNQ Drivers"]:
+            team_names[result["Driver"]] = result["Team"]
+
+        race_results_list.append(race_results)
+        store_rows.extend(championship.build_results_rows(series_name, season, race['Order'], race_results, race_results_data["Qualifying Results"], race_results_data["DNQ Drivers"], race_results_data["Fastest Lap"], race_results_data["Most Laps Led"]))
+        standings_data = build_standings_data(championship.sort_standings(season_standings, season_finishes), team_names)
+
+    return championship.sort_standings(season_standings, season_finishes), race_results_list, store_rows
+
+# Per-process state for the Monte Carlo workers, loaded once by init_monte_carlo_worker
+monte_carlo_worker = {}
+
+def init_monte_carlo_worker(script_directory, script_filename, engine="scalar"):
+    monte_carlo_worker["series"] = load_series(script_directory, script_filename)
+    monte_carlo_worker["championship"] = load_championship_module(script_directory, script_filename)
+    monte_carlo_worker["engine"] = engine
+
+def run_monte_carlo_seeds(seasons_and_seeds):
+    series = monte_carlo_worker["series"]
+    championship = monte_carlo_worker["championship"]
+    engine = monte_carlo_worker["engine"]
+
+    # Tallies and results store rows for this batch of seasons, merged by the parent process. The rows go back
+    # encoded, so the parent's share of the work stays small however many workers run.
+    tallies = {}
+    store_rows = []
+    for season, seed in seasons_and_seeds:
+        sorted_standings, race_results_list, season_rows = simulate_season(series, championship, seed, engine, season)
+        store_rows.extend(season_rows)
+
+        for position, (driver, stats) in enumerate(sorted_standings, start=1):
+            tally = tallies.setdefault(driver, {"Titles": 0, "Wins": 0, "Podiums": 0, "Positions": {}})
+            tally["Positions"][position] = tally["Positions"].get(position, 0) + 1
+            if position == 1:
+                tally["Titles"] += 1
+
+        for race_results in race_results_list:
+            for result in race_results:
+                tally = tallies.setdefault(result["Driver"], {"Titles": 0, "Wins": 0, "Podiums": 0, "Positions": {}})
+                if result["Position"] == 1:
+                    tally["Wins"] += 1
+                if result["Position"] <= 3:
+                    tally["Podiums"] += 1
+
+    return tallies, championship.encode_results_rows(store_rows)
+
+def run_monte_carlo(script_directory, script_filename, series, seasons, workers=None, seed=None, engine="scalar"):
+    series_name = series["series_name"]
+    rounds = len(series["sorted_schedule"])
+
+    workers = workers or os.cpu_count() or 1
+    base_seed = seed if seed is not None else random.randrange(2 ** 32)
+    seeds = [base_seed + i for i in range(seasons)]
+
+    # A few batches per worker keeps every core busy without paying for one task per season. Capping the batch
+    # bounds the store rows a batch brings back, however many seasons are run.
+    batch_size = max(1, min(50, math.ceil(seasons / (workers * 4))))
+    seasons_and_seeds = list(enumerate(seeds, start=1))
+    batches = [seasons_and_seeds[i:i + batch_size] for i in range(0, seasons, batch_size)]
+
+    # Every simulated round goes to a columnar results store, one season number per simulated season.
+    # Each batch is appended as it arrives, the first one rewrites the store.
+    championship = load_championship_module(script_directory, script_filename)
+    logs_dir = os.path.join(script_directory, "Championships", "Logs")
+    keep_rounds = 0
+
+    tallies = {}
+    parent_time = 0.0  # Merging and storing, the only part of the run that doesn't spread over the workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_monte_carlo_worker, initargs=(script_directory, script_filename, engine)) as executor:
+        for batch_tallies, batch_store in executor.map(run_monte_carlo_seeds, batches):
+            start = time.perf_counter()
+            championship.write_encoded_results_store(logs_dir, f"{series_name} - Monte Carlo", batch_store, keep_rounds=keep_rounds)
+            keep_rounds = None
+            for driver, batch_tally in batch_tallies.items():
+                tally = tallies.setdefault(driver, {"Titles": 0, "Wins": 0, "Podiums": 0, "Positions": {}})
+                tally["Titles"] += batch_tally["Titles"]
+                tally["Wins"] += batch_tally["Wins"]
+                tally["Podiums"] += batch_tally["Podiums"]
+                for position, count in batch_tally["Positions"].items():
+                    tally["Positions"][position] = tally["Positions"].get(position, 0) + count
+            parent_time += time.perf_counter() - start
+
+    # Convert the tallies into probabilities
+    monte_carlo_results = []
+    for driver, tally in tallies.items():
+        positions = tally["Positions"]
+        average_position = sum(position * count for position, count in positions.items()) / max(1, sum(positions.values()))
+        monte_carlo_results.append({
+            "Driver": driver,
+            "Title": tally["Titles"] / seasons,
+            # Title is per season, wins and podiums are rates per race
+            "Win Rate Per Race": tally["Wins"] / (seasons * rounds),
+            "Podium Rate Per Race": tally["Podiums"] / (seasons * rounds),
+            "Average Position": average_position,
+            "Positions": {position: count / seasons for position, count in sorted(positions.items())}
+        })
+
+    monte_carlo_results.sort(key=lambda x: (-x["Title"], x["Average Position"]))
+
+    print(f"\n - - - {series_name} - Monte Carlo ({seasons} seasons, {rounds} rounds) - - - \n")
+    max_name_length = max(len(result["Driver"]) for result in monte_carlo_results)
+    print(f"    {'Driver':<{max_name_length}} | {'Title':>7} | {'Win/Race':>8} | {'Podium/Race':>11} | {'Avg Pos':>7}\n")
+    for i, result in enumerate(monte_carlo_results):
+        print(f"{i+1:>2}. {result['Driver']:<{max_name_length}} | {result['Title']:>7.2%} | {result['Win Rate Per Race']:>8.2%} | "
+              f"{result['Podium Rate Per Race']:>11.2%} | {result['Average Position']:>7.2f}")
+
+    # Write the summary next to the standings logs
+    json_filename = f"{series_name} - Monte Carlo.json"
+    json_file_path = os.path.join(logs_dir, json_filename)
     with open(json_file_path, 'w') as json_file:
-        json.dump(race_results_data, json_file, indent=4)
+        json.dump({"Series": series_name, "Seasons": seasons, "Rounds": rounds, "Seed": base_seed, "Results": monte_carlo_results}, json_file, indent=4)
+
+    print(f"\nMonte Carlo summary saved to {json_filename}")
+    print(f"Parent time merging and storing: {parent_time:.3f}s")
+
+    return monte_carlo_results
+
+def main(season=False, monte_carlo=0, workers=None, seed=None, fast=False, engine="scalar", verify_standings=False, metrics=False, profile=False):
+    # One generator drives the whole run, so the same seed reproduces the same results
+    rng = random.Random(seed)
+
+    # Loading the series counts towards the first race's metrics
+    if metrics or profile:
+        enable_race_metrics(profile)
+
+    # Get the directory path of the script
+    script_directory = os.path.dirname(os.path.abspath(__file__))
+
+    # Get the filename without extension
+    script_filename = os.path.splitext(os.path.basename(__file__))[0]
+
+    with timed_phase("load series"):
+        series = load_series(script_directory, script_filename, rng)
+    if series is None:
+        return
+
+    # Monte Carlo seasons always run the full schedule and never touch the saved races
+    if monte_carlo:
+        run_monte_carlo(script_directory, script_filename, series, monte_carlo, workers, seed, engine)
+        return
+
+    series_name = series["series_name"]
+    sorted_schedule = series["sorted_schedule"]
+
+    # Check if the "Races" directory exists and get the most recent race order
+    results_dir = os.path.join(script_directory, "Schedules", "Races")
+    os.makedirs(results_dir, exist_ok=True)
+
+    last_race_order = get_last_race_order(results_dir, series_name)
+
+    # No race has been run yet, so the whole schedule remains
+    if last_race_order is None:
+        remaining_races = sorted_schedule
+    else:
+        remaining_races = [race for race in sorted_schedule if int(race['Order']) > last_race_order]
+
+    if not remaining_races:
+        print(f"No remaining races to run in the schedule for {series_name}.")
+        return
+
+    if season:
+        run_season(script_directory, script_filename, series, remaining_races, rng, present=not fast, engine=engine, verify_standings=verify_standings)
+    else:
+        # Run the next race in the schedule
+        run_race(script_directory, series, remaining_races[0], series["teams"], rng, present=not fast, engine=engine)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simulate the next race of the series.")
+    parser.add_argument("--season", action="store_true", help="simulate every remaining round of the schedule in one run")
+    parser.add_argument("--monte-carlo", type=int, default=0, metavar="SEASONS", help="simulate this many full seasons in parallel and report title, win and podium odds")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes for --monte-carlo (default: one per core)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random number generator, the same seed reproduces the same results")
+    parser.add_argument("--fast", action="store_true", help="skip the leaderboard reveal, delays and news and only write the results")
+    parser.add_argument("--engine", choices=["scalar", "numpy", "laps"], default="scalar", help="race engine, numpy runs every car of an iteration at once and laps runs the race lap by lap on cumulative race times")
+    parser.add_argument("--verify-standings", action="store_true", help="with --season, check each incremental standings update against a full replay of every race")
+    parser.add_argument("--metrics", action="store_true", help="write phase timings and event counters for every race next to its results JSON")
+    parser.add_argument("--profile", action="store_true", help="like --metrics, and also save a cProfile capture of every race")
+    args = parser.parse_args()
+
+    main(season=args.season, monte_carlo=args.monte_carlo, workers=args.workers, seed=args.seed, fast=args.fast, engine=args.engine, verify_standings=args.verify_standings, metrics=args.metrics, profile=args.profile)
@@ -0,0 +1,465 @@
+import argparse
+import csv
+import importlib.util
+import os
+import random
+import shutil
+import time
+
+# Seeded synthetic worlds for stress testing the loaders and race engines at any size.
+# Legal values come from the Attribute Limits, trait and characteristic lists in Data, so generated entries only
+# use names the simulation knows. A world has the same layout as this directory and loads with load_series.
+
+# Rating ranges for attributes the Attribute Limits file has no range for, taken from the shipped rosters
+rating_ranges = {
+    "Age": (18, 40),
+    "Psyche": (40, 95),
+    "Speed": (40, 95),
+    "Skill": (40, 95),
+    "Bravery": (40, 95),
+    "Fitness": (0.75, 1),
+    "Prestige": (0.3, 1),
+    "Performance": (130, 190),
+    "Aero": (45, 95),
+    "Gearbox": (45, 95),
+    "Suspension": (45, 95),
+    "Brakes": (45, 95),
+    "Reliability": (0.7, 0.95),
+    "Power": (60, 95),
+    "Engine Reliability": (0.75, 0.9),
+    "Difficulty": (0.1, 0.6)
+}
+
+road_circuit_types = ["Grand Prix", "Road Course", "Street Track"]
+oval_circuit_types = ["Short Track", "Mile Oval", "Speedway", "Superspeedway"]
+
+# Laps and base lap time in seconds per circuit type
+circuit_lengths = {
+    "Grand Prix": ((50, 75), (75, 110)),
+    "Road Course": ((40, 90), (70, 120)),
+    "Street Track": ((50, 80), (75, 115)),
+    "Short Track": ((300, 500), (14, 22)),
+    "Mile Oval": ((200, 320), (22, 32)),
+    "Speedway": ((160, 270), (28, 45)),
+    "Superspeedway": ((180, 200), (45, 55))
+}
+
+sponsor_types = ["Airline", "Alcohol", "Automotive", "Banking & Insurance", "Conglomerate", "E-Commerce", "Energy Drink", "Fashion",
+                 "IT & Consulting", "Oil & Gas", "Retail", "Technology", "Telecommunications", "Trading"]
+tire_compounds = [("Super Soft", 1.04, 0.7, 1.6), ("Soft", 1.02, 0.75, 1.3), ("Medium", 1, 0.8, 1), ("Hard", 0.98, 0.85, 0.8), ("Wet", 0.9, 1.1, 1.2)]
+
+name_syllables = ["ka", "lo", "ren", "mar", "ti", "sa", "vel", "do", "ni", "ber", "ro", "an", "es", "li", "to", "gar", "mi", "del",
+                  "ha", "ru", "ven", "zo", "qui", "nel", "fa", "ost", "ur", "ben", "cha", "dri"]
+surname_endings = ["son", "ez", "ini", "ov", "sen", "ard", "elli", "berg", "ton", "ski", "ier", "ara", "mann", "ey", "ot"]
+team_words = ["Racing", "Motorsport", "Engineering", "Competition", "Works", "Autosport", "Grand Prix", "Speed"]
+circuit_words = ["International Circuit", "Raceway", "Motor Speedway", "Street Circuit", "Ring", "Park", "Speedway", "Autodrome"]
+sponsor_words = ["Group", "Energy", "Telecom", "Holdings", "Bank", "Air", "Motors", "Systems", "Foods", "Capital"]
+team_statuses = ["Insecure", "Limited", "Guest", "Premier", "R/D", "Start/Park"]  # Entry statuses the race engine acts on
+
+data_files = ["Colors.csv", "Text.csv", "Attribute Limits - temp.txt", "Driver Trait List - temp.txt",
+              "Chassis Characteristic List - temp.txt", "Track Characteristic List - temp.txt"]
+
+entry_fields = ["Name", "Nationality", "Age", "Psyche", "Speed", "Skill", "Bravery", "Fitness", "Experience", "Morale", "Discipline",
+                "Preference", "Style", "Traits", "Fame", "Reputation", "Funding", "Personal Sponsors", "Contract", "Target", "Relations",
+                "Team", "Charter", "Alliance", "Prestige", "Color", "Status", "Primary Sponsor", "Commitment", "Secondary Sponsors",
+                "Chassis", "Design", "Performance", "Aero", "Gearbox", "Suspension", "Brakes", "Reliability", "Characteristics",
+                "Engineer", "Supplier", "Engine", "Power", "Engine Reliability", "Tires", "Pit Crew", "Strategist"]
+schedule_fields = ["Order", "Circuit", "Country", "Event", "Type", "Difficulty", "Speed", "Clear", "Rainy", "Overcast", "Hot", "Stormy",
+                   "Characteristics", "Laps", "Base Time", "Lap Record", "Grid Size"]
+rules_fields = ["Series", "Discipline", "Region", "Tier", "Teams", "Chassis", "Engine", "Practice Sessions", "Charter", "Charter Slots",
+                "Retirement Threshold"]
+sponsor_fields = ["Name", "Nationality", "Type", "Parent", "Budget", "Branding", "Interest"]
+tire_fields = ["Tire", "Performance", "Wet Performance", "Wear Rate"]
+free_agent_fields = ["Name", "Nationality", "Age", "Psyche", "Speed", "Skill", "Bravery", "Fitness", "Experience", "Morale", "Discipline",
+                     "Preference", "Style", "Traits", "Fame", "Reputation", "Funding", "Personal Sponsor", "Relations", "Team", "Activity", "Interest"]
+reserve_driver_fields = ["Name", "Nationality", "Age", "Psyche", "Speed", "Skill", "Bravery", "Fitness", "Experience", "Morale", "Discipline",
+                         "Preference", "Style", "Traits", "Fame", "Reputation", "Funding", "Personal Sponsor", "Contract", "Relations", "Team", "Patience"]
+
+def read_attribute_limits(limits_path):
+    # Attribute name -> (low, high) for ranges like "Experience 0-1", or the list of allowed values indented under it.
+    # Values nested deeper than the first one (Endurance sub-disciplines) are left out, "USA - United States" keeps "USA".
+    limits = {}
+    attribute = None
+    value_depth = None
+
+    with open(limits_path, encoding="utf-8") as limits_file:
+        for line in limits_file:
+            if not line.strip():
+                continue
+
+            depth = len(line) - len(line.lstrip("\t"))
+            if depth == 0:
+                parts = line.split()
+                attribute = parts[0]
+                value_depth = None
+                low, _, high = parts[-1].partition("-")
+                try:
+                    limits[attribute] = (float(low), float(high))
+                except ValueError:
+                    limits[attribute] = []
+                continue
+
+            if attribute is None or not isinstance(limits[attribute], list):
+                continue
+            if value_depth is None:
+                value_depth = depth
+            if depth == value_depth:
+                limits[attribute].append(line.split(" - ")[0].strip())
+
+    return limits
+
+def read_name_list(list_path):
+    # Same rule the race script uses to intern trait and characteristic flags
+    names = []
+    with open(list_path, encoding="utf-8") as list_file:
+        for line in list_file:
+            name = line.split(" - ")[0].strip()
+            if name and " " not in name and name[0].isalpha():
+                names.append(name)
+    return names
+
+def read_color_names(colors_path):
+    with open(colors_path, newline='', encoding='utf-8') as csvfile:
+        return list(dict.fromkeys(row['Color'] for row in csv.DictReader(csvfile)))
+
+def read_vocabulary(script_directory):
+    data_directory = os.path.join(script_directory, "Data")
+    limits = read_attribute_limits(os.path.join(data_directory, "Attribute Limits - temp.txt"))
+    for attribute, limit in rating_ranges.items():
+        limits.setdefault(attribute, limit)
+
+    return {
+        "limits": limits,
+        "traits": read_name_list(os.path.join(data_directory, "Driver Trait List - temp.txt")),
+        "chassis_characteristics": read_name_list(os.path.join(data_directory, "Chassis Characteristic List - temp.txt")),
+        "track_characteristics": read_name_list(os.path.join(data_directory, "Track Characteristic List - temp.txt")),
+        "colors": read_color_names(os.path.join(data_directory, "Colors.csv"))
+    }
+
+class NameSource:
+    # Unique made-up names, every name handed out is remembered so none repeats within a world
+    def __init__(self, rng):
+        self.rng = rng
+        self.used = set()
+
+    def word(self, syllables):
+        return "".join(self.rng.choice(name_syllables) for _ in range(syllables)).capitalize()
+
+    def unique(self, make):
+        # Huge worlds run out of fresh combinations, after a few misses the name gets a number instead
+        name = make()
+        for _ in range(8):
+            if name not in self.used:
+                break
+            name = make()
+
+        base_name = name
+        number = 2
+        while name in self.used:
+            name = f"{base_name} {number}"
+            number += 1
+
+        self.used.add(name)
+        return name
+
+    def person(self):
+        return self.unique(lambda: f"{self.word(self.rng.randint(1, 2))} {self.word(self.rng.randint(1, 2))}{self.rng.choice(surname_endings)}")
+
+    def team(self):
+        return self.unique(lambda: f"{self.word(self.rng.randint(2, 3))} {self.rng.choice(team_words)}")
+
+    def circuit(self):
+        return self.unique(lambda: f"{self.word(self.rng.randint(2, 3))} {self.rng.choice(circuit_words)}")
+
+    def sponsor(self):
+        return self.unique(lambda: f"{self.word(self.rng.randint(2, 3))} {self.rng.choice(sponsor_words)}")
+
+def rating(limits, attribute, rng):
+    # Whole numbers for 0-100 style ratings, two decimals for 0-1 style ones
+    low, high = limits[attribute]
+    if high > 1:
+        return str(rng.randint(int(low), int(high)))
+    return f"{rng.uniform(low, high):.2f}"
+
+def pick_some(values, rng, most):
+    return "|".join(rng.sample(values, rng.randint(0, min(most, len(values)))))
+
+def generate_driver_row(vocabulary, names, discipline, track_preference, team_count, rng):
+    limits = vocabulary["limits"]
+
+    # Most drivers prefer the series discipline, some race anything or come from elsewhere
+    preferred_discipline = rng.choices([discipline, "Any", rng.choice(limits["Discipline"])], weights=[0.8, 0.1, 0.1])[0]
+
+    return {
+        "Name": names.person(),
+        "Nationality": rng.choice(limits["Nationality"]),
+        "Age": rating(limits, "Age", rng),
+        "Psyche": rating(limits, "Psyche", rng),
+        "Speed": rating(limits, "Speed", rng),
+        "Skill": rating(limits, "Skill", rng),
+        "Bravery": rating(limits, "Bravery", rng),
+        "Fitness": rating(limits, "Fitness", rng),
+        "Experience": rating(limits, "Experience", rng),
+        "Morale": rating(limits, "Morale", rng),
+        "Discipline": preferred_discipline,
+        "Preference": rng.choices([track_preference, rng.choice(limits["Preference"])], weights=[0.8, 0.2])[0],
+        "Style": rng.choice(limits["Style"]),
+        "Traits": pick_some(vocabulary["traits"], rng, 6),
+        "Fame": rating(limits, "Fame", rng),
+        "Reputation": rating(limits, "Reputation", rng),
+        "Funding": "",
+        "Personal Sponsors": "",
+        "Contract": "",
+        "Target": str(rng.randint(1, max(1, team_count))),
+        "Relations": rng.choice(limits["Relations"])
+    }
+
+def generate_team(vocabulary, names, sponsors, rng):
+    limits = vocabulary["limits"]
+    color = "|".join(rng.sample(vocabulary["colors"], rng.randint(1, 2)))
+
+    # A few teams run under a title sponsor, which brings its own branding colors
+    primary_sponsor = ""
+    commitment = ""
+    branded = [sponsor for sponsor in sponsors if sponsor["Branding"]]
+    if branded and rng.random() < 0.2:
+        primary_sponsor = rng.choice(branded)["Name"]
+        commitment = f"Title|{rng.randint(1, 5)}|Season"
+
+    # A few chartered teams (always on the grid) and a few part-time or special entries
+    charter = "TRUE" if rng.random() < 0.1 else ""
+    status = rng.choice(team_statuses) if rng.random() < 0.15 else ""
+
+    return {
+        "Team": names.team(),
+        "Charter": charter,
+        "Alliance": "",
+        "Prestige": rating(limits, "Prestige", rng),
+        "Color": color,
+        "Status": status,
+        "Primary Sponsor": primary_sponsor,
+        "Commitment": commitment,
+        "Secondary Sponsors": "|".join(sponsor["Name"] for sponsor in rng.sample(sponsors, min(len(sponsors), rng.randint(0, 3)))),
+        "Chassis": "",
+        "Design": rng.choice(limits["Design"]),
+        "Performance": rating(limits, "Performance", rng),
+        "Aero": rating(limits, "Aero", rng),
+        "Gearbox": rating(limits, "Gearbox", rng),
+        "Suspension": rating(limits, "Suspension", rng),
+        "Brakes": rating(limits, "Brakes", rng),
+        "Reliability": rating(limits, "Reliability", rng),
+        "Characteristics": pick_some(vocabulary["chassis_characteristics"], rng, 2),
+        "Engineer": rng.choice(limits["Crew"]),
+        "Supplier": f"{names.word(2)} Engines",
+        "Engine": "",
+        "Power": rating(limits, "Power", rng),
+        "Engine Reliability": rating(limits, "Engine Reliability", rng),
+        "Tires": "",
+        "Pit Crew": rng.choice(limits["Crew"]),
+        "Strategist": rng.choice(limits["Crew"])
+    }
+
+def generate_sponsors(vocabulary, names, count, rng):
+    return [{
+        "Name": names.sponsor(),
+        "Nationality": rng.choice(vocabulary["limits"]["Nationality"]),
+        "Type": rng.choice(sponsor_types),
+        "Parent": "",
+        "Budget": "",
+        "Branding": rng.choice(vocabulary["colors"]) if rng.random() < 0.3 else "",
+        "Interest": f"{rng.random():.2f}"
+    } for _ in range(count)]
+
+def generate_entries(vocabulary, names, discipline, track_preference, car_count, sponsors, rng):
+    # Constructors field one to three cars, every car is its own numbered team as in the shipped rosters
+    entries = []
+    constructors = []
+    while len(entries) < car_count:
+        team = generate_team(vocabulary, names, sponsors, rng)
+        constructors.append(team)
+        for _ in range(min(rng.choice([1, 2, 2, 2, 3]), car_count - len(entries))):
+            row = generate_driver_row(vocabulary, names, discipline, track_preference, car_count // 2, rng)
+            row.update(team)
+            row["Team"] = f"#{len(entries) + 1} - {team['Team']}"
+            entries.append(row)
+
+    return entries, constructors
+
+def generate_schedule(vocabulary, names, circuit_types, round_count, car_count, entries, rng):
+    limits = vocabulary["limits"]
+    order_width = max(2, len(str(round_count)))
+    schedule = []
+
+    for i in range(round_count):
+        circuit_type = rng.choice(circuit_types)
+        (low_laps, high_laps), (low_time, high_time) = circuit_lengths[circuit_type]
+        base_time = rng.randint(low_time, high_time)
+        record_holder = rng.choice(entries)
+        record_time = base_time * rng.uniform(0.9, 0.98)
+
+        # Weather weights for Clear, Rainy, Overcast, Hot and Stormy, mostly dry
+        weather = [rng.choice([1, 1, 2, 3]), rng.choice([0, 0, 1]), rng.choice([0, 1]), rng.choice([0, 0, 1]), rng.choice([0, 0, 0, 1])]
+
+        schedule.append({
+            "Order": f"{i + 1:0{order_width}d}",
+            "Circuit": names.circuit(),
+            "Country": rng.choice(limits["Nationality"]),
+            "Event": "Feature",
+            "Type": circuit_type,
+            "Difficulty": f"{rng.uniform(*limits['Difficulty']):.1f}",
+            "Speed": rng.choice(["Low", "Medium", "High"]),
+            "Clear": weather[0],
+            "Rainy": weather[1],
+            "Overcast": weather[2],
+            "Hot": weather[3],
+            "Stormy": weather[4],
+            "Characteristics": pick_some(vocabulary["track_characteristics"], rng, 2),
+            "Laps": rng.randint(low_laps, high_laps),
+            "Base Time": base_time,
+            "Lap Record": f"{int(record_time // 60)}:{record_time % 60:05.2f} - {rng.randint(1990, 2009)} - {record_holder['Name']} ({record_holder['Team'].split(' - ', 1)[1]})",
+            # Some rounds have fewer grid slots than entries, so qualifying has to send cars home
+            "Grid Size": car_count if rng.random() < 0.75 else max(1, car_count - rng.randint(1, max(1, car_count // 10)))
+        })
+
+    return schedule
+
+def generate_series(vocabulary, names, index, car_count, round_count, rng):
+    limits = vocabulary["limits"]
+    disciplines = [discipline for discipline in limits["Discipline"] if discipline != "Any"]
+    discipline = disciplines[index % len(disciplines)]
+
+    # Stock cars mostly race on ovals, everything else mostly on road circuits
+    if discipline == "StockCar":
+        circuit_types = oval_circuit_types * 3 + road_circuit_types
+        track_preference = "Oval"
+    else:
+        circuit_types = road_circuit_types * 3 + oval_circuit_types
+        track_preference = "Road"
+
+    series_name = f"Synthetic {discipline} Series {index + 1:02d}"
+    sponsors = generate_sponsors(vocabulary, names, max(10, car_count), rng)
+    entries, constructors = generate_entries(vocabulary, names, discipline, track_preference, car_count, sponsors, rng)
+
+    rules = {
+        "Series": series_name,
+        "Discipline": discipline,
+        "Region": rng.choice(["International", "North America", "Europe", "Asia"]),
+        "Tier": rng.choice(["Primary|Premier", "Secondary|Developmental", "Tertiary|Invitational"]),
+        "Teams": "Teams",
+        "Chassis": rng.choice(["Full", "Partial", "Spec"]),
+        "Engine": rng.choice(["Full", "Partial", "Spec"]),
+        "Practice Sessions": rng.randint(0, 3),
+        "Charter": rng.choice(["Static", "Dynamic", "None"]),
+        "Charter Slots": car_count,
+        "Retirement Threshold": rng.randint(60, 90)
+    }
+
+    # Drivers looking for a seat, and one reserve per constructor
+    free_agents = []
+    for _ in range(max(2, car_count // 10)):
+        row = generate_driver_row(vocabulary, names, discipline, track_preference, len(constructors), rng)
+        free_agents.append({field: row.get(field, "") for field in free_agent_fields} | {
+            "Activity": rng.randint(2000, 2009), "Interest": f"{rng.random():.2f}"})
+
+    reserve_drivers = []
+    for team in constructors:
+        row = generate_driver_row(vocabulary, names, discipline, track_preference, len(constructors), rng)
+        reserve_drivers.append({field: row.get(field, "") for field in reserve_driver_fields} | {
+            "Team": team["Team"], "Patience": f"{rng.random():.2f}"})
+
+    return {
+        "series_name": series_name,
+        "rules": rules,
+        "entries": entries,
+        "schedule": generate_schedule(vocabulary, names, circuit_types, round_count, car_count, entries, rng),
+        "sponsors": sponsors,
+        "free_agents": free_agents,
+        "reserve_drivers": reserve_drivers
+    }
+
+def write_csv(path, fields, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def write_world(script_directory, world_directory, series_list):
+    for subdirectory in [os.path.join("Data"), os.path.join("Schedules", "Races"), os.path.join("Championships", "Logs"),
+                         os.path.join("Championships", "Rules", "Tire Compounds"), os.path.join("World", "Sponsors"),
+                         os.path.join("World", "Free Agents"), os.path.join("World", "Reserve Drivers")]:
+        os.makedirs(os.path.join(world_directory, subdirectory), exist_ok=True)
+
+    # The data lists and colors the loaders read, copied so the world stands on its own
+    for data_file in data_files:
+        source_path = os.path.join(script_directory, "Data", data_file)
+        if os.path.exists(source_path):
+            shutil.copyfile(source_path, os.path.join(world_directory, "Data", data_file))
+
+    write_csv(os.path.join(world_directory, "Championships", "Rules", "Championship Rules.csv"), rules_fields, [series["rules"] for series in series_list])
+
+    for series in series_list:
+        series_name = series["series_name"]
+        write_csv(os.path.join(world_directory, f"{series_name}.csv"), entry_fields, series["entries"])
+        write_csv(os.path.join(world_directory, "Schedules", f"Schedule - {series_name}.csv"), schedule_fields, series["schedule"])
+        write_csv(os.path.join(world_directory, "Championships", "Rules", "Tire Compounds", f"Tire Compounds - {series_name}.csv"), tire_fields,
+                  [dict(zip(tire_fields, compound)) for compound in tire_compounds])
+        write_csv(os.path.join(world_directory, "World", "Sponsors", f"Sponsors - {series_name}.csv"), sponsor_fields, series["sponsors"])
+        write_csv(os.path.join(world_directory, "World", "Free Agents", f"Free Agents - {series_name}.csv"), free_agent_fields, series["free_agents"])
+        write_csv(os.path.join(world_directory, "World", "Reserve Drivers", f"Reserve Drivers - {series_name}.csv"), reserve_driver_fields, series["reserve_drivers"])
+
+def generate_world(script_directory, world_directory, series_count, car_count, round_count, seed=1):
+    rng = random.Random(seed)
+    vocabulary = read_vocabulary(script_directory)
+    names = NameSource(rng)
+
+    series_list = [generate_series(vocabulary, names, i, car_count, round_count, rng) for i in range(series_count)]
+    write_world(script_directory, world_directory, series_list)
+
+    return [series["series_name"] for series in series_list]
+
+def check_world(script_directory, world_directory, series_names, engine_script, engine="scalar", seed=1):
+    # Loads every generated series and runs one round through the race engine, without presentation. That is the
+    # first round with a short grid if there is one, so qualifying has to keep the chartered teams in.
+    module_path = os.path.join(script_directory, f"{engine_script}.py")
+    spec = importlib.util.spec_from_file_location("race", module_path)
+    race_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(race_module)
+
+    rng = random.Random(seed)
+    for series_name in series_names:
+        start = time.perf_counter()
+        series = race_module.load_series(world_directory, series_name, rng)
+        load_time = time.perf_counter() - start
+
+        schedule = series["sorted_schedule"]
+        race = next((race for race in schedule if int(race["Grid Size"]) < len(series["drivers"])), schedule[0])
+
+        start = time.perf_counter()
+        race_module.run_race(world_directory, series, race, series["teams"], rng, present=False, engine=engine)
+        race_time = time.perf_counter() - start
+
+        print(f"{series_name:<36} | {len(series['drivers']):>4} cars | {len(schedule):>4} rounds | round {race['Order']} grid {race['Grid Size']:>4} | load {load_time:>7.3f}s | race {race_time:>7.3f}s")
+
+def main(world_directory, series_count, car_count, round_count, seed=1, check=False, engine_script="Formula One World Championship", engine="scalar"):
+    script_directory = os.path.dirname(os.path.abspath(__file__))
+
+    start = time.perf_counter()
+    series_names = generate_world(script_directory, world_directory, series_count, car_count, round_count, seed)
+    print(f"Generated {len(series_names)} series with {car_count} cars and {round_count} rounds in {time.perf_counter() - start:.2f}s: {world_directory}")
+
+    if check:
+        check_world(script_directory, world_directory, series_names, engine_script, engine, seed)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic world of entry lists, schedules, rules and sponsors for stress testing.")
+    parser.add_argument("directory", help="directory to write the world to, laid out like this one")
+    parser.add_argument("--series", type=int, default=1, help="number of series (default: 1)")
+    parser.add_argument("--cars", type=int, default=26, help="entries per series (default: 26)")
+    parser.add_argument("--rounds", type=int, default=17, help="rounds per series (default: 17)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for everything generated")
+    parser.add_argument("--check", action="store_true", help="load every series and run its first round once written")
+    parser.add_argument("--engine-script", default="Formula One World Championship", help="series script in this directory whose engine --check runs")
+    parser.add_argument("--engine", default="scalar", choices=["scalar", "numpy", "laps"], help="race engine for --check (default: scalar)")
+    args = parser.parse_args()
+
+    main(args.directory, args.series, args.cars, args.rounds, args.seed, args.check, args.engine_script, args.engine)